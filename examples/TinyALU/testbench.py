@@ -167,11 +167,8 @@ class Coverage(uvm_subscriber):
         self.cvg.add(op)
 
     def report_phase(self):
-        try:
-            disable_errors = ConfigDB().get(
-                self, "", "DISABLE_COVERAGE_ERRORS")
-        except UVMConfigItemNotFound:
-            disable_errors = False
+        disable_errors = ConfigDB().get_or(
+            self, "", "DISABLE_COVERAGE_ERRORS", False)
         if not disable_errors:
             if len(set(Ops) - self.cvg) > 0:
                 self.logger.error(
@@ -198,10 +195,7 @@ class Scoreboard(uvm_component):
 
     def check_phase(self):
         passed = True
-        try:
-            self.errors = ConfigDB().get(self, "", "CREATE_ERRORS")
-        except UVMConfigItemNotFound:
-            self.errors = False
+        self.errors = ConfigDB().get_or(self, "", "CREATE_ERRORS", False)
         while self.result_get_port.can_get():
             _, actual_result = self.result_get_port.try_get()
             cmd_success, cmd = self.cmd_get_port.try_get()
@@ -1,9 +1,17 @@
+import ast
 import functools
-import inspect
+import glob
+import importlib
+import importlib.util
+import json
+import os
+import re
+import sys
 
 import cocotb
 
 from pyuvm import uvm_root
+from pyuvm.error_classes import UVMError
 
 
 def test(
@@ -40,12 +48,235 @@ def test(
         async def test(_):
             await uvm_root().run_test(cls)
 
-        # adds cocotb.test object to caller's module
-        caller_frame = inspect.stack()[1]
-        caller_module = inspect.getmodule(caller_frame[0])
+        # adds cocotb.test object to the module that defines the class.
+        # cls.__module__ names it without walking the stack.
+        caller_module = sys.modules[cls.__module__]
         setattr(caller_module, f"test_{test._id}", test)
 
         # returns decorator class unmodified
         return cls
 
     return decorator
+
+
+class UVMTestIndex:
+    """
+    Maps the names of classes decorated with @pyuvm.test to the
+    files that define them without importing those files. Give
+    the index to the factory and run_test() imports only the
+    module holding the test it was asked to run:
+
+        uvm_factory().test_index = UVMTestIndex("tests")
+        await uvm_root().run_test("MyTest")
+
+    Files are parsed only when their modification time changes.
+    If cache_file is given the index is kept there between runs.
+    """
+
+    # What a test decorator must resolve to through the imports
+    test_decorators = {"pyuvm.test", "pyuvm.extension_classes.test",
+                       "cocotb.test"}
+
+    def __init__(self, paths, cache_file=None):
+        """
+        :param paths: A directory or .py file, or a list of them
+        :param cache_file: Optional JSON file that holds the index
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        self.paths = list(paths)
+        self.cache_file = cache_file
+        # file path -> [mtime, [test class names]]
+        self._files = {}
+        if cache_file is not None and os.path.exists(cache_file):
+            with open(cache_file) as cache:
+                self._files = json.load(cache)
+        self._index = None
+
+    @staticmethod
+    def _imported_names(tree):
+        """
+        :return: dict of the names a module's imports bind to the
+            dotted names they import
+        """
+        names = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname is None:
+                        top = alias.name.split(".")[0]
+                        names[top] = top
+                    else:
+                        names[alias.asname] = alias.name
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                for alias in node.names:
+                    if alias.name == "*":
+                        # Only test matters, and only if it resolves
+                        names["test"] = f"{node.module}.test"
+                    else:
+                        names[alias.asname or alias.name] = \
+                            f"{node.module}.{alias.name}"
+        return names
+
+    @classmethod
+    def _is_test_decorator(cls, decorator, imported):
+        """
+        :param decorator: A decorator node
+        :param imported: The module's _imported_names()
+        :return: True if decorator is pyuvm.test or cocotb.test
+        """
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        attrs = []
+        while isinstance(decorator, ast.Attribute):
+            attrs.append(decorator.attr)
+            decorator = decorator.value
+        if not isinstance(decorator, ast.Name) \
+                or decorator.id not in imported:
+            return False
+        dotted = ".".join([imported[decorator.id], *reversed(attrs)])
+        return dotted in cls.test_decorators
+
+    @classmethod
+    def _scan_file(cls, file_name):
+        """
+        :return: list of @pyuvm.test class names in file_name
+        """
+        with open(file_name, encoding="utf-8") as py_file:
+            source = py_file.read()
+        # Most files have no decorated classes. Skip parsing them.
+        if "test" not in source or "@" not in source:
+            return []
+        tree = ast.parse(source, file_name)
+        imported = cls._imported_names(tree)
+        classes = [node for node in ast.walk(tree)
+                   if isinstance(node, ast.ClassDef)]
+        return [node.name for node in classes
+                if any(cls._is_test_decorator(decorator, imported)
+                       for decorator in node.decorator_list)]
+
+    def _py_files(self):
+        for path in self.paths:
+            if os.path.isdir(path):
+                yield from sorted(glob.glob(os.path.join(path, "*.py")))
+            else:
+                yield path
+
+    def refresh(self):
+        """
+        Rescan the files that changed since the last scan and
+        rebuild the index.
+        """
+        files = {}
+        changed = False
+        for file_name in self._py_files():
+            file_name = os.path.abspath(file_name)
+            mtime = os.path.getmtime(file_name)
+            cached = self._files.get(file_name)
+            if cached is None or cached[0] != mtime:
+                cached = [mtime, self._scan_file(file_name)]
+                changed = True
+            files[file_name] = cached
+        changed = changed or files.keys() != self._files.keys()
+        self._files = files
+        self._index = {}
+        for file_name, (_, test_names) in files.items():
+            for test_name in test_names:
+                self._index.setdefault(test_name, file_name)
+        if changed and self.cache_file is not None:
+            with open(self.cache_file, "w") as cache:
+                json.dump(self._files, cache)
+
+    @property
+    def index(self):
+        """
+        :return: dict of test class name to defining file
+        """
+        if self._index is None:
+            self.refresh()
+        return self._index
+
+    def find(self, test_name):
+        """
+        :param test_name: The name of a test class
+        :return: The file that defines it or None
+        """
+        return self.index.get(test_name)
+
+    @staticmethod
+    def _module_name(file_name):
+        """
+        :return: The dotted name that imports file_name from a
+            sys.path entry, or None if no entry reaches it through
+            packages
+        """
+        base = os.path.splitext(file_name)[0]
+        for root in sys.path:
+            root = os.path.abspath(root or os.curdir)
+            if os.path.commonpath([root, base]) != root:
+                continue
+            parts = os.path.relpath(base, root).split(os.sep)
+            if not all(part.isidentifier() for part in parts):
+                continue
+            package_dirs = [os.path.join(root, *parts[:ii])
+                            for ii in range(1, len(parts))]
+            if all(os.path.isfile(os.path.join(package_dir, "__init__.py"))
+                   for package_dir in package_dirs):
+                return ".".join(parts)
+        return None
+
+    @classmethod
+    def _import_file(cls, file_name):
+        """
+        Import file_name under its package name if sys.path reaches
+        it, or else under a name made from its path, so that another
+        module with the same base name cannot stand in for it.
+
+        :return: The module
+        """
+        module_name = cls._module_name(file_name)
+        if module_name is not None:
+            try:
+                module = importlib.import_module(module_name)
+            except ModuleNotFoundError as error:
+                # A package on an earlier sys.path entry has the name
+                if error.name is None \
+                        or not module_name.startswith(error.name):
+                    raise
+            else:
+                module_file = getattr(module, "__file__", None)
+                if module_file is not None and os.path.realpath(
+                        module_file) == os.path.realpath(file_name):
+                    return module
+        module_name = "_uvm_test_index_" + re.sub(r"\W", "_", file_name)
+        module = sys.modules.get(module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name,
+                                                          file_name)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+        return module
+
+    def import_test(self, test_name):
+        """
+        Import the module that defines test_name.
+
+        :param test_name: The name of a test class
+        :return: The test class or None if the index does not have it
+        :raises UVMError: if the indexed file no longer defines it
+        """
+        file_name = self.find(test_name)
+        if file_name is None:
+            return None
+        module = self._import_file(file_name)
+        test_cls = getattr(module, test_name, None)
+        if test_cls is None:
+            raise UVMError(
+                f"{file_name} does not define {test_name}. "
+                "Call refresh() if the file changed.")
+        return test_cls
@@ -1,7 +1,11 @@
 """
 This file defines the UVM base classes
 """
+import copy
+import struct
 import sys
+from array import array
+from enum import Enum
 
 try:
     import pyuvm.error_classes as error_classes
@@ -13,15 +17,385 @@ except ModuleNotFoundError as mnf:
     sys.exit(1)
 
 
+class uvm_field:
+    """
+    Declares a data member of a uvm_object in the spirit of the
+    SystemVerilog uvm_field_* macros:
+
+        class alu_item(uvm_sequence_item):
+            A = uvm_field(0)
+            B = uvm_field(0)
+            data = uvm_field(default_factory=list, deep=True)
+
+    When the class is created pyuvm generates do_copy(),
+    do_compare(), clone(), __eq__(), __hash__() and
+    convert2string() for the declared fields. Methods the class
+    writes itself are never replaced. uvm_object.__init__() sets
+    every field to its default before the subclass __init__()
+    body runs.
+
+    Fields declared with bits also get do_pack() and do_unpack()
+    so the pack and unpack methods work. The first field is the
+    most significant, as in a SystemVerilog packed struct.
+    """
+
+    def __init__(self, default=None, *, default_factory=None,
+                 compare=True, hash=None, copy=True, deep=False,
+                 printed=True, bits=None):
+        """
+        :param default: The initial value of the field. Every object
+            shares it, so it must be hashable. Use default_factory
+            for lists, dicts, and other mutable values.
+        :param default_factory: Called to make the initial value
+        :param compare: Use the field in do_compare() and __eq__()
+        :param hash: Use the field in __hash__(). Defaults to compare
+            for fields with a default other than None that are not
+            deep. Fields made by default_factory, deep fields, and
+            fields that start as None may hold mutable values later.
+        :param copy: Copy the field in do_copy() and clone()
+        :param deep: Copy with clone() or copy.deepcopy() not assignment
+        :param printed: Show the field in convert2string()
+        :param bits: Width of the field in pack() and unpack(). A
+            field with bits and no default starts at 0.
+        """
+        if bits is not None and default is None \
+                and default_factory is None:
+            default = 0
+        if type(default).__hash__ is None:
+            raise error_classes.UVMError(
+                f"mutable default {type(default).__name__} for uvm_field "
+                "is not allowed: use default_factory")
+        if default is not None and default_factory is not None:
+            raise error_classes.UVMError(
+                "uvm_field cannot take both default and default_factory")
+        self.name = None
+        self.default = default
+        self.default_factory = default_factory
+        self.compare = compare
+        if hash is None:
+            hash = compare and default is not None and not deep
+        self.hash = hash
+        self.copy = copy
+        self.deep = deep
+        self.printed = printed
+        self.bits = bits
+
+    def __repr__(self):
+        return f"uvm_field({self.name})"
+
+
+# Machine words for pack_ints() and pack_longints()
+_int_code = "I" if array("I").itemsize == 4 else "L"
+_longint_code = "Q"
+_struct_codes = {8: "B", 16: "H", 32: "I", 64: "Q"}
+# uvm_endianness_e names to int.to_bytes() byte order. The FIFO
+# variants tell a register map to write every bus word to one
+# address. That does not change the byte order of packed data.
+_byteorders = {"UVM_NO_ENDIAN": "big", "UVM_BIG_ENDIAN": "big",
+               "UVM_BIG_FIFO": "big", "UVM_LITTLE_ENDIAN": "little",
+               "UVM_LITTLE_FIFO": "little"}
+
+
+_no_pack_fields = ("declare fields with uvm_field(bits=...) "
+                   "or use struct, pickle, json, or yaml.")
+
+
+def _byteorder(endian):
+    if endian is None:
+        return "big"
+    return _byteorders[endian.name]
+
+
+def _enum_name(value):
+    return getattr(value, "name", value)
+
+
+def _generated(func):
+    return getattr(func, "__uvm_generated__", False)
+
+
+def _partial_reset(method):
+    """
+    Marks a do_reset() that resets only what pyuvm declares.
+    The factory will not pool a class whose do_reset() is marked.
+    """
+    method.__uvm_partial_reset__ = True
+    return method
+
+
+def _user_defined(cls, method_name):
+    """
+    True if a class below uvm_object in the MRO of cls wrote
+    method_name itself.
+    """
+    for klass in cls.__mro__:
+        if method_name in klass.__dict__:
+            if klass is _uvm_object or klass is object:
+                return False
+            return not _generated(klass.__dict__[method_name])
+    return False
+
+
+def _make_method(cls, method_name, args, body, namespace):
+    src = f"def {method_name}({args}):\n"
+    src += "".join(f"    {line}\n" for line in body)
+    exec(src, namespace)
+    func = namespace[method_name]
+    func.__qualname__ = f"{cls.__qualname__}.{method_name}"
+    func.__uvm_generated__ = True
+    setattr(cls, method_name, func)
+    return func
+
+
+def _chain(cls, method_name, own_fields):
+    """
+    Returns the fields a generated method must handle and the
+    inherited method it must call first. Generated ancestors are
+    folded in so the chain costs one call, not one per class.
+    """
+    base = getattr(super(cls, cls), method_name)
+    if _generated(base):
+        return base.__uvm_fields__ + own_fields, base.__uvm_base__
+    return own_fields, base
+
+
+def _generate_field_methods(cls, own_fields):
+    fields = cls._uvm_fields
+    ns = {"_cls": cls, "_deepcopy": copy.deepcopy,
+          "_enum_name": _enum_name, "uvm_object": _uvm_object}
+    for ff in fields:
+        ns[f"_d_{ff.name}"] = ff.default
+        ns[f"_f_{ff.name}"] = ff.default_factory
+
+    # Every object gets its field defaults from uvm_object.__init__
+    body = [f"self.{ff.name} = _f_{ff.name}()"
+            if ff.default_factory is not None
+            else f"self.{ff.name} = _d_{ff.name}" for ff in fields]
+    _make_method(cls, "_init_fields", "self", body, ns)
+
+    if "do_copy" not in cls.__dict__:
+        copied, base = _chain(cls, "do_copy",
+                              tuple(ff for ff in own_fields if ff.copy))
+        if base is None or base is _uvm_object.do_copy:
+            base = None
+            body = ["self._obj_name = rhs._obj_name"]
+        else:
+            body = ["_base_do_copy(self, rhs)"]
+            ns["_base_do_copy"] = base
+        for ff in copied:
+            if ff.deep:
+                body += [f"val = rhs.{ff.name}",
+                         f"self.{ff.name} = val.clone() "
+                         "if isinstance(val, uvm_object) "
+                         "else _deepcopy(val)"]
+            else:
+                body.append(f"self.{ff.name} = rhs.{ff.name}")
+        func = _make_method(cls, "do_copy", "self, rhs", body, ns)
+        func.__uvm_fields__ = copied
+        func.__uvm_base__ = base
+
+    eq_user_defined = _user_defined(cls, "__eq__")
+    if "do_compare" not in cls.__dict__:
+        compared, base = _chain(cls, "do_compare",
+                                tuple(ff for ff in own_fields if ff.compare))
+        body = ["if not isinstance(rhs, _cls):",
+                "    return False"]
+        # uvm_object.do_compare() calls __eq__() which is
+        # only worth calling if the user wrote it.
+        if base is _uvm_object.do_compare and not eq_user_defined:
+            base = None
+        if base is not None:
+            ns["_base_do_compare"] = base
+            body += ["if not _base_do_compare(self, rhs):",
+                     "    return False"]
+        terms = [f"self.{ff.name} == rhs.{ff.name}" for ff in compared]
+        body.append(f"return {' and '.join(terms) or 'True'}")
+        func = _make_method(cls, "do_compare", "self, rhs", body, ns)
+        func.__uvm_fields__ = compared
+        func.__uvm_base__ = base
+
+    compared = [ff for ff in fields if ff.compare]
+    if not eq_user_defined and "__eq__" not in cls.__dict__:
+        terms = [f"self.{ff.name} == other.{ff.name}" for ff in compared]
+        body = ["if other.__class__ is not self.__class__:",
+                "    return NotImplemented",
+                f"return {' and '.join(terms) or 'True'}"]
+        _make_method(cls, "__eq__", "self, other", body, ns)
+        if "__hash__" not in cls.__dict__:
+            terms = "".join(f"self.{ff.name}, " for ff in fields
+                            if ff.hash)
+            body = [f"return hash(({terms}))"]
+            _make_method(cls, "__hash__", "self", body, ns)
+
+    # A clone copies straight into the new object when every
+    # do_copy() in the chain was generated.
+    if not _user_defined(cls, "clone"):
+        do_copy = cls.do_copy
+        if _generated(do_copy) and do_copy.__uvm_base__ is None:
+            body = ["new = self.__class__(self._obj_name)"]
+            for ff in do_copy.__uvm_fields__:
+                if ff.deep:
+                    body += [f"val = self.{ff.name}",
+                             f"new.{ff.name} = val.clone() "
+                             "if isinstance(val, uvm_object) "
+                             "else _deepcopy(val)"]
+                else:
+                    body.append(f"new.{ff.name} = self.{ff.name}")
+        else:
+            body = ["new = self.__class__(self._obj_name)",
+                    "new.do_copy(self)"]
+        body.append("return new")
+        _make_method(cls, "clone", "self", body, ns)
+
+    if any(ff.bits is not None for ff in fields) \
+            and not _user_defined(cls, "do_pack"):
+        _generate_pack_methods(cls, ns)
+
+    if not _user_defined(cls, "convert2string") \
+            and not _user_defined(cls, "__str__"):
+        # Fields that default to an enum member print its name
+        terms = "".join(f" {ff.name}: {{_enum_name(self.{ff.name})}}"
+                        if isinstance(ff.default, Enum)
+                        else f" {ff.name}: {{self.{ff.name}}}"
+                        for ff in fields if ff.printed)
+        body = [f'return f"{{self._obj_name}} :{terms}"']
+        func = _make_method(cls, "convert2string", "self", body, ns)
+        cls.__str__ = func
+
+
+def _generate_pack_methods(cls, ns):
+    fields = [ff for ff in cls._uvm_fields if ff.bits is not None]
+    total = sum(ff.bits for ff in fields)
+    nbytes = (total + 7) // 8
+    cls._pack_bits = total
+    shifts = []
+    shift = total
+    for ff in fields:
+        shift -= ff.bits
+        shifts.append((ff.name, shift, (1 << ff.bits) - 1))
+
+    terms = [f"(self.{name} & {mask:#x}) << {sh}" if sh
+             else f"self.{name} & {mask:#x}" for name, sh, mask in shifts]
+    body = [f"return {' | '.join(terms)}"]
+    _make_method(cls, "do_pack", "self", body, ns)
+    body = [f"self.{name} = value >> {sh} & {mask:#x}" if sh
+            else f"self.{name} = value & {mask:#x}"
+            for name, sh, mask in shifts]
+    _make_method(cls, "do_unpack", "self, value", body, ns)
+
+    # Fields of 8, 16, 32 or 64 bits go through struct, which is
+    # faster than building one large int and converting it.
+    packers = {}
+    unpackers = {}
+    # Both unpack paths take exactly the bytes pack_bytes() makes
+    ns["_UVMError"] = error_classes.UVMError
+    length_check = [f"if len(data) != {nbytes}:",
+                    f"    raise _UVMError(f'{cls.__name__} unpacks "
+                    f"{nbytes} bytes, not {{len(data)}}')"]
+    use_struct = all(ff.bits in _struct_codes for ff in fields)
+    for order, prefix in (("big", ">"), ("little", "<")):
+        if use_struct:
+            # A little endian int puts the last field first
+            ordered = shifts if order == "big" else shifts[::-1]
+            codes = "".join(_struct_codes[(mask + 1).bit_length() - 1]
+                            for _, _, mask in ordered)
+            ns[f"_s_{order}"] = struct.Struct(prefix + codes)
+            args = "".join(f"self.{name} & {mask:#x}, "
+                           for name, _, mask in ordered)
+            pack_body = [f"return _s_{order}.pack({args})"]
+            names = "".join(f"self.{name}, " for name, _, _ in ordered)
+            unpack_body = [f"{names} = _s_{order}.unpack(data)"]
+        else:
+            pack_body = [f"return self.do_pack().to_bytes({nbytes}, "
+                         f"'{order}')"]
+            unpack_body = ["self.do_unpack(int.from_bytes(data, "
+                           f"'{order}'))"]
+        packers[order] = _make_method(cls, f"_pack_bytes_{order}",
+                                      "self", pack_body, ns)
+        unpackers[order] = _make_method(cls, f"_unpack_bytes_{order}",
+                                        "self, data",
+                                        length_check + unpack_body, ns)
+    # s17 imports this module so it cannot be imported at the top
+    from pyuvm.s17_register_enumerations import uvm_endianness_e
+    # Keyed by endian so pack_bytes() costs one dict lookup
+    cls._bytes_packers = {endian: packers[_byteorder(endian)]
+                          for endian in [None, *uvm_endianness_e]}
+    cls._bytes_unpackers = {endian: unpackers[_byteorder(endian)]
+                            for endian in [None, *uvm_endianness_e]}
+
+
+class CompactMeta(utility_classes.FactoryMeta):
+    """
+    Metaclass of the compact classes. Their instances have no
+    __dict__, so the uvm_field declarations of each subclass
+    become its __slots__.
+    """
+
+    def __new__(mcs, name, bases, cls_dict):
+        declared = {key: value for key, value in cls_dict.items()
+                    if isinstance(value, uvm_field)}
+        cls_dict = {key: value for key, value in cls_dict.items()
+                    if key not in declared}
+        slots = cls_dict.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        cls_dict["__slots__"] = tuple(slots) + tuple(declared)
+        cls_dict["_uvm_declared"] = declared
+        return super().__new__(mcs, name, bases, cls_dict)
+
+
 # 5.3.1
-class uvm_object(utility_classes.uvm_void):
-    """ The most basic UVM object """
+class _uvm_object(utility_classes.uvm_void):
+    """
+    The methods of uvm_object. uvm_object and uvm_compact_object
+    both derive from this so that the compact classes have no
+    __dict__.
+    """
+
+    # Subclasses that do not declare __slots__ get a __dict__ as
+    # usual. The compact classes declare them all the way down.
+    __slots__ = ("_obj_name",)
+
+    # The uvm_field declarations of this class and its bases
+    _uvm_fields = ()
+    # Byte and word order of pack_bytes() and pack_ints(), a
+    # uvm_endianness_e. None packs big endian.
+    pack_endian = None
+    # Generated pack_bytes() and unpack_bytes() functions by endian
+    _bytes_packers = {}
+    _bytes_unpackers = {}
+    _pack_bits = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        own_fields = []
+        # CompactMeta has already turned the declarations into slots
+        declared = cls.__dict__.get("_uvm_declared")
+        if declared is None:
+            declared = {name: value for name, value in cls.__dict__.items()
+                        if isinstance(value, uvm_field)}
+            for name in declared:
+                # the instance attribute set in _init_fields()
+                # replaces the declaration
+                delattr(cls, name)
+        for name, value in declared.items():
+            value.name = name
+            own_fields.append(value)
+        if not own_fields and not cls._uvm_fields:
+            return
+        own_names = {ff.name for ff in own_fields}
+        inherited = tuple(ff for ff in cls._uvm_fields
+                          if ff.name not in own_names)
+        cls._uvm_fields = inherited + tuple(own_fields)
+        _generate_field_methods(cls, tuple(own_fields))
 
     # 5.3.2
     def __init__(self, name=''):
         assert (isinstance(name, str)), \
             f"{name} is not a string it is a {type(name)}"
         self.set_name(name)
+        if self._uvm_fields:
+            self._init_fields()
 
     # 5.3.3.1
     def get_uvm_seeding(self):
@@ -101,13 +475,40 @@ class uvm_object(utility_classes.uvm_void):
 
     # 5.3.5.1
     @classmethod
-    def create(cls, name):
+    def create(cls, name, pooled=False):
         """
+        :param pooled: reuse an object returned with release()
         :return: new object from factory
         """
+        if pooled:
+            return uvm_factory().create_pooled_object_by_type(cls, name=name)
         new_obj = uvm_factory().create_object_by_type(cls, name=name)
         return new_obj
 
+    def release(self):
+        """
+        Reset this object and return it to the factory pool
+        for create(name, pooled=True). Do not use it afterwards.
+
+        The factory calls do_reset() rather than __init__(), so
+        only classes that override do_reset() to reset all their
+        data members can be pooled. Pooling pays when __init__()
+        does work that do_reset() can skip, such as creating
+        nested objects.
+        """
+        uvm_factory().release_object(self)
+
+    @_partial_reset
+    def do_reset(self):
+        """
+        Return the object to its initial state before it is
+        pooled. Resets the uvm_field() data members to their
+        defaults. Override to reset the other data members and
+        call super().do_reset().
+        """
+        if self._uvm_fields:
+            self._init_fields()
+
     # 5.3.5.2
     def clone(self):
         """
@@ -196,50 +597,113 @@ class uvm_object(utility_classes.uvm_void):
     # 5.3.10.1
     def pack(self):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        Pack the fields declared with uvm_field(bits=...)
+
+        :return: int holding the fields. The first field is the
+            most significant.
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        return self.do_pack()
 
     # 5.3.10.1
-    def pack_bytes(self):
+    def pack_bytes(self, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param endian: uvm_endianness_e. Defaults to pack_endian
+        :return: bytes holding the packed fields
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        if endian is None:
+            endian = self.pack_endian
+        try:
+            pack_fn = self._bytes_packers[endian]
+        except KeyError:
+            raise error_classes.UsePythonMethod(_no_pack_fields)
+        return pack_fn(self)
 
     # 5.3.10.1
-    def pack_ints(self):
+    def pack_ints(self, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param endian: Big endian puts the most significant word first
+        :return: array of 32-bit words holding the packed fields
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        return self.__pack_words(_int_code, 4, endian)
 
     # 5.3.10.1
-    def pack_longints(self):
+    def pack_longints(self, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param endian: Big endian puts the most significant word first
+        :return: array of 64-bit words holding the packed fields
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        return self.__pack_words(_longint_code, 8, endian)
+
+    def __pack_words(self, code, size, endian):
+        nwords = (self._pack_bits + size * 8 - 1) // (size * 8)
+        words = array(code)
+        words.frombytes(self.do_pack().to_bytes(nwords * size,
+                                                sys.byteorder))
+        if endian is None:
+            endian = self.pack_endian
+        if _byteorder(endian) != sys.byteorder:
+            words.reverse()
+        return words
+
+    @classmethod
+    def _byte_packer(cls, endian, packers):
+        if endian is None:
+            endian = cls.pack_endian
+        try:
+            return packers[endian]
+        except KeyError:
+            raise error_classes.UsePythonMethod(_no_pack_fields)
 
     # 5.3.10.2
     def do_pack(self):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        Generated for fields declared with uvm_field(bits=...).
+        Override to pack other data.
+
+        :return: int holding the packed data
+        """
+        raise error_classes.UsePythonMethod(_no_pack_fields)
+
+    @classmethod
+    def pack_bytes_many(cls, items, endian=None):
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        Pack a list of objects into one buffer
+
+        :param items: objects of this class
+        :param endian: uvm_endianness_e. Defaults to pack_endian
+        :return: bytes holding each object's pack_bytes()
+        """
+        pack_fn = cls._byte_packer(endian, cls._bytes_packers)
+        return b"".join(map(pack_fn, items))
+
+    @classmethod
+    def unpack_bytes_many(cls, data, name="", endian=None):
+        """
+        Make new objects from a buffer made by pack_bytes_many()
+
+        :param data: bytes-like object
+        :param name: name of each new object
+        :param endian: uvm_endianness_e. Defaults to pack_endian
+        :return: list of new objects
+        """
+        unpack_fn = cls._byte_packer(endian, cls._bytes_unpackers)
+        nbytes = (cls._pack_bits + 7) // 8
+        view = memoryview(data)
+        items = []
+        for offset in range(0, len(view), nbytes):
+            new = cls(name)
+            unpack_fn(new, view[offset:offset + nbytes])
+            items.append(new)
+        return items
 
     # 5.3.11.1
-    def unpack(self):
+    def unpack(self, value):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        Set the fields declared with uvm_field(bits=...)
+
+        :param value: int made by pack()
         """
-        raise error_classes.UsePythonMethod(
-            "use pickle, json, or yaml.")
+        self.do_unpack(value)
 
     # 5.3.14.1
     def push_active_policy(self):
@@ -264,36 +728,51 @@ class uvm_object(utility_classes.uvm_void):
         raise error_classes.UVMNotImplemented("policies not implemented yet")
 
     # 5.3.11.1
-    def unpack_bytes(self):
+    def unpack_bytes(self, data, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param data: bytes-like object made by pack_bytes()
+        :param endian: uvm_endianness_e. Defaults to pack_endian
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        if endian is None:
+            endian = self.pack_endian
+        try:
+            unpack_fn = self._bytes_unpackers[endian]
+        except KeyError:
+            raise error_classes.UsePythonMethod(_no_pack_fields)
+        unpack_fn(self, data)
 
     # 5.3.11.1
-    def unpack_ints(self):
+    def unpack_ints(self, words, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param words: array of 32-bit words made by pack_ints()
+        :param endian: Big endian puts the most significant word first
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        self.__unpack_words(words, endian)
 
     # 5.3.11.1
-    def unpack_longints(self):
+    def unpack_longints(self, words, endian=None):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        :param words: array of 64-bit words made by pack_longints()
+        :param endian: Big endian puts the most significant word first
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        self.__unpack_words(words, endian)
+
+    def __unpack_words(self, words, endian):
+        if endian is None:
+            endian = self.pack_endian
+        if _byteorder(endian) != sys.byteorder:
+            words = words[::-1]
+        self.do_unpack(int.from_bytes(words.tobytes(), sys.byteorder))
 
     # 5.3.11.2
-    def do_unpack(self):
+    def do_unpack(self, value):
         """
-        Not implemented yet. There are Pythonic solutions to this.
+        Generated for fields declared with uvm_field(bits=...).
+        Override to unpack other data.
+
+        :param value: int made by do_pack()
         """
-        raise error_classes.UsePythonMethod(
-            "use struct, pickle, json, or yaml.")
+        raise error_classes.UsePythonMethod(_no_pack_fields)
 
     # 5.3.12
     def set_local(self):
@@ -339,11 +818,30 @@ class uvm_policy:
             'functionality provided by policies.')
 
 
+class uvm_object(_uvm_object):
+    """ The most basic UVM object. Instances take any attribute. """
+
+
+class uvm_compact_object(_uvm_object, metaclass=CompactMeta):
+    """
+    A uvm_object without a __dict__. Declare the data members of
+    subclasses with uvm_field() or list them in __slots__.
+
+    It has the methods of uvm_object but is not a subclass of it.
+    """
+    __slots__ = ()
+
+
 # 5.4.1
-class uvm_transaction(uvm_object):
+class _uvm_transaction(_uvm_object):
     """
-    Transactions without interface to logging or waveforms.
+    The methods of uvm_transaction, without a __dict__
     """
+    __slots__ = ("_initiator", "transaction_id", "_accept_time",
+                 "_begin_time", "_end_time")
+    # Source of transaction ids. id() values are reused once an
+    # object is freed, so they cannot identify responses.
+    id_allocator = utility_classes.IdAllocator(per_test=True)
 
     # 5.4.2.1
     def __init__(self, name="", initiator=None):
@@ -353,11 +851,21 @@ class uvm_transaction(uvm_object):
         """
         super().__init__(name)
         self.set_initiator(initiator)
-        self.transaction_id = id(self)
+        self.transaction_id = self.id_allocator.next_id()
         self._accept_time: int = None
         self._begin_time: int = None
         self._end_time: int = None
 
+    @_partial_reset
+    def do_reset(self):
+        """Give the pooled transaction a new id and no times"""
+        super().do_reset()
+        self._initiator = None
+        self.transaction_id = self.id_allocator.next_id()
+        self._accept_time = None
+        self._begin_time = None
+        self._end_time = None
+
     def set_id_info(self, other):
         """
         Set transaction_id from other
@@ -550,6 +1058,22 @@ class uvm_transaction(uvm_object):
         Returns  variable transaction_id
         """
         if self.transaction_id is None:
-            return id(self)
-        else:
-            return self.transaction_id
+            self.transaction_id = self.id_allocator.next_id()
+        return self.transaction_id
+
+
+class uvm_transaction(_uvm_transaction, uvm_object):
+    """
+    Transactions without interface to logging or waveforms.
+    """
+
+
+class uvm_compact_transaction(_uvm_transaction, metaclass=CompactMeta):
+    """
+    A uvm_transaction without a __dict__. Declare the data members
+    of subclasses with uvm_field() or list them in __slots__.
+
+    It has the methods of uvm_transaction but is not a subclass of
+    uvm_transaction or uvm_object.
+    """
+    __slots__ = ()
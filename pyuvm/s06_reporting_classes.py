@@ -43,8 +43,14 @@ class uvm_report_object(uvm_object):
         # Every object gets its own logger
         logger_name = self.get_full_name() + str(id(self))
         self.logger = uvm_root_logger.getChild(logger_name)
-        self.logger.setLevel(
-            level=uvm_report_object.get_default_logging_level())
+        level = uvm_report_object.get_default_logging_level()
+        if self.logger.level == logging.NOTSET:
+            # A new logger has nothing cached. Logger.setLevel()
+            # clears the cache of every logger, which made building
+            # n components take O(n^2) time.
+            self.logger.level = level
+        else:
+            self.logger.setLevel(level)
         # We are not sending log messages up the hierarchy
         self.logger.propagate = False
         self._streaming_handler = logging.StreamHandler(sys.stdout)
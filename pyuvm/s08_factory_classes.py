@@ -2,6 +2,8 @@ import pyuvm.utility_classes as utility_classes
 import pyuvm.error_classes as error_classes
 import logging
 import fnmatch
+import time
+from collections import Counter
 
 
 # pyuvm refactors the factory, taking advantage Python's
@@ -25,6 +27,70 @@ import fnmatch
 # However there is a need to provide the methods in 8.
 
 
+class FactoryStats(utility_classes.UVMStats):
+    """
+    Creation counters for the factory. Turn them on with
+    uvm_factory().enable_stats(). Constructor times are
+    inclusive, so a component's time includes its children
+    built in its __init__().
+    """
+
+    def __init__(self):
+        self.requested = Counter()
+        self.resolved = Counter()
+        self.overridden = Counter()
+        self.pool_hits = Counter()
+        self.ctor_time = Counter()
+
+    def record_create(self, requested_type, new_type, elapsed, pooled=False):
+        """
+        :param requested_type: The type passed to the factory
+        :param new_type: The type after overrides
+        :param elapsed: Seconds spent constructing
+        :param pooled: True if the object came from a pool
+        """
+        self.requested[requested_type] += 1
+        self.resolved[new_type] += 1
+        self.ctor_time[new_type] += elapsed
+        if new_type is not requested_type:
+            self.overridden[requested_type] += 1
+        if pooled:
+            self.pool_hits[new_type] += 1
+
+    def override_hit_rate(self, requested_type):
+        """
+        :return: Fraction of requests for requested_type that were
+                 overridden
+        """
+        requests = self.requested[requested_type]
+        if requests == 0:
+            return 0.0
+        return self.overridden[requested_type] / requests
+
+    def summary(self):
+        return (f"Factory creations: {sum(self.requested.values())}  "
+                f"overridden: {sum(self.overridden.values())}  "
+                f"constructor time: {sum(self.ctor_time.values()):.6f}s")
+
+    def tables(self, top_n):
+        """The most expensive and the most requested types"""
+        def type_name(tt):
+            return getattr(tt, "__name__", str(tt))
+
+        resolved = [(type_name(tt), self.resolved[tt], self.pool_hits[tt],
+                     elapsed, elapsed / self.resolved[tt] * 1e6)
+                    for tt, elapsed in self.ctor_time.most_common(top_n)]
+        requested = [(type_name(tt), count, self.override_hit_rate(tt) * 100)
+                     for tt, count in self.requested.most_common(top_n)]
+        return [
+            ([("RESOLVED TYPE", 30, ""), ("COUNT", 8, "d"),
+              ("POOLED", 8, "d"), ("TIME(s)", 10, ".6f"),
+              ("AVG(us)", 10, ".2f")], resolved),
+            ([("REQUESTED TYPE", 30, ""), ("COUNT", 8, "d"),
+              ("OVERRIDE%", 10, ".1f")], requested),
+        ]
+
+
 # 8.3.1.1
 class uvm_factory(metaclass=utility_classes.Singleton):
     """
@@ -44,18 +110,51 @@ class uvm_factory(metaclass=utility_classes.Singleton):
         self.fd = utility_classes.FactoryData()
         self.logger = logging.getLogger("Factory")
         self.debug_level = 1
+        # Released objects waiting for reuse, by type. Each pool
+        # maps id() to the object, which the pool keeps alive.
+        self.pools = {}
+        # Maximum objects kept per type. set_pool_cap() overrides this.
+        self.pool_cap = 256
+        self.pool_caps = {}
+        self.stats = None
+        # A UVMTestIndex that imports test modules on demand
+        self.test_index = None
+
+    def enable_stats(self):
+        """Start counting creations and constructor time from zero"""
+        self.stats = FactoryStats()
+
+    def disable_stats(self):
+        self.stats = None
+
+    def print_stats(self, top_n=10):
+        """
+        Log the top_n types by constructor time and by requests
+        :return: The report string or None if stats are disabled
+        """
+        return utility_classes.log_stats(self.logger, "Factory",
+                                         self.stats, top_n)
+
+    def __timed_create(self, requested_type, new_type, *args):
+        start = time.perf_counter()
+        new_obj = new_type(*args)
+        self.stats.record_create(requested_type, new_type,
+                                 time.perf_counter() - start)
+        return new_obj
 
     def clear_all(self):
         self.fd.clear_classes()
         self.clear_overrides()
+        self.clear_pools()
+
+    def clear_pools(self):
+        self.pools = {}
 
     def clear_overrides(self):
         self.fd.clear_overrides()
 
     def __set_override(self, original, override, path=None):
-        if original not in self.fd.overrides:
-            self.fd.overrides[original] = utility_classes.Override()
-        self.fd.overrides[original].add(override, path)
+        self.fd.add_override(original, override, path)
 
     # 8.3.1.3
     def set_inst_override_by_type(self, original_type, override_type,
@@ -227,8 +326,89 @@ class uvm_factory(metaclass=utility_classes.Singleton):
         if new_type is None:
             raise error_classes.UVMFactoryError(
                 f"{requested_type} not in uvm_factory()")
+        if self.stats is not None:
+            return self.__timed_create(requested_type, new_type, name)
         return new_type(name)
 
+    def create_pooled_object_by_type(self, requested_type,
+                                     parent_inst_path="", name=""):
+        """
+        Like create_object_by_type(), but reuses an object that was
+        returned with release_object() if there is one in the pool.
+
+        :param requested_type: The type that we request but that can be
+        overridden
+        :param parent_inst_path: The get_full_name path of the parent
+        :param name: The name of the instance requested_type("name")
+        :return: Type that is child of uvm_object.
+        :raises UVMError: if the type does not define do_reset()
+        """
+        new_type = self.__find_override(requested_type, parent_inst_path, name)
+        if new_type is None:
+            raise error_classes.UVMFactoryError(
+                f"{requested_type} not in uvm_factory()")
+        pool = self.pools.get(new_type)
+        if not pool:
+            self.__check_poolable(new_type)
+            if self.stats is not None:
+                return self.__timed_create(requested_type, new_type, name)
+            return new_type(name)
+        new_obj = pool.popitem()[1]
+        new_obj.set_name(name)
+        if self.stats is not None:
+            self.stats.record_create(requested_type, new_type, 0.0,
+                                     pooled=True)
+        return new_obj
+
+    def release_object(self, obj):
+        """
+        Reset obj with its do_reset() and keep it for
+        create_pooled_object_by_type(). The caller must not use
+        obj afterwards. Objects beyond the type's pool cap are left
+        to the garbage collector without being reset.
+
+        :param obj: A uvm_object created with the factory
+        :return: None
+        :raises UVMError: if the type does not define do_reset()
+            or obj is already in the pool
+        """
+        obj_type = type(obj)
+        self.__check_poolable(obj_type)
+        pool = self.pools.get(obj_type)
+        if pool is None:
+            pool = self.pools[obj_type] = {}
+        # The pool holds obj, so no other live object has its id
+        key = id(obj)
+        if key in pool:
+            raise error_classes.UVMError(
+                f"Released {obj_type.__name__} {obj.get_name()} twice")
+        if len(pool) >= self.pool_caps.get(obj_type, self.pool_cap):
+            return
+        obj.do_reset()
+        pool[key] = obj
+
+    @staticmethod
+    def __check_poolable(pool_type):
+        # pyuvm's own do_reset() methods reset only the data
+        # members that pyuvm declares
+        if getattr(pool_type.do_reset, "__uvm_partial_reset__", False):
+            raise error_classes.UVMError(
+                f"{pool_type.__name__} must define do_reset() "
+                "to be pooled")
+
+    def set_pool_cap(self, pool_type, cap):
+        """
+        Set the maximum number of released objects kept for pool_type
+
+        :param pool_type: A uvm_object type
+        :param cap: Maximum pool size. 0 disables pooling for the type.
+        """
+        assert cap >= 0, "The pool cap cannot be negative"
+        self.pool_caps[pool_type] = cap
+        pool = self.pools.get(pool_type)
+        while pool and len(pool) > cap:
+            pool.popitem()
+
     # 8.3.1.5
     def create_object_by_name(self, requested_type_name,
                               parent_inst_path="", name=""):
@@ -276,9 +456,99 @@ class uvm_factory(metaclass=utility_classes.Singleton):
             raise error_classes.UVMFactoryError(
                 f"{requested_type} not in uvm_factory()")
 
+        if self.stats is not None:
+            return self.__timed_create(requested_type, new_type, name, parent)
         new_comp = new_type(name, parent)
         return new_comp
 
+    def __find_overrides(self, requested_type, parent_inst_path, names):
+        """
+        Find the override for each name in names. If there are no
+        instance overrides the answer cannot depend on the name, so
+        we search once. Otherwise we search once per distinct name.
+
+        :return: list of types, one per name
+        """
+        if len(names) == 0:
+            return []
+        if not self.fd.has_inst_overrides:
+            found = {None: self.__find_override(requested_type,
+                                                parent_inst_path, names[0])}
+            keys = [None] * len(names)
+        else:
+            found = {name: self.__find_override(requested_type,
+                                                parent_inst_path, name)
+                     for name in set(names)}
+            keys = names
+        if None in found.values():
+            raise error_classes.UVMFactoryError(
+                f"{requested_type} not in uvm_factory()")
+        return [found[key] for key in keys]
+
+    def create_objects(self, requested_type, names_or_count,
+                       parent_inst_path=""):
+        """
+        Create many objects, finding overrides once rather than
+        once per object.
+
+        :param requested_type: The type that we request but that can be
+        overridden
+        :param names_or_count: A list of names or the number of
+        objects to create with empty names
+        :param parent_inst_path: The get_full_name path of the parent
+        :return: list of objects
+        """
+        if isinstance(names_or_count, int):
+            names = [""] * names_or_count
+        else:
+            names = list(names_or_count)
+        new_types = self.__find_overrides(requested_type, parent_inst_path,
+                                          names)
+        if self.stats is not None:
+            return [self.__timed_create(requested_type, new_type, name)
+                    for new_type, name in zip(new_types, names)]
+        return [new_type(name) for new_type, name in zip(new_types, names)]
+
+    def create_component_array(self, requested_type, parent, name_fmt, n):
+        """
+        Create n components under parent named name_fmt.format(index),
+        for example "agent_{}" or "agent{:02d}". Overrides are found
+        once, and instance overrides that match some of the names
+        are honored. The names are checked before any component is
+        built. If a constructor raises, the components already built
+        are removed from the hierarchy.
+
+        :param requested_type: Type type to be overridden
+        :param parent: The parent component
+        :param name_fmt: The format string for the names
+        :param n: The number of components
+        :return: list of components
+        :raises AssertionError: if a name repeats or parent has a
+            child with it
+        """
+        if n == 0:
+            return []
+        parent_inst_path = "" if parent is None else parent.get_full_name()
+        names = [name_fmt.format(ii) for ii in range(n)]
+        new_types = self.__find_overrides(requested_type, parent_inst_path,
+                                          names)
+        # Components without a parent go under uvm_root
+        owner = new_types[0]._parent_or_root(parent)
+        owner.check_new_children(names)
+        new_comps = []
+        try:
+            for new_type, name in zip(new_types, names):
+                if self.stats is not None:
+                    new_comps.append(self.__timed_create(
+                        requested_type, new_type, name, parent))
+                else:
+                    new_comps.append(new_type(name, parent))
+        except BaseException:
+            for name in names:
+                owner.remove_child(name)
+            raise
+        return new_comps
+
     # 8.3.1.5
     def create_component_by_name(self, requested_type_name,
                                  parent_inst_path="", name="", parent=None):
@@ -298,7 +568,12 @@ class uvm_factory(metaclass=utility_classes.Singleton):
         try:
             requested_type = utility_classes.FactoryData().classes[requested_type_name]  # noqa
         except KeyError:
-            requested_type = requested_type_name
+            requested_type = None
+            if self.test_index is not None:
+                requested_type = self.test_index.import_test(
+                    requested_type_name)
+            if requested_type is None:
+                requested_type = requested_type_name
 
         new_obj = self.create_component_by_type(requested_type,
                                                 parent_inst_path,
@@ -61,7 +61,9 @@ class uvm_topdown_phase(uvm_phase):
         :param comp: The component whose hierarchy will be traversed
         """
         cls.execute(comp)  # first we execute this node then its children
-        for child in comp.get_children():
+        # Only the children that exist. Components such as FIFOs
+        # build some children on first use and those need no phases.
+        for child in list(comp._children.values()):
             cls.traverse(child)
 
 
@@ -71,7 +73,7 @@ class uvm_bottomup_phase(uvm_phase):
     """
     @classmethod
     def traverse(cls, comp):
-        for child in comp.get_children():
+        for child in list(comp._children.values()):
             cls.traverse(child)
         cls.execute(comp)
 
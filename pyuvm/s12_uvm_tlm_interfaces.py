@@ -23,10 +23,17 @@
 # their various flavors through multiple inheritance.
 
 
+import sys
+from collections import deque
+from enum import IntEnum
+
+from pyuvm.s05_base_classes import uvm_compact_transaction, uvm_field
 from pyuvm.s13_uvm_component import uvm_component
-from pyuvm.error_classes import UVMTLMConnectionError
-from pyuvm.utility_classes import UVMQueue, FIFO_DEBUG
+from pyuvm.error_classes import UVMError, UVMTLMConnectionError
+from pyuvm.utility_classes import UVMQueue, UVMPriorityQueue, UVMSpillQueue
+from pyuvm.utility_classes import FIFO_DEBUG
 from cocotb.queue import QueueEmpty, QueueFull
+from cocotb.triggers import Event as CocotbEvent
 
 
 # 12.2.2
@@ -53,6 +60,20 @@ from cocotb.queue import QueueEmpty, QueueFull
 # We use these classes to check the connect phase
 # to avoid illegal connections
 
+def _forwards_to_export(method):
+    """
+    Marks a port method that calls the same method of
+    self.export. resolve_bindings() replaces these with the
+    export's own methods.
+    """
+    method.__uvm_forwards__ = True
+    return method
+
+
+def _forwards(cls, name):
+    return getattr(getattr(cls, name, None), "__uvm_forwards__", False)
+
+
 # uvm_export_base provides the provided_to
 # associative array.
 class uvm_export_base(uvm_component):
@@ -86,6 +107,8 @@ class uvm_port_base(uvm_export_base):
                          "can_put", "can_get", "can_peek",
                          "transport", "nb_transport",
                          "write",
+                         "b_transport", "nb_transport_fw",
+                         "get_direct_mem_ptr",
                          "put_req", "put_response", "get_next_item",
                          "item_done", "get_response"]
 
@@ -94,6 +117,8 @@ class uvm_port_base(uvm_export_base):
         self.connected_to = {}
         self.export = None
         self.needed_methods = []
+        # Methods bound by resolve_bindings()
+        self._bindings = None
 
         # Compare the list of all tlm methods to the
         # methods in this class to create a list of
@@ -121,6 +146,8 @@ class uvm_port_base(uvm_export_base):
         :return:
         """
         self.check_export(export)
+        if self._bindings is not None:
+            self._unbind()
         try:
             self.export = export
             self.connected_to[export.get_full_name()] = export
@@ -129,6 +156,69 @@ class uvm_port_base(uvm_export_base):
             raise UVMTLMConnectionError(
                 f"Error connecting {self.get_name()} using {export}")
 
+    def end_of_elaboration_phase(self):
+        self.resolve_bindings()
+
+    def resolve_bindings(self, _path=()):
+        """
+        Bind this port's TLM methods to the methods of the export
+        at the end of its chain of ports, so calls skip the ports
+        in between. end_of_elaboration_phase() calls this, and a
+        port resolves the ports it connects to first.
+
+        :return: dict of the bound methods by name
+        :raises UVMTLMConnectionError: if the port connects to more
+            than one export, the chain loops, or the chain ends at a
+            port that is not connected
+        """
+        if self._bindings is not None:
+            return self._bindings
+        if self in _path:
+            loop = " -> ".join(port.get_full_name()
+                               for port in _path + (self,))
+            raise UVMTLMConnectionError(f"Port connections loop: {loop}")
+        if len(self.connected_to) > 1:
+            raise UVMTLMConnectionError(
+                f"{self.get_full_name()} is connected to "
+                f"{', '.join(self.connected_to)} but a port connects "
+                "to one export")
+        bindings = {}
+        target = self.export
+        target_bindings = None
+        dead_end = False
+        for name in self.needed_methods:
+            if target is None or not _forwards(type(self), name):
+                continue
+            if isinstance(target, uvm_port_base) \
+                    and _forwards(type(target), name):
+                if target_bindings is None:
+                    target_bindings = target.resolve_bindings(
+                        _path + (self,))
+                # Methods the chain cannot reach keep the class
+                # method and its error
+                if name in target_bindings:
+                    bindings[name] = target_bindings[name]
+                else:
+                    dead_end = True
+            else:
+                bindings[name] = getattr(target, name)
+        if dead_end and not bindings:
+            raise UVMTLMConnectionError(
+                f"{self.get_full_name()} is connected to "
+                f"{target.get_full_name()}, which is not connected")
+        self.__dict__.update(bindings)
+        self._bindings = bindings
+        return bindings
+
+    def _unbind(self):
+        """Go back to the class methods here and upstream"""
+        for name in self._bindings:
+            del self.__dict__[name]
+        self._bindings = None
+        for port in self.provided_to.values():
+            if getattr(port, "_bindings", None) is not None:
+                port._unbind()
+
 # put
 
 # 12.2.5.1
@@ -140,6 +230,7 @@ class uvm_blocking_put_port(uvm_port_base):
     """
 
     # 12.2.4.2.1
+    @_forwards_to_export
     async def put(self, datum):
         """
          A blocking put that calls the export.put
@@ -161,6 +252,7 @@ class uvm_nonblocking_put_port(uvm_port_base):
     """
 
     # 12.2.4.2.4
+    @_forwards_to_export
     def try_put(self, data):
         """
         Tries to put data on a port, but if the
@@ -178,6 +270,7 @@ class uvm_nonblocking_put_port(uvm_port_base):
                 f"in {self.get_full_name()}. Did you connect it?")
 
     # 12.2.4.2.5
+    @_forwards_to_export
     def can_put(self):
         """
         Returns true if there is room for data to
@@ -208,6 +301,7 @@ class uvm_blocking_get_port(uvm_port_base):
     """
 
     # 12.2.4.2.2
+    @_forwards_to_export
     async def get(self):
         """
 
@@ -229,6 +323,7 @@ class uvm_nonblocking_get_port(uvm_port_base):
     Access the non_blocking methods in export
     """
 
+    @_forwards_to_export
     def try_get(self):
         """
         12.2.4.2.6
@@ -248,6 +343,7 @@ class uvm_nonblocking_get_port(uvm_port_base):
         return success, data
 
     # 12.2.4.2.7
+    @_forwards_to_export
     def can_get(self):
         """
         Returns true if there is data to get
@@ -276,6 +372,7 @@ class uvm_blocking_peek_port(uvm_port_base):
     """
 
     # 12.2.4.2.3
+    @_forwards_to_export
     async def peek(self):
         """
         A blocking peek that returns data without
@@ -299,6 +396,7 @@ class uvm_nonblocking_peek_port(uvm_port_base):
     """
 
     # 12.2.4.2.8
+    @_forwards_to_export
     def try_peek(self):
         """
 
@@ -315,6 +413,7 @@ class uvm_nonblocking_peek_port(uvm_port_base):
         return success, data
 
     # 12.2.4.2.9
+    @_forwards_to_export
     def can_peek(self):
         """
         Checks if peeking will be successful
@@ -350,6 +449,7 @@ class uvm_blocking_transport_port(uvm_port_base):
     def __init__(self, name, parent):
         super().__init__(name, parent)
 
+    @_forwards_to_export
     async def transport(self, put_data):
         try:
             get_data = await self.export.transport(put_data)
@@ -359,12 +459,28 @@ class uvm_blocking_transport_port(uvm_port_base):
                 f" {self.get_full_name()}. Did you connect it?")
         return get_data
 
+    async def transport_many(self, reqs):
+        """
+        Transport a list of requests. Exports that can have
+        several requests outstanding send them all before
+        waiting for the responses.
+
+        :param reqs: Iterable of requests
+        :return: list of the responses in request order
+        """
+        try:
+            transport_many = self.export.transport_many
+        except AttributeError:
+            return [await self.transport(req) for req in reqs]
+        return await transport_many(reqs)
+
 
 class uvm_nonblocking_transport_port(uvm_port_base):
 
     def __init__(self, name, parent):
         super().__init__(name, parent)
 
+    @_forwards_to_export
     def nb_transport(self, put_data):
         try:
             success, get_data = self.export.nb_transport(put_data)
@@ -410,11 +526,40 @@ class uvm_slave_port(uvm_nonblocking_slave_port,
     ...
 
 
+def _write_nothing(datum):
+    """The write() and write_batch() of a port with no subscribers"""
+
+
+def _write_each(write):
+    """
+    :param write: A write() method
+    :return: A write_batch() that calls write() once per item
+    """
+    def write_batch(items):
+        for item in items:
+            write(item)
+    return write_batch
+
+
 class uvm_analysis_port(uvm_port_base):
+    """
+    An analysis port keeps a tuple of its subscribers' write()
+    methods. It looks through analysis ports connected to it, so a
+    chain of ports costs one call per subscriber. connect()
+    and end_of_elaboration_phase() rebuild the tuple and install
+    a write() specialized for zero, one, or many subscribers.
+
+    write_batch() delivers a list of the items to each subscriber's
+    write_batch(), or loops over its write() if it has none.
+    """
+
     def __init__(self, name, parent):
         super().__init__(name, parent)
 
         self.subscribers = []
+        self._writers = ()
+        self._batch_writers = ()
+        self._install_write()
 
     # 12.2.8.1
     def write(self, datum):
@@ -422,15 +567,124 @@ class uvm_analysis_port(uvm_port_base):
         :param datum: data to send
         :return: None
         """
-        for export in self.subscribers:
-            if not hasattr(export, "write"):
-                raise UVMTLMConnectionError(
-                    f"No write() method in {export}. Did you connect it?")
-            export.write(datum)
+        for write in self._writers:
+            write(datum)
+
+    def write_batch(self, items):
+        """
+        :param items: iterable of data to send. Every subscriber
+            gets the same list, so a generator is read once.
+        :return: None
+        """
+        items = list(items)
+        for write_batch in self._batch_writers:
+            write_batch(items)
 
     def connect(self, export):
         self.check_export(export)
         self.subscribers.append(export)
+        try:
+            self._resolve_writers()
+        except UVMTLMConnectionError:
+            self.subscribers.pop()
+            raise
+        self.connected_to[export.get_full_name()] = export
+        export.provided_to[self.get_full_name()] = self
+
+    def end_of_elaboration_phase(self):
+        self.resolve_bindings()
+
+    def resolve_bindings(self, _path=()):
+        """
+        Resolve the subscribers' write() methods again. Analysis
+        ports connect to any number of exports.
+
+        :return: empty dict, as write() is not bound to one export
+        """
+        self._resolve_writers(upstream=False)
+        return {}
+
+    def _flat_writers(self, path=()):
+        """
+        :return: list of (write, write_batch) pairs that receive
+            data written to this port
+        """
+        if self in path:
+            raise UVMTLMConnectionError(
+                f"Analysis port loop through {self.get_full_name()}")
+        path += (self,)
+        writers = []
+        for export in self.subscribers:
+            if getattr(type(export), "write", None) is uvm_analysis_port.write:
+                writers.extend(export._flat_writers(path))
+                continue
+            write = getattr(export, "write", None)
+            if not callable(write):
+                raise UVMTLMConnectionError(
+                    f"No write() method in {export}. Did you connect it?")
+            write_batch = getattr(export, "write_batch", None)
+            if write_batch is None:
+                write_batch = _write_each(write)
+            writers.append((write, write_batch))
+        return writers
+
+    def _resolve_writers(self, upstream=True):
+        """
+        Rebuild the writers and then those of the analysis ports
+        that write through this one.
+        """
+        writers = self._flat_writers()
+        self._writers = tuple(write for write, _ in writers)
+        self._batch_writers = tuple(batch for _, batch in writers)
+        self._install_write()
+        if upstream:
+            for port in self.provided_to.values():
+                if isinstance(port, uvm_analysis_port):
+                    port._resolve_writers()
+
+    def _install_write(self):
+        cls = type(self)
+        # Subclasses that override write() keep it and get a
+        # write_batch() that calls it unless they override that too.
+        if cls.write is not uvm_analysis_port.write:
+            if cls.write_batch is uvm_analysis_port.write_batch:
+                self.write_batch = _write_each(self.write)
+            return
+        self.write = self._fan_out(self._writers)
+        if cls.write_batch is uvm_analysis_port.write_batch:
+            self.write_batch = self._fan_out_batch(self._batch_writers)
+
+    @staticmethod
+    def _fan_out(writers):
+        """
+        :param writers: tuple of single argument functions
+        :return: One function that calls them all
+        """
+        if not writers:
+            return _write_nothing
+        if len(writers) == 1:
+            return writers[0]
+
+        def write(datum):
+            for write_fn in writers:
+                write_fn(datum)
+        return write
+
+    @staticmethod
+    def _fan_out_batch(writers):
+        """
+        :param writers: tuple of write_batch() functions
+        :return: One function that makes a list of the items and
+            passes it to them all
+        """
+        if not writers:
+            return _write_nothing
+
+        def write_batch(items):
+            items = list(items)
+            for write_fn in writers:
+                write_fn(items)
+        return write_batch
 
 
 class uvm_nonblocking_put_export(uvm_export_base):
@@ -651,39 +905,101 @@ class uvm_tlm_fifo_base(uvm_component):
     class uvm_GetPeekExport(uvm_GetExport, uvm_PeekExport):
         ...
 
-    def __init__(self, name, parent, maxsize=1):
+    # The analysis ports and exports are built the first time
+    # they are used, since most FIFOs use only one or two of
+    # them. Each entry is the export class attribute and the
+    # analysis port it writes. A None class is an analysis port.
+    _lazy_exports = {
+        "get_ap": (None, None),
+        "put_ap": (None, None),
+        "blocking_put_export": ("uvm_BlockingPutExport", "put_ap"),
+        "nonblocking_put_export": ("uvm_NonBlockingPutExport", "put_ap"),
+        "put_export": ("uvm_PutExport", "put_ap"),
+        "blocking_get_export": ("uvm_BlockingGetExport", "get_ap"),
+        "nonblocking_get_export": ("uvm_NonBlockingGetExport", "put_ap"),
+        "get_export": ("uvm_GetExport", "get_ap"),
+        "blocking_peek_export": ("uvm_BlockingPeekExport", "get_ap"),
+        "nonblocking_peek_export": ("uvm_NonBlockingPeekExport", "get_ap"),
+        "peek_export": ("uvm_PeekExport", "get_ap"),
+        "blocking_get_peek_export": ("uvm_BlockingGetPeekExport", "get_ap"),
+        "nonblocking_get_peek_export": ("uvm_NonBlockingGetPeekExport",
+                                        "get_ap"),
+        "get_peek_export": ("uvm_GetPeekExport", "get_ap"),
+    }
+
+    def __init__(self, name, parent, maxsize=1, queue=None):
+        """
+        :param name: Name of the FIFO
+        :param parent: Parent component
+        :param maxsize: Most items held. 0 is unbounded.
+        :param queue: The UVMQueue that holds the items. None
+            makes a UVMQueue(maxsize).
+        """
         super().__init__(name, parent)
-        self.queue = UVMQueue(maxsize=maxsize)
-        self.get_ap = uvm_analysis_port("get_ap", self)
-        self.put_ap = uvm_analysis_port("put_ap", self)
-
-        self.blocking_put_export = self.uvm_BlockingPutExport("blocking_put_export",  # noqa: E501
-                                                              self, self.queue,
-                                                              self.put_ap)
-        self.nonblocking_put_export = self.uvm_NonBlockingPutExport("nonblocking_put_export",  # noqa: E501
-                                                                    self, self.queue, self.put_ap)  # noqa: E501
-        self.put_export = self.uvm_PutExport("put_export", self, self.queue, self.put_ap)  # noqa: E501
-
-        self.blocking_get_export = self.uvm_BlockingGetExport("blocking_get_export", self,  # noqa: E501
-                                                              self.queue, self.get_ap)  # noqa: E501
-        self.nonblocking_get_export = self.uvm_NonBlockingGetExport("nonblocking_get_export", self,  # noqa: E501
-                                                                    self.queue, self.put_ap)  # noqa: E501
-
-        self.get_export = self.uvm_GetExport("get_export", self, self.queue,
-                                             self.get_ap)
-
-        self.blocking_peek_export = self.uvm_BlockingPeekExport("blocking_peek_export", self,  # noqa: E501
-                                                                self.queue, self.get_ap)  # noqa: E501
-        self.nonblocking_peek_export = self.uvm_NonBlockingPeekExport("nonblocking_peek_export", self,  # noqa: E501
-                                                                      self.queue, self.get_ap)  # noqa: E501
-        self.peek_export = self.uvm_PeekExport("peek_export", self,
-                                               self.queue, self.get_ap)
-
-        self.blocking_get_peek_export = self.uvm_BlockingGetPeekExport("blocking_get_peek_export", self,  # noqa: E501
-                                                                       self.queue, self.get_ap)  # noqa: E501
-        self.nonblocking_get_peek_export = self.uvm_NonBlockingGetPeekExport("nonblocking_get_peek_export", self,  # noqa: E501
-                                                                             self.queue, self.get_ap)  # noqa: E501
-        self.get_peek_export = self.uvm_GetPeekExport("get_peek_export", self, self.queue, self.get_ap)  # noqa: E501
+        self.queue = UVMQueue(maxsize=maxsize) if queue is None else queue
+        self._unbuilt = dict.fromkeys(self._lazy_exports)
+
+    def __getattr__(self, name):
+        # Only called for attributes that do not exist yet
+        unbuilt = self.__dict__.get("_unbuilt")
+        if unbuilt is None or name not in unbuilt:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self._build_export(name)
+
+    def _build_export(self, name):
+        cls_name, ap_name = self._lazy_exports[name]
+        if cls_name is None:
+            export = uvm_analysis_port(name, self)
+        else:
+            ap = None if ap_name is None else getattr(self, ap_name)
+            export = getattr(self, cls_name)(name, self, self.queue, ap)
+        del self._unbuilt[name]
+        setattr(self, name, export)
+        self._inherit_logging(export)
+        return export
+
+    def _inherit_logging(self, export):
+        # The *_hier logging methods only reach exports that
+        # exist, so a new export copies this FIFO's logging.
+        if export.logger.level != self.logger.level:
+            export.set_logging_level(self.logger.level)
+        if self._streaming_handler not in self.logger.handlers:
+            export.remove_streaming_handler()
+        for handler in self.logger.handlers:
+            if handler is not self._streaming_handler:
+                export.logger.addHandler(handler)
+
+    def _build_all_exports(self):
+        if not self._unbuilt:
+            return
+        for name in list(self._unbuilt):
+            if name in self._unbuilt:
+                self._build_export(name)
+        # List the exports in the order they are declared
+        children = self._children
+        order = [name for name in self._lazy_exports if name in children]
+        self._children = {name: children[name] for name in order}
+        self._children.update(children)
+
+    @property
+    def children(self):
+        self._build_all_exports()
+        return super().children
+
+    def get_child(self, name):
+        if name in self._unbuilt:
+            return self._build_export(name)
+        return super().get_child(name)
+
+    def has_child(self, name):
+        return name in self._unbuilt or super().has_child(name)
+
+    def get_num_children(self):
+        return len(self._unbuilt) + super().get_num_children()
+
+    def _unbuilt_child_names(self):
+        return list(self._unbuilt)
 
     async def put(self, item):
         await self.put_export.put(item)
@@ -712,13 +1028,56 @@ class uvm_tlm_fifo_base(uvm_component):
     def try_peek(self):
         return self.peek_export.try_peek()
 
+    def try_put_many(self, items):
+        """
+        Put all of items in the FIFO if there is room for them
+
+        :param items: list or other sequence of items
+        :return: True if the FIFO took the items
+        """
+        try:
+            self.queue.put_nowait_many(items)
+        except QueueFull:
+            return False
+        self._write_ap("put_ap", items)
+        return True
+
+    def try_get_many(self, n=None):
+        """
+        Get up to n items without waiting
+
+        :param n: Most items to get. None gets them all.
+        :return: list of items, empty if the FIFO is empty
+        """
+        items = self.queue.get_nowait_many(n)
+        self._write_ap("get_ap", items)
+        return items
+
+    async def get_batch(self, min_n=1, max_n=None):
+        """
+        Wait until the FIFO holds min_n items and get up to max_n
+
+        :param min_n: Fewest items to get
+        :param max_n: Most items to get. None gets them all.
+        :return: list of items
+        """
+        items = await self.queue.get_batch(min_n, max_n)
+        self._write_ap("get_ap", items)
+        return items
+
+    def _write_ap(self, ap_name, items):
+        # An analysis port that was never built has no subscribers
+        ap = self.__dict__.get(ap_name)
+        if ap is not None and items:
+            ap.write_batch(items)
+
 
 class uvm_tlm_fifo(uvm_tlm_fifo_base):
 
     #  12.2.8.2.1
-    def __init__(self, name=None, parent=None, size=1):
+    def __init__(self, name=None, parent=None, size=1, queue=None):
         """ uvm_tlm_fifo is a uvm_component"""
-        super().__init__(name, parent, size)
+        super().__init__(name, parent, size, queue)
 
     # 12.2.8.2.2
     def size(self):
@@ -770,24 +1129,212 @@ class uvm_tlm_fifo(uvm_tlm_fifo_base):
         """
         Flush out the FIFO
         """
-        self.queue._queue.clear()
+        self.queue.clear()
+
+
+class uvm_tlm_priority_fifo(uvm_tlm_fifo):
+    """
+    A uvm_tlm_fifo whose gets and peeks return the item with the
+    highest priority, and items of equal priority in the order they
+    were put. It has the exports of uvm_tlm_fifo_base. Puts block
+    while the FIFO is full, and gets while it is empty.
+    """
+
+    def __init__(self, name, parent=None, size=0, priority=None):
+        """
+        :param name: Name of the FIFO
+        :param parent: Parent component
+        :param size: Most items held. 0 is unbounded.
+        :param priority: Function that returns an item's priority.
+            None uses the item's priority attribute, or 0.
+        """
+        super().__init__(name, parent, size,
+                         UVMPriorityQueue(size, priority))
+
+
+class uvm_overflow_policy_enum(IntEnum):
+    """
+    What a bounded uvm_tlm_analysis_fifo does with an item
+    written while it is full
+    """
+    UVM_OVERFLOW_ERROR = 0  # raise QueueFull
+    UVM_DROP_OLDEST = 1  # drop the oldest item to make room
+    UVM_DROP_NEWEST = 2  # drop the new item
+    UVM_SAMPLE = 3  # keep every sample_every'th item as DROP_OLDEST
 
 
 class uvm_tlm_analysis_fifo(uvm_tlm_fifo):
+    """
+    A uvm_tlm_fifo with an analysis_export. By default it is
+    unbounded. Give it a size and it applies its overflow policy
+    to writes that find it full, so a scoreboard that falls
+    behind cannot use up memory.
+
+    Callbacks added with add_watermark_callback() are called with
+    the FIFO each time its fill level rises to watermark. The
+    FIFO counts the items written and dropped, its peak fill
+    level, and the watermark crossings when it has a size or a
+    watermark, and reports them in report_phase().
+    """
+
     class uvm_AnalysisExport(uvm_QueueAccessor, uvm_analysis_port):
+        def __init__(self, name, parent, uvm_queue, ap):
+            super().__init__(name, parent, uvm_queue, ap)
+            # Analysis ports call the FIFO or its queue directly
+            self.write, self.write_batch = parent._analysis_writers()
+
         def write(self, item):
-            try:
-                self.queue.put_nowait(item)
-            except QueueFull:
-                raise QueueFull(
-                    f"Full analysis fifo: {self.__name__}. This should never happen")  # noqa: E501
+            self.get_parent()._write_item(item)
+
+        def write_batch(self, items):
+            self.get_parent()._write_items(items)
 
-    def __init__(self, name, parent=None):
-        super().__init__(name, parent, 0)
-        self.analysis_export = self.uvm_AnalysisExport(name="analysis_export",
-                                                       parent=self,
-                                                       uvm_queue=self.queue,
-                                                       ap=None)
+    _lazy_exports = {**uvm_tlm_fifo._lazy_exports,
+                     "analysis_export": ("uvm_AnalysisExport", None)}
+
+    def __init__(self, name, parent=None, size=0,
+                 overflow=uvm_overflow_policy_enum.UVM_OVERFLOW_ERROR,
+                 watermark=None, sample_every=10, queue=None):
+        """
+        :param name: Name of the FIFO
+        :param parent: Parent component
+        :param size: Most items held. 0 is unbounded.
+        :param overflow: uvm_overflow_policy_enum for writes to a
+            full FIFO
+        :param watermark: Fill level that calls the watermark
+            callbacks, or None
+        :param sample_every: UVM_SAMPLE keeps one in this many of
+            the items written while the FIFO is full
+        :param queue: The UVMQueue that holds the items. None
+            makes a UVMQueue(size).
+        """
+        super().__init__(name, parent, size, queue)
+        self.overflow = uvm_overflow_policy_enum(overflow)
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, "
+                             f"not {sample_every}")
+        self.sample_every = sample_every
+        self.watermark = watermark
+        self._watermark_level = sys.maxsize if watermark is None \
+            else watermark
+        self._watermark_callbacks = []
+        self.write_count = 0
+        self.drop_count = 0
+        self.peak_used = 0
+        self.watermark_count = 0
+        self._overflows = 0
+
+    def add_watermark_callback(self, callback):
+        """
+        :param callback: Called with this FIFO each time its fill
+            level rises to the watermark
+        """
+        self._watermark_callbacks.append(callback)
+
+    def _analysis_writers(self):
+        """
+        :return: The write() and write_batch() of analysis_export
+        """
+        if self.size() == 0 and self.watermark is None:
+            # Nothing to limit or report, so skip the counting
+            return self.queue.put_nowait, self.queue.put_nowait_many
+        return self._write_item, self._write_items
+
+    def _write_item(self, item):
+        queue = self.queue
+        before = queue.qsize()
+        try:
+            queue.put_nowait(item)
+        except QueueFull:
+            self._overflow(item)
+        self.write_count += 1
+        used = queue.qsize()
+        if used > self.peak_used:
+            self.peak_used = used
+        if before < self._watermark_level <= used:
+            self._reach_watermark()
+
+    def _write_items(self, items):
+        queue = self.queue
+        if queue.maxsize > 0 and queue.qsize() + len(items) > queue.maxsize:
+            for item in items:
+                self._write_item(item)
+            return
+        before = queue.qsize()
+        queue.put_nowait_many(items)
+        self.write_count += len(items)
+        used = queue.qsize()
+        if used > self.peak_used:
+            self.peak_used = used
+        if before < self._watermark_level <= used:
+            self._reach_watermark()
+
+    def _overflow(self, item):
+        self._overflows += 1
+        policy = self.overflow
+        if policy == uvm_overflow_policy_enum.UVM_OVERFLOW_ERROR:
+            raise QueueFull(f"Analysis FIFO {self.get_full_name()} is "
+                            f"full with {self.size()} items")
+        self.drop_count += 1
+        if policy == uvm_overflow_policy_enum.UVM_DROP_NEWEST:
+            return
+        if policy == uvm_overflow_policy_enum.UVM_SAMPLE and \
+                self._overflows % self.sample_every:
+            return
+        self.queue.get_nowait()
+        self.queue.put_nowait(item)
+
+    def _reach_watermark(self):
+        self.watermark_count += 1
+        for callback in self._watermark_callbacks:
+            callback(self)
+
+    def report_phase(self):
+        super().report_phase()
+        if self.size() == 0 and self.watermark is None:
+            return
+        report = (f"{self.write_count} written, "
+                  f"{self.drop_count} dropped, "
+                  f"peak {self.peak_used} of {self.size() or 'unbounded'}, "
+                  f"watermark reached {self.watermark_count} times")
+        if self.drop_count:
+            self.logger.warning(report)
+        else:
+            self.logger.info(report)
+
+
+class uvm_tlm_spill_fifo(uvm_tlm_analysis_fifo):
+    """
+    An unbounded uvm_tlm_analysis_fifo for checkers that keep
+    every transaction of a long run. It holds window items in
+    memory and appends the rest to a temporary file, which get()
+    and try_get() read back in order. See UVMSpillQueue for how
+    items are stored. final_phase() deletes the file.
+    """
+
+    def __init__(self, name, parent=None, window=1024, item_type=None,
+                 spill_dir=None):
+        """
+        :param name: Name of the FIFO
+        :param parent: Parent component
+        :param window: Most items held in memory
+        :param item_type: uvm_object class whose pack_bytes() stores
+            the items. None pickles them.
+        :param spill_dir: Directory for the file
+        """
+        super().__init__(name, parent,
+                         queue=UVMSpillQueue(window, item_type, spill_dir))
+
+    def report_phase(self):
+        super().report_phase()
+        if self.queue.spill_count:
+            self.logger.info(
+                f"{self.queue.spill_count} items spilled to disk, "
+                f"at most {self.queue.peak_spilled} at once")
+
+    def final_phase(self):
+        super().final_phase()
+        self.queue.close()
 
 
 #    12.2.9.1
@@ -827,7 +1374,7 @@ class uvm_tlm_req_rsp_channel(uvm_component):
         self.put_request_export = self.req_tlm_fifo.put_export
         self.get_peek_response_export = self.rsp_tlm_fifo.get_peek_export
         self.get_peek_request_export = self.req_tlm_fifo.get_peek_export
-        self.put_response_export = self.rsp_tlm_fifo.put_export
+        self.put_response_export = self._make_put_response_export()
         self.request_ap = uvm_analysis_port("request_ap", self)
         self.response_ap = uvm_analysis_port("response_ap", self)
 
@@ -842,11 +1389,36 @@ class uvm_tlm_req_rsp_channel(uvm_component):
             get_peek_export=self.get_peek_request_export,
             put_export=self.put_response_export)
 
+    def _make_put_response_export(self):
+        """
+        :return: the export that the slave side puts responses
+            into. Subclasses override this to handle them another way.
+        """
+        return self.rsp_tlm_fifo.put_export
+
     def connect_phase(self):
         self.request_ap.connect(self.req_tlm_fifo.put_ap)
         self.response_ap.connect(self.rsp_tlm_fifo.get_ap)
 
 
+def _transaction_id(item):
+    return item.transaction_id
+
+
+# Stands in for a response that has not arrived
+_NO_RESPONSE = object()
+
+
+class _Outstanding:
+    """A request waiting in a uvm_tlm_transport_channel"""
+    __slots__ = ("response", "released", "event")
+
+    def __init__(self):
+        self.response = _NO_RESPONSE
+        self.released = False
+        self.event = None
+
+
 class uvm_tlm_transport_channel(uvm_tlm_req_rsp_channel):
     class uvm_TransportExport(uvm_transport_port):
         def __init__(self, name, parent, req_fifo, rsp_fifo):
@@ -855,22 +1427,577 @@ class uvm_tlm_transport_channel(uvm_tlm_req_rsp_channel):
             self.rsp_fifo = rsp_fifo
 
         async def transport(self, req):
-            self.req_fifo.put_export.put(req)
+            await self.req_fifo.put_export.put(req)
             return await self.rsp_fifo.get_peek_export.get()
 
+        async def transport_many(self, reqs):
+            return [await self.transport(req) for req in reqs]
+
         def nb_transport(self, req):
             if not self.req_fifo.put_export.try_put(req):
-                return False
+                return False, None
             return self.rsp_fifo.get_peek_export.try_get()
 
-    def __init__(self, name, parent=None):
-        super().__init__(name, parent, 1, 1)
-        self.transport_export = self.uvm_TransportExport(
-            "transport_export", self,
-            req_fifo=self.req_tlm_fifo,
-            rsp_fifo=self.rsp_tlm_fifo)
+    class uvm_OutstandingTransportExport(uvm_transport_port):
+        """
+        Sends a request without waiting for the responses to
+        earlier ones. The channel matches each response to its
+        request by transaction id.
+        """
+
+        def __init__(self, name, parent, channel):
+            super().__init__(name, parent)
+            self.channel = channel
+
+        async def transport(self, req):
+            entry = await self.channel._issue(req)
+            return await self.channel._response(entry)
+
+        async def transport_many(self, reqs):
+            """
+            Send all the requests before waiting for any response.
+
+            :param reqs: Iterable of requests
+            :return: list of the responses in request order
+            """
+            entries = [await self.channel._issue(req) for req in reqs]
+            return [await self.channel._response(entry)
+                    for entry in entries]
+
+        def nb_transport(self, req):
+            # The target answers after the request is sent, and a
+            # caller that does not wait could never collect it.
+            raise UVMError(
+                f"{self.channel.get_full_name()} is in outstanding "
+                "mode, which does not support nb_transport(). Use "
+                "transport() or transport_many().")
+
+    class uvm_ResponseExport(uvm_put_export):
+        """Hands each response to the transport() that waits for it"""
+
+        def __init__(self, name, parent, channel):
+            super().__init__(name, parent)
+            self.channel = channel
+
+        async def put(self, rsp):
+            self.channel._complete(rsp)
+
+        def try_put(self, rsp):
+            return self.channel._complete(rsp)
+
+        def can_put(self):
+            return True
+
+    def __init__(self, name, parent=None, outstanding=False,
+                 max_outstanding=0, ordered=True, txn_id=None):
+        """
+        :param name: Name of the channel
+        :param parent: Parent component
+        :param outstanding: Let transport() callers send requests
+            before the responses to earlier ones arrive
+        :param max_outstanding: Most requests waiting for responses
+            at once in outstanding mode. 0 is no limit.
+        :param ordered: Return responses in request order in
+            outstanding mode. False returns each one as it arrives.
+        :param txn_id: Function that returns the transaction id of
+            a request or response. The default reads transaction_id.
+        """
+        self.outstanding = outstanding
+        if not outstanding:
+            super().__init__(name, parent, 1, 1)
+            self.transport_export = self.uvm_TransportExport(
+                "transport_export", self,
+                req_fifo=self.req_tlm_fifo,
+                rsp_fifo=self.rsp_tlm_fifo)
+            return
+        super().__init__(name, parent, max_outstanding, 1)
+        self.max_outstanding = max_outstanding
+        self.ordered = ordered
+        self._txn_id = _transaction_id if txn_id is None else txn_id
+        # transaction id -> request waiting for its response
+        self._outstanding = {}
+        # Requests in the order they were sent, for ordered mode
+        self._issued = deque()
+        # Holds one token per outstanding request so that a full
+        # channel blocks transport() until a response frees a slot
+        self._slots = UVMQueue(max_outstanding) if max_outstanding else None
+        self.transport_export = self.uvm_OutstandingTransportExport(
+            "transport_export", self, self)
+
+    def _make_put_response_export(self):
+        if not self.outstanding:
+            return super()._make_put_response_export()
+        # Responses go straight to the transport() calls that
+        # wait for them rather than through the response FIFO
+        return self.uvm_ResponseExport("put_response_export", self, self)
+
+    def num_outstanding(self):
+        """
+        :return: Number of requests sent whose responses have not
+            been returned
+        """
+        if self.ordered:
+            return len(self._issued)
+        return len(self._outstanding)
+
+    async def _issue(self, req):
+        if self._slots is not None:
+            await self._slots.put(None)
+        txn_id = self._txn_id(req)
+        if txn_id in self._outstanding:
+            if self._slots is not None:
+                self._slots.get_nowait()
+            raise UVMError(
+                f"{self.get_full_name()} already has a request with "
+                f"transaction id {txn_id} outstanding")
+        entry = self._outstanding[txn_id] = _Outstanding()
+        if self.ordered:
+            self._issued.append(entry)
+        await self.put_request_export.put(req)
+        return entry
+
+    async def _response(self, entry):
+        if not entry.released:
+            entry.event = CocotbEvent()
+            await entry.event.wait()
+        return entry.response
+
+    def _complete(self, rsp):
+        """
+        Hand rsp to its request. An unmatched response is an error
+        in the target, so it is reported here and dropped rather
+        than raised into the target's put() call.
+
+        :return: True if rsp matched an outstanding request
+        """
+        txn_id = self._txn_id(rsp)
+        try:
+            entry = self._outstanding.pop(txn_id)
+        except KeyError:
+            self.logger.error(
+                f"{self.get_full_name()} dropped a response with "
+                f"transaction id {txn_id}, which matches no "
+                "outstanding request")
+            return False
+        entry.response = rsp
+        if not self.ordered:
+            self._release(entry)
+            self.response_ap.write(rsp)
+            return True
+        # Responses wait behind the earlier requests
+        issued = self._issued
+        released = []
+        while issued and issued[0].response is not _NO_RESPONSE:
+            entry = issued.popleft()
+            self._release(entry)
+            released.append(entry.response)
+        if released:
+            self.response_ap.write_batch(released)
+        return True
+
+    def _release(self, entry):
+        entry.released = True
+        if entry.event is not None:
+            entry.event.set()
+        if self._slots is not None:
+            self._slots.get_nowait()
+
 
 # UVM TLM 2
 # 12.3
+#
+# The sockets carry a uvm_tlm_generic_payload to a target that
+# models memory-mapped storage. Python has no inout arguments, so
+# b_transport() returns the updated delay and nb_transport_fw()
+# and nb_transport_bw() return (uvm_tlm_sync_e, phase, delay).
+# Delays are numbers in whatever time unit the models agree on.
+
+#   12.3.4.2.1
+class uvm_tlm_command_e(IntEnum):
+    UVM_TLM_READ_COMMAND = 0
+    UVM_TLM_WRITE_COMMAND = 1
+    UVM_TLM_IGNORE_COMMAND = 2
+
+
+#   12.3.4.2.2
+class uvm_tlm_response_status_e(IntEnum):
+    UVM_TLM_OK_RESPONSE = 1
+    UVM_TLM_INCOMPLETE_RESPONSE = 0
+    UVM_TLM_GENERIC_ERROR_RESPONSE = -1
+    UVM_TLM_ADDRESS_ERROR_RESPONSE = -2
+    UVM_TLM_COMMAND_ERROR_RESPONSE = -3
+    UVM_TLM_BURST_ERROR_RESPONSE = -4
+    UVM_TLM_BYTE_ENABLE_ERROR_RESPONSE = -5
+
+
+#   12.3.2.1
+class uvm_tlm_phase_e(IntEnum):
+    UNINITIALIZED_PHASE = 0
+    BEGIN_REQ = 1
+    END_REQ = 2
+    BEGIN_RESP = 3
+    END_RESP = 4
+
+
+#   12.3.2.2
+class uvm_tlm_sync_e(IntEnum):
+    UVM_TLM_ACCEPTED = 0
+    UVM_TLM_UPDATED = 1
+    UVM_TLM_COMPLETED = 2
+
+
+#   12.3.4.2
+class uvm_tlm_generic_payload(uvm_compact_transaction):
+    """
+    A memory-mapped bus transaction. data holds length bytes:
+    the bytes to write, or the buffer a read fills in. A
+    byte_enable of 0x00 and 0xFF bytes, repeated over the data,
+    selects the bytes to transfer. None transfers them all.
+    """
+    address = uvm_field(0)
+    command = uvm_field(uvm_tlm_command_e.UVM_TLM_IGNORE_COMMAND)
+    data = uvm_field(default_factory=bytearray, deep=True)
+    length = uvm_field(0)
+    byte_enable = uvm_field(None)
+    streaming_width = uvm_field(0)
+    response_status = uvm_field(
+        uvm_tlm_response_status_e.UVM_TLM_INCOMPLETE_RESPONSE)
+    dmi_allowed = uvm_field(False, compare=False)
+
+    def __init__(self, name="", address=0, command=None, data=None,
+                 length=None):
+        """
+        :param name: Object name
+        :param address: First byte address
+        :param command: uvm_tlm_command_e
+        :param data: bytes-like object. Writes copy it into a
+            bytearray.
+        :param length: Number of bytes. Defaults to len(data)
+        """
+        super().__init__(name)
+        self.address = address
+        if command is not None:
+            self.command = uvm_tlm_command_e(command)
+        if data is not None:
+            self.data = bytearray(data)
+        self.length = len(self.data) if length is None else length
+
+    def is_read(self):
+        return self.command == uvm_tlm_command_e.UVM_TLM_READ_COMMAND
+
+    def set_read(self):
+        self.command = uvm_tlm_command_e.UVM_TLM_READ_COMMAND
+
+    def is_write(self):
+        return self.command == uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND
+
+    def set_write(self):
+        self.command = uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND
+
+    def is_response_ok(self):
+        return self.response_status > 0
+
+    def is_response_error(self):
+        return self.response_status <= 0
+
+    def get_response_string(self):
+        return uvm_tlm_response_status_e(self.response_status).name
+
+
+class uvm_tlm_dmi:
+    """
+    Direct access to the storage of a target. get_direct_mem_ptr()
+    returns one so that bulk reads and writes slice memory instead
+    of calling b_transport() for each transaction.
+    """
+    __slots__ = ("dmi_ptr", "start_address", "end_address",
+                 "read_latency", "write_latency")
+
+    def __init__(self, dmi_ptr, start_address=0, write_allowed=True,
+                 read_latency=0, write_latency=0):
+        """
+        :param dmi_ptr: memoryview of the target's storage
+        :param start_address: Address of dmi_ptr[0]
+        :param write_allowed: False gives read-only access
+        :param read_latency: Delay a DMI read models
+        :param write_latency: Delay a DMI write models
+        """
+        dmi_ptr = memoryview(dmi_ptr).cast("B")
+        self.dmi_ptr = dmi_ptr if write_allowed else dmi_ptr.toreadonly()
+        self.start_address = start_address
+        self.end_address = start_address + len(self.dmi_ptr) - 1
+        self.read_latency = read_latency
+        self.write_latency = write_latency
+
+    def is_read_allowed(self):
+        return True
+
+    def is_write_allowed(self):
+        return not self.dmi_ptr.readonly
+
+    def _offset(self, address, length):
+        offset = address - self.start_address
+        if offset < 0 or offset + length > len(self.dmi_ptr):
+            raise UVMError(
+                f"{length} bytes at {address:#x} are outside the DMI "
+                f"region {self.start_address:#x}-{self.end_address:#x}")
+        return offset
+
+    def read(self, address, length):
+        """
+        :param address: Address of the first byte
+        :param length: Number of bytes
+        :return: memoryview of the bytes. It changes when the
+            storage does, so use bytes() to keep a copy.
+        """
+        offset = self._offset(address, length)
+        return self.dmi_ptr[offset:offset + length]
+
+    def write(self, address, data):
+        """
+        :param address: Address of the first byte
+        :param data: bytes-like object to store
+        """
+        if self.dmi_ptr.readonly:
+            raise UVMError(
+                f"DMI region {self.start_address:#x}-"
+                f"{self.end_address:#x} is read-only")
+        offset = self._offset(address, len(data))
+        self.dmi_ptr[offset:offset + len(data)] = data
+
+
+def _no_dmi(t):
+    return None
+
 
-# This is left for future development.
+class uvm_tlm_initiator_socket_base(uvm_port_base):
+    """Asks the target socket it connects to for DMI"""
+
+    @_forwards_to_export
+    def get_direct_mem_ptr(self, t):
+        """
+        :param t: uvm_tlm_generic_payload whose address and command
+            ask for access
+        :return: uvm_tlm_dmi or None if the target refuses
+        """
+        try:
+            get_direct_mem_ptr = self.export.get_direct_mem_ptr
+        except AttributeError:
+            raise UVMTLMConnectionError(
+                "Missing or wrong export in"
+                f" {self.get_full_name()}. Did you connect it?")
+        return get_direct_mem_ptr(t)
+
+
+class uvm_tlm_target_socket_base(uvm_export_base):
+    """
+    Hands the transport calls to imp, the component that
+    implements them. imp defaults to the parent. Targets
+    that do not implement get_direct_mem_ptr() refuse DMI.
+    """
+
+    def __init__(self, name, parent, imp=None):
+        super().__init__(name, parent)
+        self.imp = parent if imp is None else imp
+        # Initiators call imp without going through the socket
+        # unless a subclass overrides the method
+        if type(self).get_direct_mem_ptr \
+                is uvm_tlm_target_socket_base.get_direct_mem_ptr:
+            self.get_direct_mem_ptr = getattr(
+                self.imp, "get_direct_mem_ptr", _no_dmi)
+
+    def _check_imp(self, method):
+        if not hasattr(self.imp, method):
+            raise UVMTLMConnectionError(
+                f"{self.imp} must implement '{method}()' to "
+                f"provide {self.get_full_name()}")
+
+    def get_direct_mem_ptr(self, t):
+        return getattr(self.imp, "get_direct_mem_ptr", _no_dmi)(t)
+
+
+#   12.3.5.1
+class uvm_tlm_b_initiator_socket(uvm_tlm_initiator_socket_base):
+    """Calls b_transport() in the target socket it connects to"""
+
+    @_forwards_to_export
+    async def b_transport(self, t, delay=0):
+        """
+        :param t: uvm_tlm_generic_payload
+        :param delay: Delay before the transaction starts
+        :return: The delay after the target's annotation
+        """
+        try:
+            b_transport = self.export.b_transport
+        except AttributeError:
+            raise UVMTLMConnectionError(
+                "Missing or wrong export in"
+                f" {self.get_full_name()}. Did you connect it?")
+        return await b_transport(t, delay)
+
+
+#   12.3.5.2
+class uvm_tlm_b_target_socket(uvm_tlm_target_socket_base):
+    """Calls imp.b_transport()"""
+
+    def __init__(self, name, parent, imp=None):
+        super().__init__(name, parent, imp)
+        self._check_imp("b_transport")
+        if type(self).b_transport is uvm_tlm_b_target_socket.b_transport:
+            self.b_transport = self.imp.b_transport
+
+    async def b_transport(self, t, delay=0):
+        return await self.imp.b_transport(t, delay)
+
+
+#   12.3.5.3
+class uvm_tlm_nb_initiator_socket(uvm_tlm_initiator_socket_base):
+    """
+    Calls nb_transport_fw() in the target socket it connects to.
+    Connecting also gives the target socket imp.nb_transport_bw()
+    for the backward path. imp defaults to the parent.
+    """
+
+    def __init__(self, name, parent, imp=None):
+        super().__init__(name, parent)
+        self.imp = parent if imp is None else imp
+        if not hasattr(self.imp, "nb_transport_bw"):
+            raise UVMTLMConnectionError(
+                f"{self.imp} must implement 'nb_transport_bw()' to "
+                f"provide {self.get_full_name()}")
+
+    def connect(self, export):
+        # A target socket has one initiator. Claim it first so a
+        # refused connection leaves this socket unconnected.
+        if isinstance(export, uvm_tlm_nb_target_socket):
+            export._connect_initiator(self)
+        super().connect(export)
+
+    @_forwards_to_export
+    def nb_transport_fw(self, t, phase, delay=0):
+        """
+        :param t: uvm_tlm_generic_payload
+        :param phase: uvm_tlm_phase_e
+        :param delay: Delay before the phase starts
+        :return: (uvm_tlm_sync_e, phase, delay)
+        """
+        try:
+            nb_transport_fw = self.export.nb_transport_fw
+        except AttributeError:
+            raise UVMTLMConnectionError(
+                "Missing or wrong export in"
+                f" {self.get_full_name()}. Did you connect it?")
+        return nb_transport_fw(t, phase, delay)
+
+
+#   12.3.5.4
+class uvm_tlm_nb_target_socket(uvm_tlm_target_socket_base):
+    """
+    Calls imp.nb_transport_fw(). imp calls nb_transport_bw() on
+    this socket to reach the initiator.
+    """
+
+    def __init__(self, name, parent, imp=None):
+        super().__init__(name, parent, imp)
+        self._check_imp("nb_transport_fw")
+        if type(self).nb_transport_fw \
+                is uvm_tlm_nb_target_socket.nb_transport_fw:
+            self.nb_transport_fw = self.imp.nb_transport_fw
+        self.initiator = None
+
+    def _connect_initiator(self, initiator):
+        if self.initiator not in (None, initiator):
+            raise UVMTLMConnectionError(
+                f"{self.get_full_name()} is connected to "
+                f"{self.initiator.get_full_name()} and cannot also "
+                f"connect to {initiator.get_full_name()}")
+        self.initiator = initiator
+        self.nb_transport_bw = initiator.imp.nb_transport_bw
+
+    def nb_transport_fw(self, t, phase, delay=0):
+        return self.imp.nb_transport_fw(t, phase, delay)
+
+    def nb_transport_bw(self, t, phase, delay=0):
+        """
+        :param t: uvm_tlm_generic_payload
+        :param phase: uvm_tlm_phase_e
+        :param delay: Delay before the phase starts
+        :return: (uvm_tlm_sync_e, phase, delay)
+        """
+        raise UVMTLMConnectionError(
+            "No initiator socket is connected to "
+            f"{self.get_full_name()}")
+
+
+class uvm_tlm_memory(uvm_component):
+    """
+    A target that stores size bytes starting at base_address.
+    It completes b_transport() at once. A DMI request for an
+    address in the memory gets the whole of its storage, read-only
+    for a read command.
+    """
+
+    def __init__(self, name, parent, size, base_address=0,
+                 dmi_allowed=True):
+        """
+        :param name: Name of the memory
+        :param parent: Parent component
+        :param size: Number of bytes
+        :param base_address: Address of the first byte
+        :param dmi_allowed: Grant DMI requests
+        """
+        super().__init__(name, parent)
+        self.storage = bytearray(size)
+        self.base_address = base_address
+        self.dmi_allowed = dmi_allowed
+        self.target_socket = uvm_tlm_b_target_socket("target_socket",
+                                                     self)
+
+    async def b_transport(self, t, delay=0):
+        status = uvm_tlm_response_status_e
+        offset = t.address - self.base_address
+        length = t.length
+        end = offset + length
+        if offset < 0 or end > len(self.storage):
+            t.response_status = status.UVM_TLM_ADDRESS_ERROR_RESPONSE
+        elif 0 < t.streaming_width < length:
+            t.response_status = status.UVM_TLM_BURST_ERROR_RESPONSE
+        elif t.is_write() and len(t.data) < length:
+            t.response_status = status.UVM_TLM_GENERIC_ERROR_RESPONSE
+        else:
+            if t.byte_enable:
+                self._transfer_enabled(t, offset)
+            elif t.is_read():
+                t.data[:length] = self.storage[offset:end]
+            elif t.is_write():
+                self.storage[offset:end] = t.data[:length]
+            t.dmi_allowed = self.dmi_allowed
+            t.response_status = status.UVM_TLM_OK_RESPONSE
+        return delay
+
+    def _transfer_enabled(self, t, offset):
+        enables = t.byte_enable
+        if t.is_read():
+            if len(t.data) < t.length:
+                t.data.extend(bytes(t.length - len(t.data)))
+            for ii in range(t.length):
+                if enables[ii % len(enables)]:
+                    t.data[ii] = self.storage[offset + ii]
+        elif t.is_write():
+            for ii in range(t.length):
+                if enables[ii % len(enables)]:
+                    self.storage[offset + ii] = t.data[ii]
+
+    def get_direct_mem_ptr(self, t):
+        """
+        :param t: uvm_tlm_generic_payload. Sets its dmi_allowed.
+        :return: uvm_tlm_dmi or None if DMI is not allowed or the
+            address is outside the memory
+        """
+        offset = t.address - self.base_address
+        t.dmi_allowed = self.dmi_allowed \
+            and 0 <= offset < len(self.storage)
+        if not t.dmi_allowed:
+            return None
+        return uvm_tlm_dmi(self.storage, self.base_address,
+                           write_allowed=not t.is_read())
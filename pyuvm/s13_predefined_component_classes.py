@@ -57,11 +57,8 @@ class uvm_agent(uvm_component):
 
     def build_phase(self):
         super().build_phase()
-        self.is_active = uvm_active_passive_enum.UVM_ACTIVE
-        try:
-            self.is_active = self.cdb_get("is_active")
-        except error_classes.UVMConfigItemNotFound:
-            self.is_active = uvm_active_passive_enum.UVM_ACTIVE
+        self.is_active = self.cdb_get(
+            "is_active", default=uvm_active_passive_enum.UVM_ACTIVE)
 
         if self.is_active not in list(uvm_active_passive_enum):
             self.logger.warning(f"{self.get_full_name()}"
@@ -103,20 +100,45 @@ class uvm_driver(uvm_component):
 # 13.9
 class uvm_subscriber(uvm_component):
     class uvm_AnalysisImp(uvm_analysis_export):
-        def __init__(self, name, parent, write_fn):
+        def __init__(self, name, parent, write_fn, write_batch_fn=None):
             super().__init__(name, parent)
             self.write_fn = write_fn
+            self.write_batch_fn = write_batch_fn
+            # Analysis ports call write_fn without going through
+            # this class unless a subclass overrides write().
+            if type(self).write is uvm_subscriber.uvm_AnalysisImp.write:
+                self.write = write_fn
+            if write_batch_fn is None:
+                self.write_batch = None
+            elif (type(self).write_batch
+                  is uvm_subscriber.uvm_AnalysisImp.write_batch):
+                self.write_batch = write_batch_fn
 
         def write(self, tt):
             self.write_fn(tt)
 
+        def write_batch(self, items):
+            self.write_batch_fn(items)
+
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.analysis_export = self.uvm_AnalysisImp("analysis_export",
                                                     self,
-                                                    self.write)
+                                                    self.write,
+                                                    self.write_batch)
 
     def write(self, tt):
         raise error_classes.UVMFatalError(
             "You must override the write() method in"
             f"uvm_subscriber {self.get_full_name()}")
+
+    def write_batch(self, items):
+        """
+        Receive a list or other sequence of transactions from
+        uvm_analysis_port.write_batch(). Override this to process
+        them together. By default it calls write() for each one.
+
+        :param items: sequence of transactions
+        """
+        for tt in items:
+            self.write(tt)
@@ -1,22 +1,78 @@
 from pyuvm.s06_reporting_classes import uvm_report_object
 from pyuvm.s08_factory_classes import uvm_factory
 from pyuvm.s09_phasing import uvm_common_phases, uvm_run_phase, uvm_build_phase
+from pyuvm.s09_phasing import uvm_end_of_elaboration_phase
 from pyuvm import error_classes, INFO
 from pyuvm import utility_classes
 import logging
 import fnmatch
 import string
+import time
+from collections import Counter
+from collections.abc import Mapping
 from cocotb.log import SimColourLogFormatter, SimTimeContextFilter
+from cocotb.triggers import Event
+
+# Tells cdb_get() that no default was passed
+_NO_DEFAULT = object()
+
+
+class ComponentDict(dict):
+    """
+    The dict of components by full name. A name that is missing
+    may be a child its parent builds on first use, such as a
+    FIFO export, so the parent is asked for it. [], get() and in
+    find those children. Iterating, len(), keys(), values() and
+    items() cover only the components built so far. names()
+    lists every name.
+    """
+
+    def __missing__(self, full_name):
+        parent_name, _, name = full_name.rpartition(".")
+        parent = dict.get(self, parent_name)
+        child = None if parent is None else parent.get_child(name)
+        if child is None:
+            raise KeyError(full_name)
+        return child
+
+    def __contains__(self, full_name):
+        if dict.__contains__(self, full_name):
+            return True
+        parent_name, _, name = full_name.rpartition(".")
+        parent = dict.get(self, parent_name)
+        return parent is not None and parent.has_child(name)
+
+    def get(self, full_name, default=None):
+        try:
+            return self[full_name]
+        except KeyError:
+            return default
+
+    def names(self):
+        """
+        :return: list of every component full name, including
+                 the children that are not built yet
+        """
+        names = list(self)
+        for full_name, comp in list(self.items()):
+            names.extend(f"{full_name}.{name}"
+                         for name in comp._unbuilt_child_names())
+        return names
 
 
 # 13.1.1
 class uvm_component(uvm_report_object):
 
-    component_dict = {}
+    component_dict = ComponentDict()
 
     @classmethod
     def clear_components(cls):
-        cls.component_dict = {}
+        cls.component_dict = ComponentDict()
+
+    @staticmethod
+    def _parent_or_root(parent):
+        """The parent a new component gets when passed parent"""
+        return uvm_root() if parent is None else parent
 
     def __init__(self, name, parent):
         """
@@ -84,17 +140,41 @@ class uvm_component(uvm_report_object):
 
         ConfigDB().set(self, inst_path, label, value)
 
-    def cdb_get(self, label, inst_path=""):
+    def cdb_get(self, label, inst_path="", default=_NO_DEFAULT):
         """
         Retrieve an object from the config_db using this components
         get_full_name() path. Can find objects stored with wildcards
 
         :param inst_path: The path below this component
         :param label: The label used to store the value
+        :param default: If given, returned instead of raising
+                        UVMConfigItemNotFound when there is no match
         :return: The object at this path stored at the label
         """
-        datum = ConfigDB().get(self, inst_path, label)
-        return datum
+        if default is _NO_DEFAULT:
+            return ConfigDB().get(self, inst_path, label)
+        return ConfigDB().get_or(self, inst_path, label, default)
+
+    def cdb_set_many(self, settings, inst_path="*"):
+        """
+        Store many objects in the config_db at one path.
+
+        :param settings: A mapping of labels to values or an
+                         object whose public attributes are stored
+        :param inst_path: A path with globs or if left blank
+                          the get_full_name() path
+        """
+        ConfigDB().set_many(self, inst_path, settings)
+
+    async def cdb_wait_modified(self, label, inst_path=""):
+        """
+        Block until the config_db object at this component's
+        get_full_name() path and label is set.
+
+        :param label: The label used to store the value
+        :param inst_path: The path below this component
+        """
+        await ConfigDB().wait_modified(self, inst_path, label)
 
     @property
     def parent(self):
@@ -160,6 +240,37 @@ class uvm_component(uvm_report_object):
         self._children[name] = child
         pass
 
+    def check_new_children(self, names):
+        """
+        Check names before building children with them
+
+        :param names: The names of the children to be built
+        :raises AssertionError: if a name repeats or is taken
+        """
+        taken = set(self._children)
+        for name in names:
+            assert (name not in taken), \
+                f"{self.get_full_name()} already has a child named {name}"
+            taken.add(name)
+
+    def remove_child(self, name):
+        """
+        Remove the child and the components below it from the
+        hierarchy, such as a child whose __init__() raised.
+
+        :param name: Name of the child
+        :return: None
+        """
+        child = self._children.pop(name, None)
+        if child is None:
+            return
+        full_name = child.get_full_name()
+        below = full_name + "."
+        comp_dict = uvm_component.component_dict
+        for path in [path for path in comp_dict
+                     if path == full_name or path.startswith(below)]:
+            del comp_dict[path]
+
     @property
     def hierarchy(self):
         """
@@ -211,6 +322,10 @@ class uvm_component(uvm_report_object):
         except KeyError:
             return None
 
+    def _unbuilt_child_names(self):
+        """Names of the children built on first use"""
+        return ()
+
     def get_num_children(self):
         """
         13.1.3.5
@@ -271,7 +386,7 @@ class uvm_component(uvm_report_object):
         :return: None
         """
         self.set_logging_level(logging_level)
-        for child in self.children:
+        for child in self._children.values():
             child.set_logging_level_hier(logging_level)
 
     def add_logging_handler_hier(self, handler):
@@ -283,7 +398,7 @@ class uvm_component(uvm_report_object):
         assert isinstance(handler, logging.Handler), \
             f"You can only add logging.Handler objects not {type(handler)}"
         self.add_logging_handler(handler)
-        for child in self.children:
+        for child in self._children.values():
             child.add_logging_handler_hier(handler)
 
     def remove_logging_handler_hier(self, handler):
@@ -295,17 +410,17 @@ class uvm_component(uvm_report_object):
         assert isinstance(handler, logging.Handler), \
             f"You must pass a logging.Handler not {type(handler)}"
         self.logger.removeHandler(handler)
-        for child in self.children:
+        for child in self._children.values():
             child.remove_logging_handler_hier(handler)
 
     def remove_streaming_handler_hier(self):
         self.remove_streaming_handler()
-        for child in self.children:
+        for child in self._children.values():
             child.remove_streaming_handler_hier()
 
     def disable_logging_hier(self):
         self.disable_logging()
-        for child in self.children:
+        for child in self._children.values():
             child.disable_logging_hier()
 
     def build_phase(self):
@@ -376,6 +491,8 @@ class uvm_root(uvm_component, metaclass=utility_classes.UVM_ROOT_Singleton):
     def clear_singletons(cls, keep_set={}):
         keepers = {uvm_factory, utility_classes.FactoryData}.union(keep_set)
         utility_classes.Singleton.clear_singletons(keep=keepers)
+        # Each test numbers its transactions and sequences from 1
+        utility_classes.IdAllocator.reset_per_test()
 
     def __init__(self):
         super().__init__("uvm_root", None)
@@ -415,6 +532,9 @@ class uvm_root(uvm_component, metaclass=utility_classes.UVM_ROOT_Singleton):
             self.logger.log(utility_classes.PYUVM_DEBUG,
                             str(self.running_phase))
             self.running_phase.traverse(self.uvm_test_top)
+            if self.running_phase == uvm_end_of_elaboration_phase:
+                if ConfigDB.freeze_after_elaboration:
+                    ConfigDB().freeze()
             if self.running_phase == uvm_run_phase:
                 await utility_classes.ObjectionHandler().run_phase_complete()  # noqa: E501
 
@@ -435,9 +555,106 @@ class uvm_root(uvm_component, metaclass=utility_classes.UVM_ROOT_Singleton):
 # our class is named ConfigDB.
 
 
+class ConfigDBStats(utility_classes.UVMStats):
+    """
+    Access counters for the ConfigDB. Turn them on with
+    ConfigDB().enable_stats() or by setting ConfigDB.collect_stats
+    before the ConfigDB is created.
+    """
+
+    def __init__(self):
+        self.field_gets = Counter()
+        self.path_gets = Counter()
+        self.field_sets = Counter()
+        self.path_sets = Counter()
+        self.misses = Counter()
+        self.field_time = Counter()
+        self.field_set_time = Counter()
+        self.get_time = 0.0
+        self.set_time = 0.0
+        self.set_keys = set()
+        self.used_keys = set()
+
+    def record_get(self, inst_name, field_name, source, elapsed):
+        """
+        :param inst_name: The path that was looked up
+        :param field_name: The field that was looked up
+        :param source: The stored path that supplied the value or None
+        :param elapsed: Seconds spent in the lookup
+        """
+        self.field_gets[field_name] += 1
+        self.path_gets[inst_name] += 1
+        self.field_time[field_name] += elapsed
+        self.get_time += elapsed
+        if source is None:
+            self.misses[(inst_name, field_name)] += 1
+        else:
+            self.used_keys.add((source, field_name))
+
+    def record_set(self, inst_name, field_names, elapsed):
+        """
+        :param inst_name: The path that was set
+        :param field_names: The fields set at that path
+        :param elapsed: Seconds spent in the set, shared evenly
+                        among the fields
+        """
+        self.path_sets[inst_name] += len(field_names)
+        self.set_time += elapsed
+        share = elapsed / len(field_names) if field_names else 0.0
+        for field_name in field_names:
+            self.field_sets[field_name] += 1
+            self.field_set_time[field_name] += share
+            self.set_keys.add((inst_name, field_name))
+
+    def unused_sets(self):
+        """
+        :return: sorted list of (path, field_name) that no get() used
+        """
+        return sorted(self.set_keys - self.used_keys)
+
+    def summary(self):
+        return (f"ConfigDB gets: {sum(self.field_gets.values())}  "
+                f"misses: {sum(self.misses.values())}  "
+                f"sets: {sum(self.field_sets.values())}  "
+                f"get time: {self.get_time:.6f}s  "
+                f"set time: {self.set_time:.6f}s")
+
+    def tables(self, top_n):
+        """The busiest fields and paths, misses, and unused sets"""
+        busy_fields = (self.field_gets + self.field_sets).most_common(top_n)
+        fields = [(field, self.field_gets[field], self.field_sets[field],
+                   self.field_time[field], self.field_set_time[field])
+                  for field, _ in busy_fields]
+        busy_paths = (self.path_gets + self.path_sets).most_common(top_n)
+        paths = [(path, self.path_gets[path], self.path_sets[path])
+                 for path, _ in busy_paths]
+        misses = [(path, field, count) for (path, field), count
+                  in self.misses.most_common(top_n)]
+        return [
+            ([("FIELD", 30, ""), ("GETS", 8, "d"), ("SETS", 8, "d"),
+              ("GET TIME(s)", 12, ".6f"), ("SET TIME(s)", 12, ".6f")],
+             fields),
+            ([("PATH", 30, ""), ("GETS", 8, "d"), ("SETS", 8, "d")],
+             paths),
+            ([("MISSED PATH", 30, ""), ("FIELD", 20, ""),
+              ("MISSES", 8, "d")], misses),
+            ([("UNUSED SET PATH", 30, ""), ("FIELD", 20, "")],
+             self.unused_sets()[:top_n]),
+        ]
+
+
 class ConfigDB(metaclass=utility_classes.Singleton):
     default_precedence = 1000
+    # Returned by get_or() lookups that find nothing
+    MISSING = object()
+    # Set to True to freeze() the db after end_of_elaboration_phase
+    freeze_after_elaboration = False
+    # Set to True to raise on set() while frozen rather than thaw
+    reject_sets_when_frozen = False
+    # Set to True to create new ConfigDBs with stats enabled
+    collect_stats = False
     legal_chars = set(string.ascii_letters) | set(string.digits) | set("_.")
+    glob_chars = set("*?[")
     """
     A path-based singleton storage system
     """
@@ -468,13 +685,39 @@ class ConfigDB(metaclass=utility_classes.Singleton):
         self.logger_holder.logger.propagate = False
         self._path_dict = {}
         self.is_tracing = False
+        # wait_modified() events indexed by field_name then inst_name
         self._cond_dict = {}
+        self._frozen = None
+        self.stats = ConfigDBStats() if self.collect_stats else None
+
+    def enable_stats(self):
+        """Start counting gets, sets, and misses from zero"""
+        self.stats = ConfigDBStats()
+
+    def disable_stats(self):
+        self.stats = None
+
+    def print_stats(self, top_n=10):
+        """
+        Log the top_n busiest fields and paths, the misses,
+        and the sets that no get() used.
+        :return: The report string or None if stats are disabled
+        """
+        return utility_classes.log_stats(self.logger_holder.logger,
+                                         "ConfigDB", self.stats, top_n)
 
     def clear(self):
-        """Reset the ConfigDB. Used for testing."""
+        """
+        Reset the ConfigDB. Used for testing. This drops pending
+        wait_modified() events and zeroes the stats if they are on.
+        """
         if self.is_tracing:
             self.logger_holder.logger.info("CFGDB/CLEAR: Clearing ConfigDB()")
         self._path_dict = {}
+        self._cond_dict = {}
+        self._frozen = None
+        if self.stats is not None:
+            self.stats = ConfigDBStats()
 
     @staticmethod
     def _get_context_inst_name(context, inst_name):
@@ -512,12 +755,27 @@ class ConfigDB(metaclass=utility_classes.Singleton):
         :param value: The object to be stored
         :return: None
         """
-
+        if self.stats is None:
+            self._set(context, inst_name, field_name, value)
+            return
+        start = time.perf_counter()
+        inst_name = self._set(context, inst_name, field_name, value)
+        self.stats.record_set(inst_name, (field_name,),
+                              time.perf_counter() - start)
+
+    def _set(self, context, inst_name, field_name, value):
+        """The store behind set(). Returns the full inst_name."""
         if not set(field_name).issubset(self.legal_chars):
             raise error_classes.UVMNotImplemented(
                 f"pyuvm does not allow wildcards in key names ({field_name})"
             )
 
+        if self._frozen is not None:
+            if self.reject_sets_when_frozen:
+                raise error_classes.UVMConfigError(
+                    f"ConfigDB is frozen. Cannot set {field_name}")
+            self.thaw()
+
         context, inst_name = self._get_context_inst_name(context, inst_name)
 
         if inst_name not in self._path_dict:
@@ -534,49 +792,100 @@ class ConfigDB(metaclass=utility_classes.Singleton):
 
         self.trace("SET", context, inst_name, field_name, value)
 
-    def get(self, context, inst_name, field_name):
-        """
-        The component path matches against the paths in the ConfigDB. The path
-        cannot have wildcards, but can match against keys with wildcards.
-        Return the value stored at key. Raise UVMConfigError if there is no key
+        field_conds = self._cond_dict.get(field_name)
+        if field_conds:
+            self._notify_modified(field_conds, inst_name)
+        return inst_name
 
-        :param inst_name: component full path with no wildcards
-        :param field_name: the field_name being retrieved
-        :param context: The component making the call
-        :return: value found at location
+    def set_many(self, context, inst_name, settings):
         """
-        if not set(inst_name).issubset(self.legal_chars):
-            raise error_classes.UVMError(
-                f'"{inst_name}" is illegal: '
-                f'inst_name wildcards only allowed when storing.')
+        Stores many objects at one inst_name. This does the path and
+        precedence work of set() once for the whole batch.
+        :param context: A handle to a component
+        :param inst_name: The instance name within the component
+        :param settings: A mapping of field names to values, or an object
+                         whose public attributes are the fields
+        :return: None
+        """
+        if self.stats is None:
+            self._set_many(context, inst_name, settings)
+            return
+        start = time.perf_counter()
+        inst_name, field_names = self._set_many(context, inst_name, settings)
+        self.stats.record_set(inst_name, field_names,
+                              time.perf_counter() - start)
+
+    def _set_many(self, context, inst_name, settings):
+        """
+        The store behind set_many(). Returns the full inst_name
+        and the field names that were set.
+        """
+        if not isinstance(settings, Mapping):
+            settings = {name: value for name, value in vars(settings).items()
+                        if not name.startswith("_")}
+
+        illegal = [field_name for field_name in settings
+                   if not self.legal_chars.issuperset(field_name)]
+        if len(illegal) > 0:
+            raise error_classes.UVMNotImplemented(
+                f"pyuvm does not allow wildcards in key names ({illegal})")
+
+        if self._frozen is not None:
+            if self.reject_sets_when_frozen:
+                raise error_classes.UVMConfigError(
+                    f"ConfigDB is frozen. Cannot set {list(settings)}")
+            self.thaw()
 
         context, inst_name = self._get_context_inst_name(context, inst_name)
 
-        key_matches = []  # Make the linter happy by setting this.
-        try:
-            # key_matches = [dk for dk in self._path_dict.keys()
-            #                if fnmatch.fnmatch(inst_name, dk)]
-            for dk in self._path_dict.keys():
-                if fnmatch.fnmatch(inst_name, dk):
-                    key_matches.append(dk)
+        precedence = self.default_precedence
+        if uvm_root().running_phase is uvm_build_phase:
+            precedence = self.default_precedence - context.get_depth()
+
+        path_fields = self._path_dict.setdefault(inst_name, {})
+        for field_name, value in settings.items():
+            path_fields.setdefault(field_name, {})[precedence] = value
+
+        if self.is_tracing:
+            for field_name, value in settings.items():
+                self.trace("SET", context, inst_name, field_name, value)
+        if self._cond_dict:
+            for field_name in settings:
+                field_conds = self._cond_dict.get(field_name)
+                if field_conds:
+                    self._notify_modified(field_conds, inst_name)
+        return inst_name, list(settings)
+
+    @staticmethod
+    def _notify_modified(field_conds, inst_name):
+        """
+        Fire and discard the wait_modified() events whose path
+        matches the inst_name that was just set. An inst_name
+        without globs is a single dict lookup.
+        """
+        if ConfigDB.glob_chars.isdisjoint(inst_name):
+            matches = [inst_name] if inst_name in field_conds else []
+        else:
+            matches = [path for path in field_conds
+                       if fnmatch.fnmatch(path, inst_name)]
+        for path in matches:
+            field_conds.pop(path).set()
+
+    def _matching_paths(self, inst_name):
+        """
+        Return the stored paths that match inst_name sorted from
+        most specific to most greedy.
+        """
+        key_matches = [dk for dk in self._path_dict.keys()
+                       if fnmatch.fnmatch(inst_name, dk)]
+        if len(key_matches) == 0:
+            return key_matches
 
-        except TypeError:
-            raise error_classes.UVMConfigItemNotFound(
-                f'"{inst_name}" is not in ConfigDB().')
-        finally:
-            if len(key_matches) == 0:
-                raise error_classes.UVMConfigItemNotFound(
-                    f'"{inst_name}" is not in ConfigDB().')
         # Here we sort the list of paths by which paths are "in" other
         # paths. That is A comes before '*'  A.B comes before A.*, etc.
         # We use an insertion sort. A path is inserted in front of the
         # first path it is "in"
-        sorted_paths = []
-        try:
-            sorted_paths.append(key_matches.pop())
-        except IndexError:
-            raise error_classes.UVMConfigItemNotFound(
-                f"{inst_name} not in ConfigDB()")
+        sorted_paths = [key_matches.pop()]
 
         # Sort the matching keys from most specific to
         # most greedy. A.B.C before A.B.* before A.* before *
@@ -589,22 +898,141 @@ class ConfigDB(metaclass=utility_classes.Singleton):
                     break
             if not inserted:
                 sorted_paths.append(path)
-        value = None
+        return sorted_paths
+
+    def _resolve(self, sorted_paths, field_name):
+        """
+        Return (path, value) for the highest precedence value of
+        field_name in the first of sorted_paths that holds it,
+        or (None, ConfigDB.MISSING).
+        """
         for path in sorted_paths:
-            try:
-                component_fields = self._path_dict[path]
-                matching_path_fields = component_fields[field_name]
-                max_precedence = max(matching_path_fields.keys())
-                value = matching_path_fields[max_precedence]
-                break
-            except KeyError:
-                pass
-        if value is not None:
-            self.trace("GET", context, inst_name, field_name, value)
-            return value
-        else:
+            matching_path_fields = self._path_dict[path].get(field_name)
+            if matching_path_fields is not None:
+                value = matching_path_fields[max(matching_path_fields)]
+                # A stored None is treated as a miss
+                if value is None:
+                    return None, self.MISSING
+                return path, value
+        return None, self.MISSING
+
+    def _lookup(self, context, inst_name, field_name):
+        """
+        The lookup behind get(), get_or(), and exists(). Returns
+        (context, inst_name, value) where value is the
+        ConfigDB.MISSING sentinel if nothing matches. It raises
+        nothing on a miss so that optional lookups stay cheap.
+        """
+        if self.stats is None:
+            context, inst_name, _, value = self._search(
+                context, inst_name, field_name)
+            return context, inst_name, value
+        start = time.perf_counter()
+        context, inst_name, source, value = self._search(
+            context, inst_name, field_name)
+        self.stats.record_get(inst_name, field_name, source,
+                              time.perf_counter() - start)
+        return context, inst_name, value
+
+    def _search(self, context, inst_name, field_name):
+        """
+        Returns (context, inst_name, source, value) where source
+        is the stored path that supplied the value.
+        """
+        if not set(inst_name).issubset(self.legal_chars):
+            raise error_classes.UVMError(
+                f'"{inst_name}" is illegal: '
+                f'inst_name wildcards only allowed when storing.')
+
+        context, inst_name = self._get_context_inst_name(context, inst_name)
+
+        if self._frozen is not None:
+            frozen_fields = self._frozen.get(inst_name)
+            if frozen_fields is not None:
+                source, value = frozen_fields.get(field_name,
+                                                  (None, self.MISSING))
+                return context, inst_name, source, value
+
+        try:
+            sorted_paths = self._matching_paths(inst_name)
+        except TypeError:
+            return context, inst_name, None, self.MISSING
+        source, value = self._resolve(sorted_paths, field_name)
+        return context, inst_name, source, value
+
+    def freeze(self):
+        """
+        Precompute the value of every field for every component
+        full name so that later get() calls from components are a
+        single dict lookup. Paths that are not component names
+        still go through the glob search. A set() after freezing
+        thaws the db unless reject_sets_when_frozen is True.
+        """
+        field_names = set()
+        for fields in self._path_dict.values():
+            field_names.update(fields)
+        frozen = {}
+        for inst_name in ["", *uvm_component.component_dict.names()]:
+            sorted_paths = self._matching_paths(inst_name)
+            values = {}
+            for field_name in field_names:
+                source, value = self._resolve(sorted_paths, field_name)
+                if value is not self.MISSING:
+                    values[field_name] = (source, value)
+            frozen[inst_name] = values
+        self._frozen = frozen
+        if self.is_tracing:
+            self.logger_holder.logger.info(
+                f"CFGDB/FREEZE: Froze {len(frozen)} paths")
+
+    def thaw(self):
+        """Discard the frozen snapshot so get() searches again."""
+        if self._frozen is not None and self.is_tracing:
+            self.logger_holder.logger.info("CFGDB/THAW: Thawing ConfigDB()")
+        self._frozen = None
+
+    @property
+    def is_frozen(self):
+        return self._frozen is not None
+
+    def get(self, context, inst_name, field_name):
+        """
+        The component path matches against the paths in the ConfigDB. The path
+        cannot have wildcards, but can match against keys with wildcards.
+        Return the value stored at key. Raise UVMConfigError if there is no key
+
+        :param inst_name: component full path with no wildcards
+        :param field_name: the field_name being retrieved
+        :param context: The component making the call
+        :return: value found at location
+        """
+        context, inst_name, value = self._lookup(context, inst_name,
+                                                 field_name)
+        if value is self.MISSING:
             raise error_classes.UVMConfigItemNotFound(
                 f'"Component {inst_name} has no key: {field_name}')
+        self.trace("GET", context, inst_name, field_name, value)
+        return value
+
+    def get_or(self, context, inst_name, field_name, default):
+        """
+        Like get(), but returns default instead of raising
+        UVMConfigItemNotFound when there is nothing at this location.
+        Pass ConfigDB.MISSING as the default to test for a miss
+        without confusing it with a stored value.
+
+        :param context: None or uvm_component
+        :param inst_name: instance name string in context
+        :param field_name: key name for location
+        :param default: returned if there is no match
+        :return: value found at location or default
+        """
+        context, inst_name, value = self._lookup(context, inst_name,
+                                                 field_name)
+        if value is self.MISSING:
+            return default
+        self.trace("GET", context, inst_name, field_name, value)
+        return value
 
     def exists(self, context, inst_name, field_name):
         """
@@ -614,15 +1042,32 @@ class ConfigDB(metaclass=utility_classes.Singleton):
         :param field_name: key name for location
         :return: True if exists
         """
+        _, _, value = self._lookup(context, inst_name, field_name)
+        return value is not self.MISSING
+
+    async def wait_modified(self, context, inst_name, field_name):
+        """
+        Block until a set() stores field_name at a path that
+        matches this location. All waiters on the same location
+        share one event.
+
+        :param context: None or uvm_component
+        :param inst_name: instance name string in context, no wildcards
+        :param field_name: key name for location
+        :return: None
+        """
+        if not set(inst_name).issubset(self.legal_chars):
+            raise error_classes.UVMError(
+                f'"{inst_name}" is illegal: '
+                f'inst_name wildcards only allowed when storing.')
+        _, inst_name = self._get_context_inst_name(context, inst_name)
+        field_conds = self._cond_dict.setdefault(field_name, {})
         try:
-            _ = self.get(context, inst_name, field_name)
-        except error_classes.UVMConfigItemNotFound:
-            return False
-        return True
-
-    def wait_modified(self):
-        raise error_classes.UVMNotImplemented(
-            "wait_modified not implemented pending requests for it.")
+            event = field_conds[inst_name]
+        except KeyError:
+            event = Event(f"{inst_name} {field_name} modified")
+            field_conds[inst_name] = event
+        await event.wait()
 
     def __str__(self):
         str_list = [f"\n{'PATH':20}: {'KEY':10}: {'DATA':30}"]
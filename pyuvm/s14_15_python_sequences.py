@@ -8,7 +8,12 @@
 
 
 from pyuvm.s05_base_classes import *
+from pyuvm.s05_base_classes import _partial_reset, _uvm_transaction
 from pyuvm.s12_uvm_tlm_interfaces import *
+from pyuvm.s12_uvm_tlm_interfaces import _forwards_to_export
+from pyuvm.utility_classes import IdAllocator
+from collections import deque
+
 from cocotb.triggers import Event as CocotbEvent
 
 # The sequence system allows users to create and populate sequence
@@ -95,53 +100,132 @@ from cocotb.triggers import Event as CocotbEvent
 class ResponseQueue(UVMQueue):
     """
     Returns either the next response or the item with the id.
+    Responses are indexed by transaction_id so finding one
+    does not search the queue.
     """
 
     def __init__(self, maxsize: int = 0):
         super().__init__(maxsize=maxsize)
         self.put_event = CocotbEvent("put event")
+        # transaction_id -> deque of queued responses with that id
+        self._by_id = {}
+        # transaction_id -> event for get_response() calls waiting
+        self._id_waiters = {}
+
+    def _put(self, item):
+        super()._put(item)
+        txn_id = getattr(item, "transaction_id", None)
+        if txn_id is not None:
+            try:
+                self._by_id[txn_id].append(item)
+            except KeyError:
+                self._by_id[txn_id] = deque((item,))
+            event = self._id_waiters.pop(txn_id, None)
+            if event is not None:
+                event.set()
+
+    def _get(self):
+        item = super()._get()
+        txn_id = getattr(item, "transaction_id", None)
+        if txn_id is not None:
+            items = self._by_id[txn_id]
+            items.popleft()
+            if not items:
+                del self._by_id[txn_id]
+        return item
+
+    def _put_many(self, items):
+        for item in items:
+            self._put(item)
+
+    def _get_many(self, n):
+        return [self._get() for _ in range(min(n, len(self._queue)))]
 
     def put_nowait(self, item):
         super().put_nowait(item)
         self.put_event.set()
         self.put_event.clear()
 
+    def put_nowait_many(self, items):
+        super().put_nowait_many(items)
+        self.put_event.set()
+        self.put_event.clear()
+
     async def get_response(self, txn_id=None):
         if txn_id is None:
             return await self.get()
-        else:
-            while True:
-                item_list = list(self._queue)
-                txn_list = [xx
-                            for xx in item_list
-                            if xx.transaction_id == txn_id]
-                if len(txn_list) == 0:
-                    await self.put_event.wait()
-                else:
-                    assert len(txn_list) == 1, \
-                        f"Multiple transactionsn have the same ID: {txn_id}"
-                    _ = self._queue.index(txn_list[0])
-                    self._queue.remove(txn_list[0])
-                    return txn_list[0]
+        while txn_id not in self._by_id:
+            try:
+                event = self._id_waiters[txn_id]
+            except KeyError:
+                event = self._id_waiters[txn_id] = CocotbEvent()
+            await event.wait()
+        items = self._by_id[txn_id]
+        assert len(items) == 1, \
+            f"Multiple transactions have the same ID: {txn_id}"
+        del self._by_id[txn_id]
+        item = items[0]
+        # deque.index() compares with ==, so check that it found
+        # this object and not an equal response queued before it.
+        index = self._queue.index(item)
+        if self._queue[index] is not item:
+            index = next(ii for ii, queued in enumerate(self._queue)
+                         if queued is item)
+        del self._queue[index]
+        self._wake_putters()
+        return item
 
     def __str__(self):
         return str([str(xx) for xx in self._queue])
 
 
-class uvm_sequence_item(uvm_transaction):
+class _uvm_sequence_item(_uvm_transaction):
     """
-    The pyuvm uvm_sequence_item has conditions to
-    implement start_item() and finish_item()
+    The methods of uvm_sequence_item, without a __dict__
     """
 
+    __slots__ = ("_start_condition", "_finish_condition", "_item_ready",
+                 "parent_sequence_id", "response_id")
+
     def __init__(self, name):
         super().__init__(name)
-        self.start_condition = CocotbEvent()
-        self.finish_condition = CocotbEvent()
-        self.item_ready = CocotbEvent()
+        # The events are made when a sequencer first uses them.
+        # Items that never pass through one, such as monitor
+        # transactions, do not carry them.
+        self._start_condition = None
+        self._finish_condition = None
+        self._item_ready = None
         self.parent_sequence_id = None
         self.response_id = None
 
+    @_partial_reset
+    def do_reset(self):
+        """Drop the events so the next sequencer makes fresh ones"""
+        super().do_reset()
+        self._start_condition = None
+        self._finish_condition = None
+        self._item_ready = None
+        self.parent_sequence_id = None
+        self.response_id = None
+
+    @property
+    def start_condition(self):
+        if self._start_condition is None:
+            self._start_condition = CocotbEvent()
+        return self._start_condition
+
+    @property
+    def finish_condition(self):
+        if self._finish_condition is None:
+            self._finish_condition = CocotbEvent()
+        return self._finish_condition
+
+    @property
+    def item_ready(self):
+        if self._item_ready is None:
+            self._item_ready = CocotbEvent()
+        return self._item_ready
+
     def set_context(self, item):
         """
         Use this to link a new response transaction to the request transaction.
@@ -153,6 +237,25 @@ class uvm_sequence_item(uvm_transaction):
         self.response_id = (item.parent_sequence_id, item.get_transaction_id())
 
 
+class uvm_sequence_item(_uvm_sequence_item, uvm_transaction):
+    """
+    The pyuvm uvm_sequence_item has conditions to
+    implement start_item() and finish_item()
+    """
+
+
+class uvm_compact_sequence_item(_uvm_sequence_item, metaclass=CompactMeta):
+    """
+    A uvm_sequence_item without a __dict__. Declare the data
+    members of subclasses with uvm_field() or list them in
+    __slots__.
+
+    It has the methods of uvm_sequence_item but is not a subclass
+    of it, so sequencers accept it as they accept any item.
+    """
+    __slots__ = ()
+
+
 class uvm_seq_item_export(uvm_blocking_put_export):
     """
     The sequence item port with a request queue and
@@ -229,14 +332,17 @@ class uvm_seq_item_port(uvm_port_base):
         self.check_export(export)
         super().connect(export)
 
+    @_forwards_to_export
     async def put_req(self, item):
         """Put a request item in the request queue"""
         await self.export.put_req(item)
 
+    @_forwards_to_export
     def put_response(self, item):
         """Put a response back in the queue. aka put_response"""
         self.export.put_response(item)
 
+    @_forwards_to_export
     async def get_next_item(self):
         """get the next sequence item from the request queue
         """
@@ -246,10 +352,12 @@ class uvm_seq_item_port(uvm_port_base):
             assert self.export is not None, "export is not connected"
             raise
 
+    @_forwards_to_export
     def item_done(self, rsp=None):
         """Notify finish_item that the item is complete"""
         self.export.item_done(rsp)
 
+    @_forwards_to_export
     async def get_response(self, transaction_id=None):
         """
         Either get a response item with the given transaction_id,
@@ -277,10 +385,16 @@ class uvm_sequencer(uvm_component):
     items with the sequencer.
     """
 
+    # Number the items and sequences this sequencer runs from its
+    # own id_allocator so that its ids do not depend on other
+    # sequencers.
+    namespaced_ids = False
+
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.seq_item_export = uvm_seq_item_export("seq_item_export", self)
         self.seq_q = UVMQueue(0)
+        self.id_allocator = IdAllocator()
 
     async def run_phase(self):
         while True:
@@ -288,6 +402,8 @@ class uvm_sequencer(uvm_component):
             await self.seq_item_export.put_req(next_item)
 
     async def start_item(self, item):
+        if self.namespaced_ids:
+            item.transaction_id = self.id_allocator.next_id()
         await self.seq_q.put(item)
         await item.start_condition.wait()
 
@@ -317,11 +433,14 @@ class uvm_sequence(uvm_object):
     body() gets launched in a thread at start.
     """
 
+    # Source of sequence ids unless the sequencer has its own
+    id_allocator = IdAllocator(per_test=True)
+
     def __init__(self, name="uvm_sequence"):
         super().__init__(name)
         self.sequencer = None
         self.running_item = None
-        self.sequence_id = id(self)
+        self.sequence_id = self.id_allocator.next_id()
 
     async def body(self):
         """
@@ -334,6 +453,8 @@ class uvm_sequence(uvm_object):
             assert (isinstance(seqr, uvm_sequencer)), \
                 "Tried to start a sequence with a non-sequencer"
         self.sequencer = seqr
+        if seqr is not None and seqr.namespaced_ids:
+            self.sequence_id = seqr.id_allocator.next_id()
         await self.body()
 
     async def start_item(self, item):
@@ -1,14 +1,21 @@
-from collections import OrderedDict
+from collections import OrderedDict, deque
+import itertools
 import logging
 import fnmatch
-import cocotb.queue
-from cocotb.triggers import Event, NullTrigger
-from cocotb.queue import QueueEmpty
+import heapq
+import os
+import pickle
+import re
+import tempfile
+import pyuvm.error_classes as error_classes
+from cocotb.triggers import Event, NullTrigger, PythonTrigger
+from cocotb.queue import QueueEmpty, QueueFull
 
 FIFO_DEBUG = 5
 PYUVM_DEBUG = 4
 logging.addLevelName(FIFO_DEBUG, "FIFO_DEBUG")
 logging.addLevelName(PYUVM_DEBUG, "PYUVM_DEBUG")
+_glob_chars = re.compile(r"[*?[]")
 
 
 class Singleton(type):
@@ -38,18 +45,50 @@ class Override:
 
         self.type_override = None
         self.inst_overrides = OrderedDict()
+        self._inst_matcher = None
 
     def add(self, override, path=None):
         if path is None:
             self.type_override = override
         else:
             self.inst_overrides[path] = override
+            self._inst_matcher = None
+
+    def _compile_inst_matcher(self):
+        # Each instance override glob is compiled once and filed
+        # under its literal prefix, the text before its first
+        # wildcard.  A lookup only tries the globs whose prefix
+        # starts the path, in the order they were added, so the
+        # first glob that matches wins just as it did with a loop
+        # of fnmatch() over every glob.
+        by_length = {}
+        for order, inst in enumerate(self.inst_overrides):
+            glob = os.path.normcase(inst)
+            prefix = _glob_chars.split(glob, 1)[0]
+            matcher = re.compile(fnmatch.translate(glob)).match
+            by_length.setdefault(len(prefix), {}).setdefault(
+                prefix, []).append((order, matcher, inst))
+        self._inst_matcher = sorted(by_length.items())
 
     def find_inst_override(self, path):
-        for inst in self.inst_overrides:
-            if fnmatch.fnmatch(path, inst):
-                return self.inst_overrides[inst]
-        return None
+        if len(self.inst_overrides) == 0:
+            return None
+        if self._inst_matcher is None:
+            self._compile_inst_matcher()
+        path = os.path.normcase(path)
+        found = None
+        for length, by_prefix in self._inst_matcher:
+            if length > len(path):
+                break
+            for order, matcher, inst in by_prefix.get(path[:length], ()):
+                if found is not None and order > found[0]:
+                    break
+                if matcher(path):
+                    found = (order, inst)
+                    break
+        if found is None:
+            return None
+        return self.inst_overrides[found[1]]
 
     def __str__(self):
         """
@@ -76,6 +115,8 @@ class Override:
 
 
 class FactoryData(metaclass=Singleton):
+    # The override cache is dropped when it grows past this
+    override_cache_size = 4096
 
     def __init__(self):
         self.classes = {}
@@ -84,6 +125,27 @@ class FactoryData(metaclass=Singleton):
 
     def clear_overrides(self):
         self.overrides = {}
+        self.has_inst_overrides = False
+        self.clear_override_cache()
+
+    def clear_override_cache(self):
+        # Resolved overrides keyed by (requested_type, inst_path).
+        # inst_path is None when there are no instance overrides.
+        self.override_cache = {}
+
+    def add_override(self, original, override, path=None):
+        """
+        Store an override and invalidate the override cache
+        :param original: The type (or name string) being overridden
+        :param override: The overriding type
+        :param path: The instance path or None for a type override
+        """
+        if original not in self.overrides:
+            self.overrides[original] = Override()
+        self.overrides[original].add(override, path)
+        if path is not None:
+            self.has_inst_overrides = True
+        self.clear_override_cache()
 
     def clear_classes(self):
         self.classes = {}
@@ -125,6 +187,23 @@ class FactoryData(metaclass=Singleton):
         # Keep track of what classes have been overridden
         #
 
+        # Top-level requests go through the override cache. The
+        # recursive calls below pass an overridden_list and skip it.
+        if overridden_list is None:
+            if requested_type not in self.overrides:
+                return requested_type
+            key = (requested_type,
+                   inst_path if self.has_inst_overrides else None)
+            try:
+                return self.override_cache[key]
+            except KeyError:
+                pass
+            found_type = self.find_override(requested_type, inst_path, [])
+            if len(self.override_cache) >= self.override_cache_size:
+                self.clear_override_cache()
+            self.override_cache[key] = found_type
+            return found_type
+
         # Is there an override loop?
         # noinspection PyShadowingNames
         def check_override(override, overridden_list):
@@ -149,10 +228,9 @@ class FactoryData(metaclass=Singleton):
             return requested_type
 
         if inst_path is not None:
-            for path in override.inst_overrides:
-                if fnmatch.fnmatch(inst_path, path):
-                    found_type = override.inst_overrides[path]
-                    return check_override(found_type, overridden_list)
+            found_type = override.find_inst_override(inst_path)
+            if found_type is not None:
+                return check_override(found_type, overridden_list)
 
         # No inst requested or found, do we have a type override?
         if override.type_override is not None:
@@ -168,7 +246,11 @@ class FactoryMeta(type):
     """
 
     def __init__(cls, name, bases, cls_dict):
-        FactoryData().classes[cls.__name__] = cls
+        # pyuvm's private base classes are not for the factory
+        private = name.startswith("_") \
+            and cls.__module__.startswith("pyuvm.")
+        if not private:
+            FactoryData().classes[cls.__name__] = cls
         super().__init__(name, bases, cls_dict)
 
 
@@ -182,6 +264,8 @@ class uvm_void(metaclass=FactoryMeta):
     In pyuvm, we're using uvm_void() as a metaclass so
     that all UVM classes can be stored in a factory.
 """
+    # Empty so that subclasses can leave out __dict__
+    __slots__ = ()
 
 
 class UVM_ROOT_Singleton(FactoryMeta):
@@ -256,36 +340,547 @@ class ObjectionHandler(metaclass=Singleton):
                 "You did not call self.raise_objection() in any run_phase")
 
 
-class UVMQueue(cocotb.queue.Queue):
+class IdAllocator:
     """
-    The UVMQueue provides a peek function as well as the
-    ability to break out of a blocking operation if
-    the time_to_die predicate is true.  The time
-    to die is set to the dropping of all run_phase objections
-    by default.
+    Hands out increasing integer ids. Unlike id(), an id is never
+    reused within a run and a run always produces the same ids.
     """
+    # Allocators that restart with every test
+    _per_test = []
+
+    def __init__(self, start=1, per_test=False):
+        """
+        :param start: The first id to hand out
+        :param per_test: Restart from start in reset_per_test(),
+                         which uvm_root.clear_singletons() calls
+        """
+        self.reset(start)
+        if per_test:
+            IdAllocator._per_test.append(self)
+
+    @classmethod
+    def reset_per_test(cls):
+        """Restart the per_test allocators from their start"""
+        for allocator in cls._per_test:
+            allocator.reset(allocator.start)
+
+    def reset(self, start=1):
+        """
+        Start again from start
+
+        :param start: The next id to hand out
+        """
+        self.start = start
+        self._counter = itertools.count(start)
+        # The counter's own __next__ avoids a Python call per id
+        self.next_id = self._counter.__next__
+
+
+class UVMStats:
+    """
+    Base of the factory and ConfigDB counters. Subclasses return
+    a one-line summary() and a list of tables() that report()
+    lays out the same way for both.
+    """
+
+    def summary(self):
+        """:return: The headline totals"""
+        raise error_classes.UVMNotImplemented(
+            f"{type(self).__name__} must implement summary()")
+
+    def tables(self, top_n):
+        """
+        :param top_n: The number of rows in each table
+        :return: List of (columns, rows). columns is a list of
+                 (heading, width, format spec) and rows a list of
+                 tuples of values. Empty tables are skipped.
+        """
+        return []
+
+    @staticmethod
+    def format_table(columns, rows):
+        """
+        :param columns: List of (heading, width, format spec)
+        :param rows: List of tuples of values
+        :return: List of lines, headings first. Columns with no
+                 format spec are text and align left.
+        """
+        lines = [" ".join(f"{heading:{'<' if spec == '' else '>'}{width}}"
+                          for heading, width, spec in columns).rstrip()]
+        for row in rows:
+            lines.append(" ".join(f"{value:{width}{spec}}"
+                                  for value, (_, width, spec)
+                                  in zip(row, columns)).rstrip())
+        return lines
+
+    def report(self, top_n=10):
+        """
+        :param top_n: The number of rows in each table
+        :return: String with the summary and the tables
+        """
+        ss = [self.summary()]
+        for columns, rows in self.tables(top_n):
+            if len(rows) > 0:
+                ss.append("")
+                ss.extend(self.format_table(columns, rows))
+        return "\n".join(ss)
+
+    def __str__(self):
+        return self.report()
+
+
+def log_stats(logger, owner, stats, top_n=10):
+    """
+    Log a stats report at INFO, or warn that stats are off
+
+    :param logger: The logger to write to
+    :param owner: The name of the stats owner for the warning
+    :param stats: A UVMStats or None if stats are disabled
+    :param top_n: The number of rows in each table
+    :return: The report string or None
+    """
+    if stats is None:
+        logger.warning(f"{owner} stats are not enabled")
+        return None
+    report = stats.report(top_n)
+    logger.info(report)
+    return report
+
+
+class _QueueTrigger(PythonTrigger):
+    """
+    A trigger that any number of tasks can await at once. A
+    UVMQueue keeps one for each kind of waiter and awaits it
+    again and again, so waiting allocates nothing.
+    """
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self._callback = None
+
+    def prime(self, callback):
+        self._callback = callback
+        super().prime(callback)
+
+    def fire(self):
+        """Wake every task awaiting the trigger"""
+        if self.primed:
+            self._callback(self)
+
+    def __repr__(self):
+        return f"<{self.name}>"
+
+
+class UVMQueue:
+    """
+    The UVMQueue is a FIFO for coordinating coroutines with the
+    interface of cocotb.queue.Queue, a peek function, and
+    functions that move many items at once.
+
+    The items live in a deque, so peeking is O(1) and the
+    *_many functions move items with one extend or slice.
+    Getters and putters each wait on one trigger that the queue
+    reuses, and check again when it fires. get_batch() callers
+    wait on a trigger kept for their min_n and wake only once the
+    queue holds that many items.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        :param maxsize: Most items the queue holds. 0 is unbounded.
+        """
+        self._maxsize = maxsize
+        self._queue = deque()
+        name = type(self).__name__
+        self._not_empty = _QueueTrigger(f"{name} not empty")
+        self._not_full = _QueueTrigger(f"{name} not full")
+        # get_batch() callers wait on the trigger for their min_n
+        self._batch_ready = {}
+        # min_n -> number of get_batch() calls waiting, and the
+        # smallest min_n being waited for
+        self._batch_waiting = {}
+        self._batch_need = 0
+
     def __str__(self):
         return str(self._queue)
 
+    def __repr__(self):
+        return f"<{type(self).__name__} maxsize={self._maxsize} " \
+               f"qsize={self.qsize()}>"
+
+    @property
+    def maxsize(self):
+        """Number of items allowed in the queue."""
+        return self._maxsize
+
+    def qsize(self):
+        """Number of items in the queue."""
+        return len(self._queue)
+
+    def empty(self):
+        """Return ``True`` if the queue is empty."""
+        return not self._queue
+
+    def full(self):
+        """Return ``True`` if there are maxsize items in the queue.
+        An unbounded queue is never full.
+        """
+        return 0 < self._maxsize <= len(self._queue)
+
+    # Subclasses that index their items override these
+    def _put(self, item):
+        self._queue.append(item)
+
+    def _get(self):
+        return self._queue.popleft()
+
     def _peek(self):
         return self._queue[0]
 
-    async def peek(self):
+    def _put_many(self, items):
+        self._queue.extend(items)
+
+    def _get_many(self, n):
+        queue = self._queue
+        if n >= len(queue):
+            items = list(queue)
+            queue.clear()
+            return items
+        popleft = queue.popleft
+        return [popleft() for _ in range(n)]
+
+    def _wake_getters(self):
+        if self._not_empty.primed:
+            self._not_empty.fire()
+        if self._batch_waiting and self.qsize() >= self._batch_need:
+            size = self.qsize()
+            for need in self._batch_waiting:
+                if need <= size:
+                    self._batch_ready[need].fire()
+
+    def _wake_putters(self):
+        if self._not_full.primed:
+            self._not_full.fire()
+
+    async def put(self, item):
+        """Put an item into the queue.
+        If the queue is full, wait until a free slot is available.
+        """
+        while self.full():
+            await self._not_full
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        """Put an item into the queue without blocking.
+        Raise :exc:`QueueFull` if no free slot is available.
+        """
+        if self.full():
+            raise QueueFull()
+        self._put(item)
+        self._wake_getters()
+
+    def put_nowait_many(self, items):
+        """Put all of items into the queue without blocking.
+        Raise :exc:`QueueFull` and put none of them if they
+        do not all fit.
+
+        :param items: list or other sequence of items
+        """
+        if self._maxsize > 0 and \
+                len(self._queue) + len(items) > self._maxsize:
+            raise QueueFull()
+        self._put_many(items)
+        self._wake_getters()
+
+    async def get(self):
         """Remove and return an item from the queue.
         If the queue is empty, wait until an item is available.
         """
-        while self.empty():
-            event = Event('{} peek'.format(type(self).__name__))
-            self._getters.append((event, cocotb.scheduler._current_task))
-            await event.wait()
-        return self.peek_nowait()
+        while not self._queue:
+            await self._not_empty
+        return self.get_nowait()
 
-    def peek_nowait(self):
+    def get_nowait(self):
         """Remove and return an item from the queue.
-        Return an item if one is immediately available, else raise
-        :exc:`asyncio.QueueEmpty`.
+        Raise :exc:`QueueEmpty` if the queue is empty.
         """
-        if self.empty():
+        if not self._queue:
             raise QueueEmpty()
-        item = self._peek()
+        item = self._get()
+        self._wake_putters()
         return item
+
+    def get_nowait_many(self, n=None):
+        """Remove and return up to n items without blocking.
+
+        :param n: Most items to return. None returns them all.
+        :return: list of items, empty if the queue is empty
+        """
+        if n is None:
+            n = self.qsize()
+        items = self._get_many(n)
+        if items:
+            self._wake_putters()
+        return items
+
+    async def get_batch(self, min_n=1, max_n=None):
+        """Wait until the queue holds at least min_n items, then
+        remove and return up to max_n of them.
+
+        :param min_n: Fewest items to return
+        :param max_n: Most items to return. None returns them all.
+        :return: list of items
+        """
+        if max_n is not None and max_n < min_n:
+            raise ValueError(f"max_n ({max_n}) is less than min_n ({min_n})")
+        if 0 < self._maxsize < min_n:
+            raise ValueError(f"A queue of maxsize {self._maxsize} "
+                             f"never holds {min_n} items")
+        if self.qsize() < min_n:
+            try:
+                ready = self._batch_ready[min_n]
+            except KeyError:
+                ready = self._batch_ready[min_n] = _QueueTrigger(
+                    f"{type(self).__name__} holds {min_n}")
+            waiting = self._batch_waiting
+            waiting[min_n] = waiting.get(min_n, 0) + 1
+            self._batch_need = min(waiting)
+            try:
+                while self.qsize() < min_n:
+                    await ready
+            finally:
+                if waiting[min_n] == 1:
+                    del waiting[min_n]
+                else:
+                    waiting[min_n] -= 1
+                self._batch_need = min(waiting) if waiting else 0
+        return self.get_nowait_many(max_n)
+
+    async def peek(self):
+        """Return the next item without removing it.
+        If the queue is empty, wait until an item is available.
+        """
+        while not self._queue:
+            await self._not_empty
+        return self._peek()
+
+    def peek_nowait(self):
+        """Return the next item without removing it.
+        Raise :exc:`QueueEmpty` if the queue is empty.
+        """
+        if not self._queue:
+            raise QueueEmpty()
+        return self._peek()
+
+    def clear(self):
+        """Remove all the items"""
+        self._queue.clear()
+        self._wake_putters()
+
+
+def _item_priority(item):
+    return getattr(item, "priority", 0)
+
+
+class UVMPriorityQueue(UVMQueue):
+    """
+    A UVMQueue that returns the item with the highest priority
+    first, and items of equal priority in the order they were put.
+    The items are kept in a heap, so put and get are O(log n).
+    """
+
+    def __init__(self, maxsize=0, priority=None):
+        """
+        :param maxsize: Most items the queue holds. 0 is unbounded.
+        :param priority: Function that returns an item's priority.
+            None uses the item's priority attribute, or 0.
+        """
+        super().__init__(maxsize)
+        self._priority = _item_priority if priority is None else priority
+        # The heap holds (-priority, put order, item) so that items
+        # are never compared
+        self._queue = []
+        self._order = itertools.count()
+
+    def __str__(self):
+        return str([item for _, _, item in sorted(self._queue)])
+
+    def _entry(self, item):
+        return -self._priority(item), next(self._order), item
+
+    def _put(self, item):
+        heapq.heappush(self._queue, self._entry(item))
+
+    def _get(self):
+        return heapq.heappop(self._queue)[2]
+
+    def _peek(self):
+        return self._queue[0][2]
+
+    def _put_many(self, items):
+        heap = self._queue
+        if len(items) > len(heap):
+            heap.extend(map(self._entry, items))
+            heapq.heapify(heap)
+        else:
+            for item in items:
+                heapq.heappush(heap, self._entry(item))
+
+    def _get_many(self, n):
+        heap = self._queue
+        pop = heapq.heappop
+        return [pop(heap)[2] for _ in range(min(n, len(heap)))]
+
+
+class UVMSpillQueue(UVMQueue):
+    """
+    An unbounded UVMQueue that holds at most window items in
+    memory and appends the rest to a temporary file. Items are
+    written window at a time and read back in order as gets
+    empty the memory.
+
+    Each window of items is pickled unless item_type is given.
+    item_type is a uvm_object class with fields declared with
+    uvm_field(bits=...), and its items are stored with
+    pack_bytes(), which is faster and smaller but keeps only
+    those fields.
+    """
+
+    def __init__(self, window=1024, item_type=None, spill_dir=None):
+        """
+        :param window: Most items held in memory
+        :param item_type: Class whose pack_bytes() stores items
+        :param spill_dir: Directory for the file. None is the
+            tempfile default.
+        """
+        super().__init__(maxsize=0)
+        if window < 1:
+            raise ValueError(f"window must be at least 1, not {window}")
+        self.window = window
+        self.item_type = item_type
+        self.spill_dir = spill_dir
+        self._record_size = None
+        if item_type is not None:
+            # Raises UsePythonMethod if it has no bit fields
+            item_type.pack_bytes_many([])
+            self._record_size = (item_type._pack_bits + 7) // 8
+        self._file = None
+        self._read_pos = 0
+        # Items waiting to be written and items in the file
+        self._pending = []
+        self._in_file = 0
+        self.spill_count = 0
+        self.peak_spilled = 0
+
+    def qsize(self):
+        return len(self._queue) + len(self._pending) + self._in_file
+
+    def empty(self):
+        # Memory is refilled as soon as it empties
+        return not self._queue
+
+    def _put(self, item):
+        if self._pending or self._in_file or \
+                len(self._queue) >= self.window:
+            self._spill((item,))
+        else:
+            self._queue.append(item)
+
+    def _put_many(self, items):
+        room = 0 if self._pending or self._in_file \
+            else self.window - len(self._queue)
+        if room >= len(items):
+            self._queue.extend(items)
+            return
+        if room > 0:
+            self._queue.extend(items[:room])
+            items = items[room:]
+        self._spill(items)
+
+    def _get(self):
+        item = self._queue.popleft()
+        if not self._queue:
+            self._refill()
+        return item
+
+    def _get_many(self, n):
+        items = super()._get_many(n)
+        while not self._queue and self._refill():
+            if len(items) < n:
+                items += super()._get_many(n - len(items))
+        return items
+
+    def clear(self):
+        self._queue.clear()
+        self._pending.clear()
+        self._truncate()
+        self._wake_putters()
+
+    def _spill(self, items):
+        self._pending.extend(items)
+        self.spill_count += len(items)
+        spilled = len(self._pending) + self._in_file
+        if spilled > self.peak_spilled:
+            self.peak_spilled = spilled
+        if len(self._pending) >= self.window:
+            self._flush()
+
+    def _flush(self):
+        """Append the pending items to the file, window at a time"""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+        ff = self._file
+        ff.seek(0, os.SEEK_END)
+        pending = self._pending
+        for start in range(0, len(pending), self.window):
+            chunk = pending[start:start + self.window]
+            if self._record_size is None:
+                ff.write(pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL))
+            else:
+                ff.write(self.item_type.pack_bytes_many(chunk))
+        self._in_file += len(pending)
+        pending.clear()
+
+    def _refill(self):
+        """
+        Move the oldest spilled items into memory
+
+        :return: True if there were any
+        """
+        if self._in_file:
+            ff = self._file
+            ff.seek(self._read_pos)
+            if self._record_size is None:
+                items = pickle.load(ff)
+            else:
+                count = min(self.window, self._in_file)
+                data = ff.read(count * self._record_size)
+                items = self.item_type.unpack_bytes_many(data)
+            self._queue.extend(items)
+            self._in_file -= len(items)
+            if self._in_file:
+                self._read_pos = ff.tell()
+            else:
+                self._truncate()
+            return True
+        if self._pending:
+            self._queue.extend(self._pending)
+            self._pending.clear()
+            return True
+        return False
+
+    def _truncate(self):
+        # Start the file again once it has been read
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        self._read_pos = 0
+        self._in_file = 0
+
+    def close(self):
+        """Delete the spill file and all the items"""
+        self.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,8 +1,14 @@
 import pyuvm_unittest
 from pyuvm import *
+import cocotb
+from cocotb.triggers import Timer
 
 class config_db_TestCase(pyuvm_unittest.pyuvm_TestCase):
 
+    def setUp(self):
+        super().setUp()
+        uvm_root().clear_children()
+
     def tearDown(self) -> None:
         super().tearDown()
         ConfigDB().clear()
@@ -47,6 +53,159 @@ class config_db_TestCase(pyuvm_unittest.pyuvm_TestCase):
         with self.assertRaises(error_classes.UVMConfigItemNotFound):
             cdb.get(None, "B", "LABEL")
 
+    def test_get_or(self):
+        cdb = ConfigDB()
+        self.assertEqual(3, cdb.get_or(None, "A", "LABEL", 3))
+        self.assertIs(ConfigDB.MISSING,
+                      cdb.get_or(None, "A", "LABEL", ConfigDB.MISSING))
+        cdb.set(None, "*", "LABEL", 5)
+        cdb.set(None, "A", "LABEL", 6)
+        self.assertEqual(6, cdb.get_or(None, "A", "LABEL", 3))
+        self.assertEqual(5, cdb.get_or(None, "B", "LABEL", 3))
+        self.assertEqual(3, cdb.get_or(None, "B", "NOT_THERE", 3))
+        with self.assertRaises(error_classes.UVMError):
+            cdb.get_or(None, "*", "LABEL", 3)
+
+    def test_freeze(self):
+        cdb = ConfigDB()
+        aa = uvm_component("aa", None)
+        bb = uvm_component("bb", aa)
+        cdb.set(None, "*", "LABEL", 5)
+        cdb.set(None, "aa.bb", "LABEL", 6)
+        cdb.freeze()
+        self.assertTrue(cdb.is_frozen)
+        self.assertEqual(5, cdb.get(aa, "", "LABEL"))
+        self.assertEqual(6, bb.cdb_get("LABEL"))
+        self.assertEqual(5, cdb.get(None, "not.a.component", "LABEL"))
+        self.assertFalse(cdb.exists(bb, "", "NOT_THERE"))
+        cdb.set(None, "aa", "LABEL", 7)
+        self.assertFalse(cdb.is_frozen)
+        self.assertEqual(7, cdb.get(aa, "", "LABEL"))
+        cdb.freeze()
+        cdb.reject_sets_when_frozen = True
+        try:
+            with self.assertRaises(error_classes.UVMConfigError):
+                cdb.set(None, "aa", "LABEL", 8)
+        finally:
+            cdb.reject_sets_when_frozen = False
+        self.assertEqual(7, cdb.get(aa, "", "LABEL"))
+
+    def test_freeze_sees_unbuilt_exports(self):
+        cdb = ConfigDB()
+        ff = uvm_tlm_fifo("ff", None)
+        cdb.set(None, "ff.*", "LABEL", 9)
+        cdb.freeze()
+        self.assertIn("ff.get_export", cdb._frozen)
+        self.assertEqual(9, ff.get_export.cdb_get("LABEL"))
+
+    async def test_freeze_after_elaboration(self):
+        class comp(uvm_component):
+            async def run_phase(self):
+                self.numb = self.cdb_get("CONFIG")
+
+        class test(uvm_test):
+            def build_phase(self):
+                self.cdb_set("CONFIG", 88)
+                self.cc = comp("cc", self)
+
+            async def run_phase(self):
+                self.raise_objection()
+                self.drop_objection()
+
+        ConfigDB.freeze_after_elaboration = True
+        try:
+            await uvm_root().run_test("test", keep_singletons=True)
+        finally:
+            ConfigDB.freeze_after_elaboration = False
+        self.assertTrue(ConfigDB().is_frozen)
+        utt = uvm_root().get_child("uvm_test_top")
+        self.assertEqual(88, utt.cc.numb)
+
+    def test_set_many(self):
+        class Config:
+            def __init__(self):
+                self.width = 8
+                self.depth = 16
+                self._private = 0
+
+        cdb = ConfigDB()
+        aa = uvm_component("aa", None)
+        cdb.set_many(None, "aa.*", {"A": 1, "B": 2})
+        aa.cdb_set_many(Config())
+        self.assertEqual(1, cdb.get(None, "aa.bb", "A"))
+        self.assertEqual(2, cdb.get(None, "aa.bb", "B"))
+        self.assertEqual(8, cdb.get(aa, "bb", "width"))
+        self.assertEqual(16, cdb.get(aa, "bb", "depth"))
+        self.assertFalse(cdb.exists(aa, "bb", "_private"))
+        with self.assertRaises(error_classes.UVMNotImplemented):
+            cdb.set_many(None, "aa", {"OK": 1, "B*D": 2})
+        self.assertFalse(cdb.exists(None, "aa", "OK"))
+
+    def test_stats(self):
+        cdb = ConfigDB()
+        cdb.enable_stats()
+        try:
+            cdb.set(None, "*", "LABEL", 5)
+            cdb.set(None, "A", "UNUSED", 6)
+            cdb.set_many(None, "B", {"X": 1, "Y": 2})
+            cdb.get(None, "A", "LABEL")
+            cdb.get(None, "B", "LABEL")
+            self.assertFalse(cdb.exists(None, "A", "NOT_THERE"))
+            stats = cdb.stats
+            self.assertEqual(2, stats.field_gets["LABEL"])
+            self.assertEqual(1, stats.field_sets["UNUSED"])
+            self.assertEqual(2, stats.path_sets["B"])
+            self.assertEqual(2, stats.path_gets["A"])
+            self.assertEqual(1, stats.misses[("A", "NOT_THERE")])
+            self.assertEqual([("A", "UNUSED"), ("B", "X"), ("B", "Y")],
+                             stats.unused_sets())
+            self.assertGreater(stats.get_time, 0)
+            self.assertGreater(stats.set_time, 0)
+            self.assertGreater(stats.field_set_time["X"], 0)
+            report = stats.report(top_n=1)
+            self.assertIn("LABEL", report)
+            self.assertIn("UNUSED", report)
+            self.assertIn("set time", report)
+            self.assertEqual(report, cdb.print_stats(top_n=1))
+        finally:
+            cdb.disable_stats()
+        self.assertIsNone(cdb.stats)
+
+    def test_clear_drops_waits_and_stats(self):
+        cdb = ConfigDB()
+        cdb.enable_stats()
+        try:
+            cdb.set(None, "A", "LABEL", 1)
+            waiter = cdb.wait_modified(None, "A", "LABEL")
+            waiter.send(None)
+            waiter.close()
+            self.assertIn("LABEL", cdb._cond_dict)
+            cdb.clear()
+            self.assertEqual({}, cdb._cond_dict)
+            self.assertEqual(0, cdb.stats.field_sets["LABEL"])
+            self.assertEqual([], cdb.stats.unused_sets())
+        finally:
+            cdb.disable_stats()
+
+    async def test_wait_modified(self):
+        cdb = ConfigDB()
+        aa = uvm_component("aa", None)
+        bb = uvm_component("bb", aa)
+        aa_wait = cocotb.start_soon(cdb.wait_modified(aa, "", "LABEL"))
+        bb_wait = cocotb.start_soon(bb.cdb_wait_modified("LABEL"))
+        await Timer(1)
+        cdb.set(None, "aa.bb", "OTHER", 1)
+        await Timer(1)
+        self.assertFalse(aa_wait.done())
+        self.assertFalse(bb_wait.done())
+        cdb.set(None, "aa.b*", "LABEL", 2)
+        await Timer(1)
+        self.assertFalse(aa_wait.done())
+        self.assertTrue(bb_wait.done())
+        cdb.set(None, "aa", "LABEL", 3)
+        await Timer(1)
+        self.assertTrue(aa_wait.done())
+
     async def test_context(self):
         class comp(uvm_component):
             def build_phase(self):
@@ -1,5 +1,5 @@
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge
+from cocotb.triggers import FallingEdge, NullTrigger
 import cocotb
 
 import pyuvm.utility_classes as utility_classes
@@ -191,3 +191,33 @@ async def nowait_tests(dut):
 
 
 
+
+
+async def batch_get(qq, min_n, max_n, got):
+    got.append(await qq.get_batch(min_n, max_n))
+
+
+@cocotb.test()
+async def batch_tests(dut):
+    """Test the functions that move many items"""
+    qq = utility_classes.UVMQueue(maxsize=3)
+    qq.put_nowait_many([1, 2])
+    try:
+        qq.put_nowait_many([3, 4])
+        assert False
+    except cocotb.queue.QueueFull:
+        pass
+    assert qq.qsize() == 2
+    assert qq.get_nowait_many(1) == [1]
+    assert qq.get_nowait_many() == [2]
+    assert qq.get_nowait_many() == []
+    got = []
+    cocotb.start_soon(batch_get(qq, 2, 3, got))
+    await NullTrigger()
+    qq.put_nowait(5)
+    await NullTrigger()
+    assert got == []
+    qq.put_nowait_many([6, 7])
+    await NullTrigger()
+    assert got == [[5, 6, 7]]
+    assert qq.empty()
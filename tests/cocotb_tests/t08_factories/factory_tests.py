@@ -215,6 +215,22 @@ class s08_factory_classes_TestCase():
         overridden = self.fd.find_override(self.original_comp, "top.mid.orig")
         assert self.comp_3 == overridden
 
+    def test_inst_override_first_match_order(self):
+        """
+        The first instance override added wins even when a later
+        one has a longer literal prefix
+        """
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_1, "*.orig")
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_2, "top.mid.*")
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_3, "top.mid.other")
+        override = self.fd.overrides[self.original_comp]
+        assert self.comp_1 == override.find_inst_override("top.mid.orig")
+        assert self.comp_2 == override.find_inst_override("top.mid.orig2")
+        assert self.comp_2 == override.find_inst_override("top.mid.other")
+        assert override.find_inst_override("top.sib") is None
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_3, "*.orig")
+        assert self.comp_3 == override.find_inst_override("top.sib.orig")
+
     def test_not_finding_inst_override_8_3_1_5(self):
         """
         8.3.1.5
@@ -238,6 +254,24 @@ class s08_factory_classes_TestCase():
         overridden = self.fd.find_override(self.original_comp, "top.not_there.orig")
         assert self.original_comp == overridden
 
+    def test_override_cache(self):
+        """
+        Cached overrides are invalidated when overrides change
+        """
+        assert self.original_comp == self.fd.find_override(self.original_comp, "top.mid.orig")
+        self.factory.set_type_override_by_type(self.original_comp, self.comp_1)
+        assert self.comp_1 == self.fd.find_override(self.original_comp, "top.mid.orig")
+        assert (self.original_comp, None) in self.fd.override_cache
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_2, "top.mid.*")
+        assert self.comp_2 == self.fd.find_override(self.original_comp, "top.mid.orig")
+        assert self.comp_1 == self.fd.find_override(self.original_comp, "top.sib.orig")
+        assert (self.original_comp, "top.mid.orig") in self.fd.override_cache
+        self.factory.set_type_override_by_type(self.comp_1, self.comp_3)
+        assert self.comp_3 == self.fd.find_override(self.original_comp, "top.sib.orig")
+        self.factory.clear_overrides()
+        assert len(self.fd.override_cache) == 0
+        assert self.original_comp == self.fd.find_override(self.original_comp, "top.mid.orig")
+
     def test_create_object_by_type_and_name_8_3_1_5(self):
         """
         8.3.1.5
@@ -281,6 +315,92 @@ class s08_factory_classes_TestCase():
         assert saw_error
         logger.setLevel(level)
 
+    def test_create_objects(self):
+        objs = self.factory.create_objects(self.original_object, 3)
+        assert len(objs) == 3
+        assert all(type(obj) is self.original_object for obj in objs)
+        self.factory.set_type_override_by_type(self.original_object, self.object_1)
+        self.factory.set_inst_override_by_type(self.original_object, self.object_2, "top.o1")
+        objs = self.factory.create_objects(self.original_object, ["o0", "o1", "o2"], "top")
+        assert [type(obj) for obj in objs] == [self.object_1, self.object_2, self.object_1]
+        assert [obj.get_name() for obj in objs] == ["o0", "o1", "o2"]
+
+    def test_create_component_array(self):
+        self.factory.set_inst_override_by_type(self.original_comp, self.comp_1, "top.mid.agent_1")
+        comps = self.factory.create_component_array(self.original_comp, self.mid, "agent_{}", 3)
+        assert [type(comp) for comp in comps] == [self.original_comp, self.comp_1, self.original_comp]
+        assert [comp.get_full_name() for comp in comps] == ["top.mid.agent_0", "top.mid.agent_1", "top.mid.agent_2"]
+        assert self.mid.get_child("agent_2") is comps[2]
+        assert uvm_component.component_dict["top.mid.agent_1"] is comps[1]
+        assert self.top.lookup("mid.agent_0") is comps[0]
+        saw_error = False
+        try:
+            self.factory.create_component_array(self.original_comp, self.mid, "agent_{}", 1)
+        except AssertionError:
+            saw_error = True
+        assert saw_error
+        saw_error = False
+        try:
+            self.factory.create_component_array(self.original_comp, self.mid, "spare", 2)
+        except AssertionError:
+            saw_error = True
+        assert saw_error
+        assert not self.mid.has_child("spare")
+
+    def test_create_component_array_sees_tree(self):
+        seen = []
+
+        class peer_comp(uvm_component):
+            def __init__(self, name, parent):
+                super().__init__(name, parent)
+                self.leaf = uvm_component("leaf", self)
+                seen.append(sorted(parent._children))
+                seen.append(self.get_full_name() in uvm_component.component_dict)
+
+        comps = self.factory.create_component_array(peer_comp, self.mid, "peer_{}", 2)
+        assert seen == [["orig", "peer_0"], True, ["orig", "peer_0", "peer_1"], True]
+        assert self.mid.lookup("peer_1.leaf") is comps[1].leaf
+
+    def test_create_component_array_failure(self):
+        class fragile_comp(uvm_component):
+            def __init__(self, name, parent):
+                super().__init__(name, parent)
+                self.leaf = uvm_component("leaf", self)
+                if name == "fragile_2":
+                    raise ValueError(name)
+
+        saw_error = False
+        try:
+            self.factory.create_component_array(fragile_comp, self.mid, "fragile_{}", 3)
+        except ValueError:
+            saw_error = True
+        assert saw_error
+        assert sorted(self.mid._children) == ["orig"]
+        assert not [path for path in uvm_component.component_dict if "fragile" in path]
+        comps = self.factory.create_component_array(self.original_comp, None, "top_{}", 2)
+        assert uvm_root().get_child("top_1") is comps[1]
+
+    def test_factory_stats(self):
+        self.factory.enable_stats()
+        try:
+            self.factory.set_inst_override_by_type(self.original_object, self.object_1, "o1")
+            self.factory.create_object_by_type(self.original_object, name="o1")
+            self.factory.create_object_by_type(self.original_object, name="o2")
+            self.factory.create_objects(self.original_object, ["o1", "o3"])
+            self.factory.create_component_by_type(self.comp_1, name="c1", parent=self.top)
+            stats = self.factory.stats
+            assert stats.requested[self.original_object] == 4
+            assert stats.resolved[self.object_1] == 2
+            assert stats.resolved[self.comp_1] == 1
+            assert stats.override_hit_rate(self.original_object) == 0.5
+            assert stats.ctor_time[self.comp_1] > 0
+            report = stats.report(top_n=5)
+            assert "original_object" in report
+            assert report == self.factory.print_stats(top_n=5)
+        finally:
+            self.factory.disable_stats()
+        assert self.factory.stats is None
+
     def test_create_component_by_type_and_name_override_8_3_1_5(self):
         """
         8.3.1.5
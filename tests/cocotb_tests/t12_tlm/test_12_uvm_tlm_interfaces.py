@@ -457,6 +457,272 @@ class s12_uvm_tlm_interfaces_TestCase(pyuvm_unittest.pyuvm_TestCase):
         size = ff2.size()
         self.assertEqual(2, size)
 
+    def test_uvm_tlm_fifo_lazy_exports(self):
+        ff = self.make_fifo(uvm_tlm_analysis_fifo)
+        self.assertEqual(0, len(ff._children))
+        self.assertEqual(15, ff.get_num_children())
+        self.assertTrue(ff.has_child("get_peek_export"))
+        comp_dict = uvm_component.component_dict
+        self.assertIn("my_root.fifo.put_ap", comp_dict)
+        self.assertNotIn("my_root.fifo.no_such_export", comp_dict)
+        self.assertNotIn("my_root.fifo.put_ap", list(comp_dict))
+        self.assertIn("my_root.fifo.put_ap", comp_dict.names())
+        self.assertIsNone(comp_dict.get("my_root.fifo.no_such_export"))
+        self.assertIs(ff.put_ap, comp_dict.get("my_root.fifo.put_ap"))
+        ge = ff.get_export
+        self.assertIs(ge, ff.get_export)
+        self.assertIs(ff.get_ap, ge.ap)
+        self.assertEqual(["put_ap", "get_ap", "get_export"],
+                         list(ff._children))
+        self.assertIs(ff.peek_export,
+                      uvm_component.component_dict["my_root.fifo.peek_export"])
+        self.assertIs(ff.put_export, ff.lookup("put_export"))
+        names = [child.get_name() for child in ff.children]
+        self.assertEqual(list(uvm_tlm_analysis_fifo._lazy_exports), names)
+        with self.assertRaises(AttributeError):
+            _ = ff.no_such_export
+
+    def test_uvm_tlm_fifo_lazy_export_logging(self):
+        ff = self.make_fifo(uvm_tlm_fifo)
+        ff.set_logging_level_hier(FIFO_DEBUG)
+        self.assertEqual(FIFO_DEBUG, ff.put_export.logger.level)
+
+    class Recorder(uvm_subscriber):
+        def __init__(self, name, parent):
+            super().__init__(name, parent)
+            self.data = []
+
+        def write(self, tt):
+            self.data.append(tt)
+
+    def test_uvm_analysis_port_fanout(self):
+        ap1 = uvm_analysis_port("ap1", self.my_root)
+        ap2 = uvm_analysis_port("ap2", self.my_root)
+        ap1.write(0)
+        ap1.connect(ap2)
+        subs = [self.Recorder(f"sub{nn}", self.my_root) for nn in range(3)]
+        ap2.connect(subs[0].analysis_export)
+        self.assertIs(subs[0].write.__func__, ap1.write.__func__)
+        ff = uvm_tlm_analysis_fifo("ff", self.my_root)
+        ap2.connect(ff.analysis_export)
+        ap1.connect(subs[1].analysis_export)
+        ap2.connect(subs[2].analysis_export)
+        ap1.end_of_elaboration_phase()
+        ap1.write(1)
+        ap2.write(2)
+        self.assertEqual([1, 2], subs[0].data)
+        self.assertEqual([1], subs[1].data)
+        self.assertEqual([1, 2], subs[2].data)
+        self.assertEqual([1, 2], [ff.try_get()[1], ff.try_get()[1]])
+        self.assertEqual(ap1.subscribers, [ap2, subs[1].analysis_export])
+
+    def test_uvm_analysis_port_write_batch(self):
+        class Batcher(self.Recorder):
+            def write_batch(self, items):
+                self.data.append(list(items))
+
+        ap1 = uvm_analysis_port("ap1", self.my_root)
+        ap2 = uvm_analysis_port("ap2", self.my_root)
+        ap1.write_batch([0])
+        ap1.connect(ap2)
+        rec = self.Recorder("rec", self.my_root)
+        bat = Batcher("bat", self.my_root)
+        ff = uvm_tlm_analysis_fifo("ff", self.my_root)
+        ap2.connect(rec.analysis_export)
+        ap2.connect(bat.analysis_export)
+        ap2.connect(ff.analysis_export)
+        ap1.write_batch([1, 2, 3])
+        ap1.write(4)
+        self.assertEqual([1, 2, 3, 4], rec.data)
+        self.assertEqual([[1, 2, 3], 4], bat.data)
+        self.assertEqual(4, ff.used())
+        self.assertEqual((True, 1), ff.try_get())
+        ap1.write_batch(datum for datum in (5, 6))
+        self.assertEqual([1, 2, 3, 4, 5, 6], rec.data)
+        self.assertEqual([[1, 2, 3], 4, [5, 6]], bat.data)
+        self.assertEqual(5, ff.used())
+
+    def test_uvm_analysis_port_loop(self):
+        ap1 = uvm_analysis_port("ap1", self.my_root)
+        ap2 = uvm_analysis_port("ap2", self.my_root)
+        ap1.connect(ap2)
+        with self.assertRaises(UVMTLMConnectionError):
+            ap2.connect(ap1)
+        self.assertEqual([], ap2.subscribers)
+
+    def test_uvm_tlm_fifo_many(self):
+        ff = uvm_tlm_fifo("ff", self.my_root, 3)
+        rec = self.Recorder("rec", self.my_root)
+        ff.get_ap.connect(rec.analysis_export)
+        self.assertTrue(ff.try_put_many([1, 2]))
+        self.assertFalse(ff.try_put_many([3, 4]))
+        self.assertEqual(2, ff.used())
+        self.assertEqual([1], ff.try_get_many(1))
+        self.assertEqual([2], ff.try_get_many())
+        self.assertEqual([], ff.try_get_many())
+        self.assertEqual([1, 2], rec.data)
+        self.assertNotIn("put_ap", ff._children)
+
+    def fill_analysis_fifo(self, overflow, count=6, **kwargs):
+        ff = uvm_tlm_analysis_fifo("ff", self.my_root, 3, overflow, **kwargs)
+        ap = uvm_analysis_port("ap", self.my_root)
+        ap.connect(ff.analysis_export)
+        for datum in range(count):
+            ap.write(datum)
+        return ff
+
+    def test_uvm_tlm_analysis_fifo_overflow(self):
+        with self.assertRaises(QueueFull):
+            self.fill_analysis_fifo(
+                uvm_overflow_policy_enum.UVM_OVERFLOW_ERROR)
+        self.my_root.clear_children()
+        ff = self.fill_analysis_fifo(uvm_overflow_policy_enum.UVM_DROP_OLDEST)
+        self.assertEqual([3, 4, 5], ff.try_get_many())
+        self.assertEqual((6, 3, 3), (ff.write_count, ff.drop_count,
+                                     ff.peak_used))
+        self.my_root.clear_children()
+        ff = self.fill_analysis_fifo(uvm_overflow_policy_enum.UVM_DROP_NEWEST)
+        self.assertEqual([0, 1, 2], ff.try_get_many())
+        self.my_root.clear_children()
+        ff = self.fill_analysis_fifo(uvm_overflow_policy_enum.UVM_SAMPLE,
+                                     count=9, sample_every=3)
+        self.assertEqual([2, 5, 8], ff.try_get_many())
+        self.assertEqual(6, ff.drop_count)
+
+    def test_uvm_tlm_analysis_fifo_watermark(self):
+        ff = uvm_tlm_analysis_fifo("ff", self.my_root, watermark=2)
+        hits = []
+        ff.add_watermark_callback(hits.append)
+        ap = uvm_analysis_port("ap", self.my_root)
+        ap.connect(ff.analysis_export)
+        # One subscriber that needs len() still takes a generator
+        ap.write_batch(datum for datum in range(3))
+        ap.write(3)
+        self.assertEqual([ff], hits)
+        ff.try_get_many(3)
+        ap.write(4)
+        ap.write(5)
+        self.assertEqual([ff, ff], hits)
+        self.assertEqual((6, 0, 4, 2), (ff.write_count, ff.drop_count,
+                                        ff.peak_used, ff.watermark_count))
+        with self.assertLogs(ff.logger, "INFO") as logs:
+            ff.report_phase()
+        self.assertIn("6 written, 0 dropped, peak 4 of unbounded",
+                      logs.output[0])
+
+    class Packet(uvm_object):
+        addr = uvm_field(0, bits=16)
+        data = uvm_field(0, bits=32)
+
+    def exercise_spill_fifo(self, item_type, make_item):
+        ff = uvm_tlm_spill_fifo("ff", self.my_root, 4, item_type)
+        ap = uvm_analysis_port("ap", self.my_root)
+        ap.connect(ff.analysis_export)
+        sent = [make_item(nn) for nn in range(11)]
+        for item in sent[:3]:
+            ap.write(item)
+        ap.write_batch(sent[3:9])
+        self.assertEqual(4, len(ff.queue._queue))
+        ap.write_batch(sent[9:])
+        self.assertEqual(11, ff.used())
+        self.assertEqual(7, ff.queue.spill_count)
+        got = [ff.try_get()[1] for _ in range(3)]
+        got += ff.try_get_many(6)
+        ap.write(make_item(11))
+        sent.append(make_item(11))
+        while ff.can_get():
+            got.append(ff.get_export.try_get()[1])
+        self.assertEqual(sent, got)
+        self.assertEqual((False, None), ff.try_get())
+        ff.final_phase()
+
+    def test_uvm_tlm_spill_fifo_pickle(self):
+        self.exercise_spill_fifo(None, lambda nn: (nn, str(nn)))
+
+    def test_uvm_tlm_spill_fifo_packed(self):
+        def make_packet(nn):
+            packet = self.Packet()
+            packet.addr = nn
+            packet.data = nn * 3
+            return packet
+        self.exercise_spill_fifo(self.Packet, make_packet)
+
+    def test_resolve_bindings_chain(self):
+        ff = uvm_tlm_fifo("ff", self.my_root, 4)
+        put_ports = [uvm_put_port(f"pp{nn}", self.my_root) for nn in range(3)]
+        put_ports[0].connect(put_ports[1])
+        put_ports[1].connect(put_ports[2])
+        put_ports[2].connect(ff.put_export)
+        gp = uvm_get_port("gp", self.my_root)
+        gp.connect(ff.get_export)
+        put_ports[0].end_of_elaboration_phase()
+        gp.end_of_elaboration_phase()
+        for port in put_ports:
+            self.assertIs(ff.put_export, port.try_put.__self__)
+        self.assertIs(ff.get_export, gp.try_get.__self__)
+        self.assertTrue(put_ports[0].try_put(5))
+        self.assertEqual((True, 5), gp.try_get())
+        other = uvm_tlm_fifo("other", self.my_root)
+        put_ports[1].connect(put_ports[2])
+        self.assertNotIn("try_put", put_ports[0].__dict__)
+        put_ports[2].connect(other.put_export)
+        with self.assertRaises(UVMTLMConnectionError):
+            put_ports[2].resolve_bindings()
+
+    def test_resolve_bindings_errors(self):
+        pp1 = uvm_put_port("pp1", self.my_root)
+        pp2 = uvm_put_port("pp2", self.my_root)
+        pp1.connect(pp2)
+        with self.assertRaises(UVMTLMConnectionError):
+            pp1.resolve_bindings()
+        pp2.connect(pp1)
+        with self.assertRaises(UVMTLMConnectionError):
+            pp1.resolve_bindings()
+        unconnected = uvm_put_port("unconnected", self.my_root)
+        self.assertEqual({}, unconnected.resolve_bindings())
+
+    def test_uvm_tlm_priority_fifo(self):
+        ff = uvm_tlm_priority_fifo("ff", self.my_root, 5,
+                                   priority=lambda item: item[0])
+        pp = uvm_put_port("pp", self.my_root)
+        pp.connect(ff.put_export)
+        gp = uvm_get_peek_port("gp", self.my_root)
+        gp.connect(ff.get_peek_export)
+        for item in [(0, "bulk0"), (2, "urgent0"), (0, "bulk1"),
+                     (1, "high"), (2, "urgent1")]:
+            self.assertTrue(pp.try_put(item))
+        self.assertFalse(pp.try_put((3, "full")))
+        self.assertTrue(ff.is_full())
+        self.assertEqual((True, (2, "urgent0")), gp.try_peek())
+        got = [gp.try_get()[1][1] for _ in range(3)]
+        got += [item for _, item in ff.try_get_many()]
+        self.assertEqual(["urgent0", "urgent1", "high", "bulk0", "bulk1"],
+                         got)
+        self.assertEqual((False, None), gp.try_get())
+        self.assertIs(ff.queue, ff.get_peek_export.queue)
+
+    def test_uvm_tlm_fifo_queue_argument(self):
+        built = []
+
+        class eager_fifo(uvm_tlm_fifo):
+            def __init__(self, name, parent, size=1, queue=None):
+                super().__init__(name, parent, size, queue)
+                built.append(self.put_export.queue)
+
+        queue = UVMQueue(maxsize=3)
+        ff = eager_fifo("ff", self.my_root, 1, queue)
+        self.assertIs(queue, ff.queue)
+        self.assertIs(queue, built[0])
+        self.assertEqual(3, ff.size())
+
+        # eager_fifo builds put_export inside the priority FIFO's
+        # super().__init__()
+        class eager_priority_fifo(uvm_tlm_priority_fifo, eager_fifo):
+            ...
+
+        pf = eager_priority_fifo("pf", self.my_root, 2)
+        self.assertIs(pf.queue, built[1])
+
     async def test_uvm_tlm_fifo_used(self):
         """
         12.2.8.2.3
@@ -486,6 +752,158 @@ class s12_uvm_tlm_interfaces_TestCase(pyuvm_unittest.pyuvm_TestCase):
         __ = await gp.get()
         self.assertTrue(ff.is_empty())
 
+    class Request:
+        def __init__(self, transaction_id):
+            self.transaction_id = transaction_id
+
+    @staticmethod
+    async def respond_in_reverse(gp, pp, pairs):
+        # Echo each request back as its response, newest first
+        for _ in range(pairs):
+            reqs = [await gp.get(), await gp.get()]
+            for req in reversed(reqs):
+                await pp.put(req)
+
+    async def transport_and_log(self, tp, txn_id, done):
+        await tp.transport(self.Request(txn_id))
+        done.append(txn_id)
+
+    async def test_uvm_tlm_transport_channel_outstanding(self):
+        for ordered in (True, False):
+            self.my_root.clear_children()
+            ch = uvm_tlm_transport_channel("ch", self.my_root,
+                                           outstanding=True,
+                                           max_outstanding=2,
+                                           ordered=ordered)
+            tp = uvm_transport_port("tp", self.my_root)
+            tp.connect(ch.transport_export)
+            gp = uvm_get_port("gp", self.my_root)
+            gp.connect(ch.get_peek_request_export)
+            pp = uvm_put_port("pp", self.my_root)
+            pp.connect(ch.put_response_export)
+            self.assertIs(ch.put_response_export, ch.slave_export.put_export)
+            rec = uvm_tlm_analysis_fifo("rec", self.my_root)
+            ch.response_ap.connect(rec.analysis_export)
+            cocotb.fork(self.respond_in_reverse(gp, pp, 2))
+            done = []
+            cocotb.fork(self.transport_and_log(tp, 1, done))
+            cocotb.fork(self.transport_and_log(tp, 2, done))
+            await waitabit()
+            self.assertEqual([1, 2] if ordered else [2, 1], done)
+            rsps = await tp.transport_many([self.Request(3),
+                                            self.Request(4)])
+            self.assertEqual([3, 4], [rsp.transaction_id for rsp in rsps])
+            self.assertEqual(0, ch.num_outstanding())
+            seen = []
+            while rec.can_get():
+                seen.append(rec.try_get()[1].transaction_id)
+            self.assertEqual([1, 2, 3, 4] if ordered else [2, 1, 4, 3], seen)
+            with self.assertLogs(ch.logger, "ERROR"):
+                self.assertFalse(pp.try_put(self.Request(5)))
+            with self.assertRaises(UVMError):
+                tp.nb_transport(self.Request(6))
+
+    async def test_uvm_tlm_b_sockets(self):
+        mem = uvm_tlm_memory("mem", self.my_root, 16, base_address=0x100)
+        ini = uvm_tlm_b_initiator_socket("ini", self.my_root)
+        ini.connect(mem.target_socket)
+        ini.resolve_bindings()
+        write = uvm_tlm_generic_payload(
+            "write", 0x104, uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND,
+            b"\x01\x02\x03\x04")
+        self.assertEqual(5, await ini.b_transport(write, 5))
+        self.assertTrue(write.is_response_ok())
+        read = uvm_tlm_generic_payload(
+            "read", 0x104, uvm_tlm_command_e.UVM_TLM_READ_COMMAND,
+            length=4)
+        read.byte_enable = b"\xff\x00"
+        await ini.b_transport(read)
+        self.assertEqual(b"\x01\x00\x03\x00", read.data)
+        self.assertTrue(read.dmi_allowed)
+        read.address = 0x10e
+        await ini.b_transport(read)
+        self.assertEqual("UVM_TLM_ADDRESS_ERROR_RESPONSE",
+                         read.get_response_string())
+
+    class NBInitiator(uvm_component):
+        def nb_transport_bw(self, t, phase, delay=0):
+            self.phase = phase
+            return uvm_tlm_sync_e.UVM_TLM_COMPLETED, phase, delay
+
+    class NBTarget(uvm_component):
+        def nb_transport_fw(self, t, phase, delay=0):
+            return (uvm_tlm_sync_e.UVM_TLM_UPDATED,
+                    uvm_tlm_phase_e.END_REQ, delay + 1)
+
+    def test_uvm_tlm_nb_sockets(self):
+        initiator = self.NBInitiator("initiator", self.my_root)
+        target = self.NBTarget("target", self.my_root)
+        isock = uvm_tlm_nb_initiator_socket("isock", initiator)
+        tsock = uvm_tlm_nb_target_socket("tsock", target)
+        t = uvm_tlm_generic_payload("t")
+        with self.assertRaises(UVMTLMConnectionError):
+            tsock.nb_transport_bw(t, uvm_tlm_phase_e.BEGIN_RESP)
+        isock.connect(tsock)
+        self.assertEqual((uvm_tlm_sync_e.UVM_TLM_UPDATED,
+                          uvm_tlm_phase_e.END_REQ, 3),
+                         isock.nb_transport_fw(t, uvm_tlm_phase_e.BEGIN_REQ,
+                                               2))
+        tsock.nb_transport_bw(t, uvm_tlm_phase_e.BEGIN_RESP)
+        self.assertEqual(uvm_tlm_phase_e.BEGIN_RESP, initiator.phase)
+        self.assertIsNone(isock.get_direct_mem_ptr(t))
+        bsock = uvm_tlm_b_initiator_socket("bsock", self.my_root)
+        with self.assertRaises(UVMTLMConnectionError):
+            bsock.connect(tsock)
+        other = uvm_tlm_nb_initiator_socket("other", initiator)
+        with self.assertRaises(UVMTLMConnectionError):
+            other.connect(tsock)
+        with self.assertRaises(UVMTLMConnectionError):
+            uvm_tlm_b_target_socket("bad", target)
+
+    def test_uvm_tlm_dmi(self):
+        mem = uvm_tlm_memory("mem", self.my_root, 64, base_address=0x1000)
+        ini = uvm_tlm_b_initiator_socket("ini", self.my_root)
+        ini.connect(mem.target_socket)
+        dmi = ini.get_direct_mem_ptr(uvm_tlm_generic_payload("t", 0x1000))
+        self.assertEqual(0x103f, dmi.end_address)
+        dmi.write(0x1010, b"firmware")
+        self.assertEqual(b"firmware", mem.storage[0x10:0x18])
+        self.assertEqual(b"firmware", dmi.read(0x1010, 8))
+        with self.assertRaises(UVMError):
+            dmi.read(0x103e, 4)
+        read_only = uvm_tlm_dmi(mem.storage, 0x1000, write_allowed=False)
+        self.assertFalse(read_only.is_write_allowed())
+        with self.assertRaises(UVMError):
+            read_only.write(0x1000, b"x")
+        read = uvm_tlm_generic_payload(
+            "read", 0x1008, uvm_tlm_command_e.UVM_TLM_READ_COMMAND)
+        self.assertFalse(ini.get_direct_mem_ptr(read).is_write_allowed())
+        self.assertTrue(read.dmi_allowed)
+        mem.dmi_allowed = False
+        self.assertIsNone(ini.get_direct_mem_ptr(uvm_tlm_generic_payload()))
+
+    def test_uvm_tlm_dmi_out_of_range(self):
+        mem = uvm_tlm_memory("mem", self.my_root, 8)
+        ini = uvm_tlm_b_initiator_socket("ini", self.my_root)
+        ini.connect(mem.target_socket)
+        for address in (0x9999, 8, -1):
+            t = uvm_tlm_generic_payload("t", address)
+            t.dmi_allowed = True
+            self.assertIsNone(ini.get_direct_mem_ptr(t))
+            self.assertFalse(t.dmi_allowed)
+        t = uvm_tlm_generic_payload("t", 7)
+        self.assertIsNotNone(ini.get_direct_mem_ptr(t))
+        self.assertTrue(t.dmi_allowed)
+
+    def test_uvm_tlm_generic_payload_string(self):
+        t = uvm_tlm_generic_payload(
+            "t", 0x10, uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND, b"ab")
+        text = t.convert2string()
+        self.assertIn("command: UVM_TLM_WRITE_COMMAND", text)
+        self.assertIn("response_status: UVM_TLM_INCOMPLETE_RESPONSE", text)
+        t.command = 0
+        self.assertIn("command: 0", str(t))
+
     def make_fifo(self, fifo_type) -> uvm_tlm_fifo_base:
         self.my_root.clear_children()
         fifo = fifo_type("fifo", self.my_root)
@@ -241,6 +241,14 @@ class s13_predefined_component_TestCase(pyuvm_unittest.pyuvm_TestCase):
         datum = cc.cdb_get("FF", "")
         self.assertEqual(44, datum)
 
+    def test_config_db_default(self):
+        aa = uvm_component('aa', None)
+        bb = uvm_component('bb', aa)
+        aa.cdb_set("FIVE", 5, "")
+        self.assertEqual(5, aa.cdb_get("FIVE", "", default=0))
+        self.assertEqual(0, bb.cdb_get("FIVE", "", default=0))
+        self.assertIsNone(bb.cdb_get("FIVE", default=None))
+
     def test_wildcard_precedence(self):
         aa = uvm_component('aa', None)
         bb = uvm_component('bb', aa)
@@ -25,6 +25,15 @@ class SeqItem(uvm_sequence_item):
         return f"id: {id(self)} data: {self.data}   result: {self.result}"
 
 
+class CompactSeqItem(uvm_compact_sequence_item):
+    op = uvm_field()
+    result = uvm_field()
+    data = uvm_field(0)
+
+    def __init__(self, name):
+        super().__init__(name)
+
+
 class ItemDoneRespSeqDriver(uvm_driver):
     async def run_phase(self):
         while True:
@@ -136,6 +145,16 @@ class py1415_sequence_TestCase(pyuvm_unittest.pyuvm_TestCase):
             print("ERROR: ", ae)
             raise
 
+    async def test_ResponseQueue_duplicate_ids(self):
+        rq = ResponseQueue()
+        rq.put_nowait(self.ItemClass(txn_id=7))
+        rq.put_nowait(self.ItemClass(txn_id=7))
+        with self.assertRaises(AssertionError):
+            await rq.get_response(7)
+        self.assertEqual(2, rq.qsize())
+        self.assertEqual(7, rq.get_nowait().transaction_id)
+        self.assertEqual(7, (await rq.get_response(7)).transaction_id)
+
     async def test_uvm_item_export_check(self):
         sip = uvm_seq_item_port("sip", self.my_root)
         bpe = uvm_blocking_put_export("bpe", self.my_root)
@@ -213,6 +232,55 @@ class py1415_sequence_TestCase(pyuvm_unittest.pyuvm_TestCase):
         await uvm_root().run_test("SeqTest")
         self.assertTrue(DataHolder().datum)
 
+    async def test_run_compact_sequence(self):
+        ObjectionHandler().run_phase_done_flag = None
+
+        class CompactSeq(uvm_sequence):
+            async def body(self):
+                op = CompactSeqItem("op")
+                await self.start_item(op)
+                op.data = 4
+                await self.finish_item(op)
+                DataHolder().datum = (op.result == (op.data + 1))
+
+        class CompactSeqTest(uvm_test):
+            def build_phase(self):
+                self.seqr = uvm_sequencer("seqr", self)
+                self.driver = HandleRespSeqDriver("driver", self)
+
+            def connect_phase(self):
+                self.driver.seq_item_port.connect(self.seqr.seq_item_export)
+
+            async def run_phase(self):
+                self.raise_objection()
+                seq = CompactSeq("seq")
+                await seq.start(self.seqr)
+                self.drop_objection()
+
+        await uvm_root().run_test("CompactSeqTest")
+        self.assertTrue(DataHolder().datum)
+
+    def test_sequence_ids(self):
+        first = uvm_sequence("first")
+        second = uvm_sequence("second")
+        self.assertEqual(first.sequence_id + 1, second.sequence_id)
+        seqr = uvm_sequencer("seqr", self.my_root)
+        self.assertEqual(1, seqr.id_allocator.next_id())
+        uvm_root.clear_singletons()
+        self.assertEqual(1, uvm_sequence("third").sequence_id)
+
+    def test_compact_sequence_item(self):
+        item = CompactSeqItem("item")
+        self.assertFalse(hasattr(item, "__dict__"))
+        self.assertIsNone(item._start_condition)
+        self.assertIs(item.start_condition, item.start_condition)
+        with self.assertRaises(AttributeError):
+            item.undeclared = 1
+        self.assertNotIsInstance(item, uvm_sequence_item)
+        plain = uvm_sequence_item("plain")
+        plain.foo = 1
+        self.assertEqual(1, plain.foo)
+
     async def test_put_response(self):
         ObjectionHandler().run_phase_done_flag = None
 
@@ -1,6 +1,7 @@
 import pytest
 from pyuvm import *
 import copy
+from array import array
 
 pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
 
@@ -10,6 +11,10 @@ class my_object(uvm_object):
         super().__init__(name)
         self.val = 5
 
+    def do_reset(self):
+        super().do_reset()
+        self.val = 5
+
     def __eq__(self, other):
         if type(other) is type(self):
             return self.val == other.val
@@ -180,17 +185,17 @@ def test_unpacking():
     mo = my_object("mo")
     # 5.3.10.1
     with pytest.raises(error_classes.UsePythonMethod):
-        mo.unpack()
+        mo.unpack(0)
     with pytest.raises(error_classes.UsePythonMethod):
-        mo.unpack_bytes()
+        mo.unpack_bytes(b"\x00")
     with pytest.raises(error_classes.UsePythonMethod):
-        mo.unpack_ints()
+        mo.unpack_ints(array("I", [0]))
     with pytest.raises(error_classes.UsePythonMethod):
-        mo.unpack_longints()
+        mo.unpack_longints(array("Q", [0]))
     # 5.3.11.2
 
     with pytest.raises(error_classes.UsePythonMethod):
-        mo.do_unpack()
+        mo.do_unpack(0)
 
 
 def test_configuration():
@@ -252,6 +257,20 @@ def test_uvm_transaction_creation():
     assert uc == tr.get_initiator()
 
 
+def test_transaction_ids():
+    first = uvm_transaction().get_transaction_id()
+    second = uvm_transaction()
+    assert second.get_transaction_id() == first + 1
+    second.transaction_id = None
+    assert second.get_transaction_id() == first + 2
+    ids = IdAllocator(10)
+    assert [ids.next_id(), ids.next_id()] == [10, 11]
+    ids.reset()
+    assert ids.next_id() == 1
+    uvm_root.clear_singletons()
+    assert uvm_transaction().get_transaction_id() == 1
+
+
 def test_transaction_recording():
     """
     5.4.2 all methods
@@ -280,3 +299,331 @@ def test_clone():
     clone = orig.clone()
     assert id(orig) != id(clone)
     assert orig.val == clone.val
+
+
+def test_pooled_create():
+    factory = uvm_factory()
+    factory.clear_pools()
+    mo = my_object.create("mo", pooled=True)
+    mo.val = 9
+    mo.release()
+    assert list(factory.pools[my_object].values()) == [mo]
+    reused = my_object.create("reused", pooled=True)
+    assert reused is mo
+    assert reused.get_name() == "reused"
+    assert reused.val == 5
+    assert my_object.create("fresh", pooled=True) is not mo
+    factory.set_pool_cap(my_object, 1)
+    reused.release()
+    my_object("extra").release()
+    assert len(factory.pools[my_object]) == 1
+    factory.clear_pools()
+    factory.pool_caps = {}
+
+
+class addressed_object(uvm_object):
+    def __init__(self, name, addr):
+        super().__init__(name)
+        self.addr = addr
+        self.resets = 0
+
+    def do_reset(self):
+        super().do_reset()
+        self.resets += 1
+
+
+def test_pool_release_checks():
+    factory = uvm_factory()
+    factory.clear_pools()
+    try:
+        ao = addressed_object("ao", 0x10)
+        ao.release()
+        assert ao.resets == 1 and ao.addr == 0x10
+        with pytest.raises(error_classes.UVMError):
+            ao.release()
+        assert list(factory.pools[addressed_object].values()) == [ao]
+        factory.set_pool_cap(addressed_object, 1)
+        extra = addressed_object("extra", 0x20)
+        extra.release()
+        assert extra.resets == 0
+        reused = factory.create_pooled_object_by_type(addressed_object)
+        assert reused is ao
+        reused.release()
+        assert list(factory.pools[addressed_object].values()) == [ao]
+    finally:
+        factory.clear_pools()
+        factory.pool_caps = {}
+
+
+class unresettable_object(uvm_sequence_item):
+    def __init__(self, name):
+        super().__init__(name)
+        self.data = []
+
+
+def test_pool_needs_do_reset():
+    factory = uvm_factory()
+    factory.clear_pools()
+    with pytest.raises(error_classes.UVMError):
+        unresettable_object.create("uo", pooled=True)
+    with pytest.raises(error_classes.UVMError):
+        unresettable_object("uo").release()
+    assert unresettable_object not in factory.pools
+
+
+class field_object(uvm_object):
+    A = uvm_field(0)
+    data = uvm_field(default_factory=list, deep=True)
+    note = uvm_field("", compare=False)
+
+
+class field_child(field_object):
+    B = uvm_field(1, printed=False)
+
+
+class hand_copy_child(field_object):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.extra = 0
+
+    def do_copy(self, rhs):
+        super().do_copy(rhs)
+        self.extra = rhs.extra
+
+
+def test_field_defaults():
+    fo = field_object("fo")
+    assert not hasattr(field_object, "A")
+    assert fo.A == 0
+    assert fo.data == []
+    assert fo.data is not field_object("other").data
+    assert [ff.name for ff in field_child._uvm_fields] == \
+        ["A", "data", "note", "B"]
+
+
+def test_field_copy_clone():
+    fc = field_child("fc")
+    fc.A = 5
+    fc.B = 7
+    fc.data.append(3)
+    fc.note = "hi"
+    cc = fc.clone()
+    assert type(cc) is field_child
+    assert cc.get_name() == "fc"
+    assert (cc.A, cc.B, cc.data, cc.note) == (5, 7, [3], "hi")
+    assert cc.data is not fc.data
+    other = field_child("other")
+    other.copy(fc)
+    assert other.get_name() == "fc"
+    assert other.B == 7
+    # ancestors' generated do_copy is folded into one method
+    assert field_child.do_copy.__uvm_base__ is None
+
+
+def test_field_compare():
+    f1 = field_child("f1")
+    f2 = field_child("f2")
+    f2.note = "ignored"
+    assert f1 == f2
+    assert f1.compare(f2)
+    assert hash(f1) == hash(field_child("f3"))
+    f2.B = 9
+    assert f1 != f2
+    assert not f1.compare(f2)
+    assert f1 != field_object("f1")
+    assert not f1.compare(my_object("mo"))
+
+
+def test_field_mutable_default():
+    with pytest.raises(error_classes.UVMError, match="default_factory"):
+        uvm_field([])
+    with pytest.raises(error_classes.UVMError, match="default_factory"):
+        uvm_field({})
+    with pytest.raises(error_classes.UVMError):
+        uvm_field(0, default_factory=int)
+
+
+def test_field_hash_skips_mutable():
+    assert [ff.name for ff in field_child._uvm_fields if ff.hash] == \
+        ["A", "B"]
+    assert not uvm_field(deep=True).hash
+    assert not uvm_field(0, deep=True).hash
+    assert not uvm_field(7, compare=False).hash
+    fc = field_child("fc")
+    fc.data.append(1)
+    assert hash(fc) == hash(field_child("other"))
+
+
+def test_field_convert2string():
+    fc = field_child("fc")
+    fc.A = 2
+    assert fc.convert2string() == "fc : A: 2 data: [] note: "
+    assert str(fc) == fc.convert2string()
+
+
+def test_field_user_methods_kept():
+    hc = hand_copy_child("hc")
+    hc.A = 4
+    hc.extra = 6
+    cc = hc.clone()
+    assert (cc.A, cc.extra) == (4, 6)
+    assert my_object("mo").clone().val == 5
+    assert str(my_object("mo")) == "Hello"
+
+
+class packed_object(uvm_object):
+    A = uvm_field(0, bits=8)
+    B = uvm_field(0, bits=16)
+    C = uvm_field(0, bits=8)
+
+
+class odd_packed_object(uvm_object):
+    A = uvm_field(0, bits=3)
+    B = uvm_field(0, bits=40)
+    name = uvm_field("")
+
+
+def test_pack_int():
+    po = packed_object("po")
+    po.A, po.B, po.C = 0x12, 0x3456, 0x178
+    assert po.pack() == 0x12345678
+    new = packed_object("new")
+    new.unpack(0x12345678)
+    assert (new.A, new.B, new.C) == (0x12, 0x3456, 0x78)
+    with pytest.raises(error_classes.UsePythonMethod):
+        my_object("mo").pack()
+
+
+def test_pack_bytes_endian():
+    little = uvm_endianness_e.UVM_LITTLE_ENDIAN
+    po = packed_object("po")
+    po.unpack(0x12345678)
+    assert po.pack_bytes() == bytes.fromhex("12345678")
+    assert po.pack_bytes(little) == bytes.fromhex("78563412")
+    fifo = uvm_endianness_e.UVM_LITTLE_FIFO
+    assert po.pack_bytes(fifo) == po.pack_bytes(little)
+    new = packed_object("new")
+    new.unpack_bytes(bytes.fromhex("78563412"), little)
+    assert new == po
+    oo = odd_packed_object("oo")
+    oo.A, oo.B = 5, (1 << 40) - 3
+    for endian in (None, little):
+        new = odd_packed_object("new")
+        new.unpack_bytes(oo.pack_bytes(endian), endian)
+        assert (new.A, new.B) == (oo.A, oo.B)
+    with pytest.raises(error_classes.UsePythonMethod):
+        my_object("mo").pack_bytes()
+
+
+def test_pack_default_bits():
+    class default_packed(uvm_object):
+        A = uvm_field(bits=8)
+        B = uvm_field(bits=5)
+
+    dp = default_packed("dp")
+    assert (dp.A, dp.B) == (0, 0)
+    assert dp.pack() == 0
+    assert dp.pack_bytes() == bytes(2)
+
+
+def test_unpack_bytes_length():
+    # packed_object unpacks through struct, odd_packed_object
+    # through an int. Both need the exact length.
+    for cls in (packed_object, odd_packed_object):
+        nbytes = len(cls("po").pack_bytes())
+        for length in (nbytes - 1, nbytes + 1):
+            with pytest.raises(error_classes.UVMError, match="unpacks"):
+                cls("new").unpack_bytes(bytes(length))
+    with pytest.raises(error_classes.UVMError):
+        packed_object.unpack_bytes_many(bytes(6))
+
+
+def test_pack_ints():
+    oo = odd_packed_object("oo")
+    oo.A, oo.B = 5, (1 << 40) - 3
+    words = oo.pack_ints()
+    assert list(words) == [(5 << 40 | (1 << 40) - 3) >> 32, 0xfffffffd]
+    little = oo.pack_ints(uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    assert list(little) == list(words)[::-1]
+    new = odd_packed_object("new")
+    new.unpack_ints(words)
+    assert (new.A, new.B) == (5, (1 << 40) - 3)
+    assert list(oo.pack_longints()) == [5 << 40 | (1 << 40) - 3]
+    new = odd_packed_object("new")
+    new.unpack_longints(oo.pack_longints())
+    assert new.B == oo.B
+
+
+def test_pack_bytes_many():
+    items = [packed_object(f"po{ii}") for ii in range(5)]
+    for ii, item in enumerate(items):
+        item.unpack(ii * 0x01010101)
+    data = packed_object.pack_bytes_many(items)
+    assert data == b"".join(item.pack_bytes() for item in items)
+    assert packed_object.unpack_bytes_many(data, "new") == items
+
+
+class compact_object(uvm_compact_object):
+    __slots__ = ("extra",)
+    A = uvm_field(0)
+    B = uvm_field(default_factory=list)
+
+
+class compact_transaction(uvm_compact_transaction):
+    A = uvm_field(3)
+
+
+def test_compact_object():
+    co = compact_object("co")
+    assert not hasattr(co, "__dict__")
+    assert uvm_factory().fd.classes["compact_object"] is compact_object
+    assert (co.A, co.B) == (0, [])
+    co.extra = 5
+    co.A = 2
+    with pytest.raises(AttributeError):
+        co.undeclared = 1
+    cc = co.clone()
+    assert cc.A == 2 and cc == co
+    assert str(cc) == "co : A: 2 B: []"
+
+
+def test_base_classes_take_attributes():
+    obj = uvm_object("obj")
+    obj.foo = 1
+    tr = uvm_transaction()
+    tr.foo = 2
+    assert (obj.foo, tr.foo) == (1, 2)
+    assert not isinstance(compact_object("co"), uvm_object)
+    assert not issubclass(compact_transaction, uvm_transaction)
+    assert issubclass(uvm_transaction, uvm_object)
+    assert "_uvm_object" not in uvm_factory().fd.classes
+
+
+def test_compact_transaction():
+    ct = compact_transaction.create("ct")
+    assert not hasattr(ct, "__dict__")
+    assert ct.A == 3
+    assert ct.get_transaction_id() == ct.transaction_id
+    ct.set_initiator("me")
+    assert ct.get_initiator() == "me"
+
+
+class pooled_compact_object(compact_object):
+    def do_reset(self):
+        super().do_reset()
+        self.extra = None
+
+
+def test_compact_pooled_create():
+    factory = uvm_factory()
+    factory.clear_pools()
+    try:
+        co = pooled_compact_object.create("co", pooled=True)
+        co.A = 7
+        co.extra = 1
+        co.release()
+        reused = pooled_compact_object.create("reused", pooled=True)
+        assert reused is co
+        assert (reused.A, reused.extra) == (0, None)
+    finally:
+        factory.clear_pools()
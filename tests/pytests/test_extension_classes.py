@@ -0,0 +1,157 @@
+import json
+import sys
+import types
+
+import pytest
+from pyuvm import UVMError, UVMTestIndex, uvm_factory
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+TEST_MODULE = """
+import pyuvm
+from pyuvm import uvm_test
+
+
+@pyuvm.test()
+class IndexedTest(uvm_test):
+    pass
+
+
+class NotATest(uvm_test):
+    pass
+"""
+
+
+@pytest.fixture()
+def test_dir(tmp_path):
+    (tmp_path / "indexed_tests.py").write_text(TEST_MODULE)
+    (tmp_path / "no_tests.py").write_text("x = 1\n")
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith("_uvm_test_index_"):
+            del sys.modules[name]
+
+
+def test_index_finds_decorated_classes(test_dir):
+    index = UVMTestIndex(str(test_dir))
+    assert list(index.index) == ["IndexedTest"]
+    assert index.find("IndexedTest") == str(test_dir / "indexed_tests.py")
+    assert index.find("NotATest") is None
+    assert "indexed_tests" not in sys.modules
+
+
+def test_index_resolves_decorator_imports(tmp_path):
+    (tmp_path / "other_tests.py").write_text("""
+import pyuvm as uvm
+import cocotb
+from pyuvm import test as pyuvm_test
+from unittest import mock
+from pytest import mark
+
+
+@uvm.test()
+class AliasTest:
+    pass
+
+
+@pyuvm_test()
+class FromImportTest:
+    pass
+
+
+@cocotb.test()
+class CocotbTest:
+    pass
+
+
+@mark.test
+class MarkedClass:
+    pass
+
+
+@mock.test
+class MockClass:
+    pass
+
+
+@test
+class UnimportedTest:
+    pass
+""")
+    (tmp_path / "star_tests.py").write_text("""
+from pyuvm import *
+
+
+@test()
+class StarTest(uvm_test):
+    pass
+""")
+    index = UVMTestIndex(str(tmp_path))
+    assert sorted(index.index) == ["AliasTest", "CocotbTest",
+                                   "FromImportTest", "StarTest"]
+
+
+def test_index_cache_file(test_dir):
+    cache_file = str(test_dir / "index.json")
+    UVMTestIndex(str(test_dir), cache_file=cache_file).refresh()
+    with open(cache_file) as cache:
+        files = json.load(cache)
+    assert files[str(test_dir / "indexed_tests.py")][1] == ["IndexedTest"]
+    index = UVMTestIndex(str(test_dir), cache_file=cache_file)
+    assert index.find("IndexedTest") is not None
+
+
+def test_import_test_on_demand(test_dir):
+    index = UVMTestIndex(str(test_dir))
+    test_cls = index.import_test("IndexedTest")
+    assert test_cls.__name__ == "IndexedTest"
+    module = sys.modules[test_cls.__module__]
+    assert module.__file__ == str(test_dir / "indexed_tests.py")
+    # the decorator found its module without inspecting the stack
+    assert any(name.startswith("test_") for name in vars(module))
+    assert index.import_test("IndexedTest") is test_cls
+    assert index.import_test("Missing") is None
+
+
+def test_import_test_name_clash(test_dir, monkeypatch):
+    # An unrelated module already has the file's base name
+    monkeypatch.setitem(sys.modules, "indexed_tests", types.ModuleType("x"))
+    test_cls = UVMTestIndex(str(test_dir)).import_test("IndexedTest")
+    assert test_cls.__name__ == "IndexedTest"
+    assert sys.modules["indexed_tests"] is not sys.modules[
+        test_cls.__module__]
+
+
+def test_import_test_in_package(tmp_path, monkeypatch):
+    package = tmp_path / "indexed_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("BASE = 'base'\n")
+    (package / "test.py").write_text(
+        "from .helpers import BASE\n" + TEST_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        test_cls = UVMTestIndex(str(package)).import_test("IndexedTest")
+        assert test_cls.__module__ == "indexed_pkg.test"
+    finally:
+        for name in ["indexed_pkg", "indexed_pkg.helpers", "indexed_pkg.test"]:
+            sys.modules.pop(name, None)
+
+
+def test_import_test_not_defined(test_dir):
+    index = UVMTestIndex(str(test_dir))
+    index.refresh()
+    (test_dir / "indexed_tests.py").write_text("x = 1\n")
+    with pytest.raises(UVMError):
+        index.import_test("IndexedTest")
+
+
+def test_factory_uses_index(test_dir):
+    factory = uvm_factory()
+    factory.test_index = UVMTestIndex(str(test_dir))
+    try:
+        test = factory.create_component_by_name("IndexedTest", "", "test",
+                                                None)
+        assert type(test).__name__ == "IndexedTest"
+    finally:
+        factory.test_index = None